@@ -35,6 +35,21 @@ const nextConfig: NextConfig = {
           { key: "Cache-Control", value: "public, max-age=31536000, immutable" },
         ],
       },
+      {
+        // Content-hashed outputs of scripts/publish_token_data.py
+        source: "/token-data/:path*",
+        headers: [{ key: "Cache-Control", value: "public, max-age=31536000, immutable" }],
+      },
+      {
+        // The manifest is the only unhashed file and must be revalidated
+        source: "/token-data/manifest.json",
+        headers: [{ key: "Cache-Control", value: "public, max-age=60, must-revalidate" }],
+      },
+      {
+        // Content-addressed icons written by scripts/mirror_icons.py
+        source: "/token-icons/:path*",
+        headers: [{ key: "Cache-Control", value: "public, max-age=31536000, immutable" }],
+      },
     ];
   },
 
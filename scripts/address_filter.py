@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Per-chain Bloom filter of known token addresses.
+
+Callers like getMetadata in AssetIcon.tsx and /api/token-metadata only need to
+know whether an address is in the curated set before doing more work. The
+filter answers that in a few KB instead of loading address_to_metadata.json:
+"no" is always right, "yes" is wrong with probability ~fp-rate.
+
+Binary layout (little endian):
+
+  magic     4 bytes  b"RBLM"
+  version   u8       1
+  hash      u8       1 = FNV-1a 32 double hashing (below)
+  k         u8       number of probes
+  reserved  u8       0
+  chain_id  u32
+  count     u32      addresses inserted
+  m         u32      filter size in bits (multiple of 8)
+  bits      m / 8 bytes; bit i is (bits[i >> 3] >> (i & 7)) & 1
+
+Hashing works on the 20 raw address bytes, using only 32-bit operations so a
+JS reader needs nothing beyond Math.imul:
+
+  h1 = fnv1a32(bytes)
+  h2 = fnv1a32(reversed bytes) | 1
+  probe i (0 <= i < k) = ((h1 + i * h2) mod 2^32) mod m
+
+scripts/data/address_filter_vectors.json holds fixed members, non-members and
+their h1/h2/probes so other-language readers can be checked against this one;
+--verify-js runs the reference JS reader in this file under node against it.
+
+Usage:
+  python scripts/address_filter.py build [--chain 1] [--fp-rate 0.01]
+  python scripts/address_filter.py check src/utils/tokenData/1/address_filter.bin 0x...
+  python scripts/address_filter.py vectors [--verify-js]
+"""
+
+import argparse
+import json
+import math
+import struct
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from atomic_json import write_bytes_atomic, write_json_atomic
+from evm_address import keccak256
+from token_data_common import CHAIN_IDS, DATA_DIR, TOKEN_DATA_DIR, load_json
+
+VECTORS_PATH = DATA_DIR / "address_filter_vectors.json"
+
+MAGIC = b"RBLM"
+FORMAT_VERSION = 1
+HASH_FNV1A32_DOUBLE = 1
+_HEADER = struct.Struct("<4sBBBBIII")
+
+_FNV_OFFSET = 0x811C9DC5
+_FNV_PRIME = 0x01000193
+_U32 = 0xFFFFFFFF
+
+# Reference reader; kept in sync with the layout above and exercised by --verify-js
+_JS_READER = r"""
+function fnv1a32(bytes) {
+  let h = 0x811c9dc5;
+  for (const b of bytes) h = Math.imul(h ^ b, 0x01000193) >>> 0;
+  return h;
+}
+function parseFilter(buf) {
+  const view = new DataView(buf.buffer, buf.byteOffset, buf.byteLength);
+  if (String.fromCharCode(...buf.subarray(0, 4)) !== "RBLM") throw new Error("bad magic");
+  return { k: buf[6], chainId: view.getUint32(8, true), count: view.getUint32(12, true),
+           m: view.getUint32(16, true), bits: buf.subarray(20) };
+}
+function addressBytes(address) {
+  const hex = address.toLowerCase().replace(/^0x/, "");
+  return Uint8Array.from(hex.match(/../g), (b) => parseInt(b, 16));
+}
+function probes(filter, address) {
+  const bytes = addressBytes(address);
+  const h1 = fnv1a32(bytes);
+  const h2 = (fnv1a32(bytes.slice().reverse()) | 1) >>> 0;
+  const out = [];
+  for (let i = 0; i < filter.k; i++) out.push(((h1 + Math.imul(i, h2)) >>> 0) % filter.m);
+  return { h1, h2, out };
+}
+function mightContain(filter, address) {
+  return probes(filter, address).out.every((i) => (filter.bits[i >> 3] >> (i & 7)) & 1);
+}
+"""
+
+
+def _fnv1a32(data: bytes) -> int:
+    h = _FNV_OFFSET
+    for b in data:
+        h = ((h ^ b) * _FNV_PRIME) & _U32
+    return h
+
+
+def _address_bytes(address: str) -> bytes:
+    raw = bytes.fromhex(address[2:] if address.startswith(("0x", "0X")) else address)
+    if len(raw) != 20:
+        raise ValueError(f"not a 20-byte address: {address!r}")
+    return raw
+
+
+def _hashes(raw: bytes) -> Tuple[int, int]:
+    return _fnv1a32(raw), _fnv1a32(raw[::-1]) | 1
+
+
+def _probes(h1: int, h2: int, k: int, m: int) -> List[int]:
+    return [((h1 + i * h2) & _U32) % m for i in range(k)]
+
+
+def filter_params(count: int, fp_rate: float) -> Tuple[int, int]:
+    """(m bits, k probes) minimizing size for count items at fp_rate."""
+    if not 0 < fp_rate < 1:
+        raise ValueError(f"fp rate must be in (0, 1), got {fp_rate}")
+    n = max(count, 1)
+    m = math.ceil(-n * math.log(fp_rate) / (math.log(2) ** 2))
+    m = max(64, (m + 7) // 8 * 8)
+    k = max(1, min(255, round(m / n * math.log(2))))
+    return m, k
+
+
+class AddressFilter:
+    def __init__(self, chain_id: int, m: int, k: int, bits: bytearray, count: int = 0):
+        if m % 8 or len(bits) != m // 8:
+            raise ValueError("filter size must be a whole number of bytes")
+        self.chain_id = chain_id
+        self.m = m
+        self.k = k
+        self.bits = bits
+        self.count = count
+
+    @classmethod
+    def build(cls, chain_id: int, addresses: Iterable[str], fp_rate: float = 0.01) -> "AddressFilter":
+        raws = sorted({_address_bytes(a) for a in addresses})
+        m, k = filter_params(len(raws), fp_rate)
+        flt = cls(chain_id, m, k, bytearray(m // 8))
+        for raw in raws:
+            flt._add(raw)
+        return flt
+
+    def _add(self, raw: bytes) -> None:
+        for i in _probes(*_hashes(raw), self.k, self.m):
+            self.bits[i >> 3] |= 1 << (i & 7)
+        self.count += 1
+
+    def __contains__(self, address: str) -> bool:
+        try:
+            raw = _address_bytes(address)
+        except ValueError:
+            return False
+        return all(self.bits[i >> 3] >> (i & 7) & 1 for i in _probes(*_hashes(raw), self.k, self.m))
+
+    def expected_fp_rate(self) -> float:
+        return (1 - math.exp(-self.k * self.count / self.m)) ** self.k
+
+    def to_bytes(self) -> bytes:
+        header = _HEADER.pack(MAGIC, FORMAT_VERSION, HASH_FNV1A32_DOUBLE, self.k, 0, self.chain_id, self.count, self.m)
+        return header + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "AddressFilter":
+        if len(data) < _HEADER.size:
+            raise ValueError("truncated filter header")
+        magic, version, hash_id, k, _, chain_id, count, m = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("not an address filter (bad magic)")
+        if version != FORMAT_VERSION or hash_id != HASH_FNV1A32_DOUBLE:
+            raise ValueError(f"unsupported filter version {version} / hash {hash_id}")
+        bits = bytearray(data[_HEADER.size:])
+        if len(bits) != m // 8:
+            raise ValueError("filter length does not match header")
+        return cls(chain_id, m, k, bits, count)
+
+
+def _vector_address(label: str) -> str:
+    return "0x" + keccak256(label.encode("ascii"))[12:].hex()
+
+
+def build_vectors(fp_rate: float = 0.01, members: int = 64, non_members: int = 64) -> dict:
+    """Deterministic filter plus per-address hashes for cross-language checks."""
+    member_addrs = [_vector_address(f"member-{i}") for i in range(members)]
+    probe_addrs = [_vector_address(f"non-member-{i}") for i in range(non_members)]
+    # Edge cases: all-zero and all-ff addresses, mixed case input
+    probe_addrs += ["0x" + "00" * 20, "0x" + "ff" * 20]
+    flt = AddressFilter.build(1, member_addrs, fp_rate)
+
+    cases = []
+    for address in member_addrs[:8] + [a.upper().replace("0X", "0x") for a in member_addrs[8:10]] + probe_addrs:
+        h1, h2 = _hashes(_address_bytes(address))
+        cases.append({
+            "address": address,
+            "member": address.lower() in member_addrs,
+            "h1": h1,
+            "h2": h2,
+            "probes": _probes(h1, h2, flt.k, flt.m),
+            "mightContain": address in flt,
+        })
+    return {
+        "fpRate": fp_rate,
+        "members": member_addrs,
+        "filterHex": flt.to_bytes().hex(),
+        "cases": cases,
+    }
+
+
+def check_vectors(vectors: dict) -> List[str]:
+    flt = AddressFilter.from_bytes(bytes.fromhex(vectors["filterHex"]))
+    errors = []
+    rebuilt = AddressFilter.build(flt.chain_id, vectors["members"], vectors["fpRate"])
+    if rebuilt.to_bytes() != flt.to_bytes():
+        errors.append("filter built from members does not match filterHex")
+    for case in vectors["cases"]:
+        h1, h2 = _hashes(_address_bytes(case["address"]))
+        got = {"h1": h1, "h2": h2, "probes": _probes(h1, h2, flt.k, flt.m), "mightContain": case["address"] in flt}
+        for key, value in got.items():
+            if case[key] != value:
+                errors.append(f"{case['address']}: {key} {value!r} != {case[key]!r}")
+        if case["member"] and not case["mightContain"]:
+            errors.append(f"{case['address']}: false negative")
+    return errors
+
+
+def verify_js(vectors_path: Path) -> List[str]:
+    """Run _JS_READER under node against the vectors file; return mismatches."""
+    script = _JS_READER + r"""
+const fs = require("fs");
+const v = JSON.parse(fs.readFileSync(process.argv[1], "utf8"));
+const filter = parseFilter(Uint8Array.from(v.filterHex.match(/../g), (b) => parseInt(b, 16)));
+const errors = [];
+for (const c of v.cases) {
+  const p = probes(filter, c.address);
+  const got = { h1: p.h1, h2: p.h2, probes: p.out, mightContain: mightContain(filter, c.address) };
+  for (const key of Object.keys(got)) {
+    if (JSON.stringify(got[key]) !== JSON.stringify(c[key])) errors.push(`${c.address}: ${key}`);
+  }
+}
+console.log(JSON.stringify(errors));
+"""
+    result = subprocess.run(
+        ["node", "-e", script, str(vectors_path)], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Build and query per-chain Bloom filters of known token addresses.")
+    sub = p.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Write <chain>/address_filter.bin next to the metadata JSON.")
+    build.add_argument("--chain", type=int, action="append", help="Chain ID (repeatable). Defaults to all chains.")
+    build.add_argument("--out-root", type=Path, default=TOKEN_DATA_DIR, help="tokenData root containing <chain>/ dirs.")
+    build.add_argument("--fp-rate", type=float, default=0.01, help="Target false-positive rate.")
+    check = sub.add_parser("check", help="Test addresses against a filter file.")
+    check.add_argument("path", type=Path)
+    check.add_argument("addresses", nargs="+")
+    vec = sub.add_parser("vectors", help="Regenerate and check the cross-language test vectors.")
+    vec.add_argument("--out", type=Path, default=VECTORS_PATH)
+    vec.add_argument("--verify-js", action="store_true", help="Also check the reference JS reader under node.")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.command == "check":
+        flt = AddressFilter.from_bytes(args.path.read_bytes())
+        for address in args.addresses:
+            print(f"{address}: {'maybe' if address in flt else 'no'}")
+        return
+
+    if args.command == "vectors":
+        vectors = build_vectors()
+        errors = check_vectors(vectors)
+        if not errors:
+            write_json_atomic(args.out, vectors, indent=2)
+            if args.verify_js:
+                errors = verify_js(args.out)
+        for err in errors:
+            print(f"Mismatch: {err}", file=sys.stderr)
+        if errors:
+            sys.exit(1)
+        print(f"{len(vectors['cases'])} vectors OK. Output: {args.out}")
+        return
+
+    for chain_id in args.chain or CHAIN_IDS:
+        chain_dir = args.out_root / str(chain_id)
+        metadata: Dict[str, dict] = load_json(chain_dir / "address_to_metadata.json")
+        if not metadata:
+            print(f"Warning: no metadata for chain {chain_id} in {chain_dir}", file=sys.stderr)
+            continue
+        flt = AddressFilter.build(chain_id, metadata.keys(), args.fp_rate)
+        missing = [a for a in metadata if a not in flt]
+        if missing:
+            print(f"Error: chain {chain_id} filter misses {len(missing)} addresses", file=sys.stderr)
+            sys.exit(1)
+        out_path = chain_dir / "address_filter.bin"
+        write_bytes_atomic(out_path, flt.to_bytes())
+        print(f"Chain {chain_id}: {flt.count} addresses, {flt.m // 8} bytes, k={flt.k}, "
+              f"expected fp {flt.expected_fp_rate():.4f}. Output: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Shared JSON writer for the token data files under src/utils/tokenData.
+
+Writes go to a temp file in the destination directory, are fsynced and then
+renamed over the target, so a crash mid-write never leaves a truncated file
+behind for the frontend to import. If the file already holds the same content
+(compared by a hash of the canonical encoding) nothing is written and the
+mtime is left untouched, which keeps the Next.js build cache warm on no-op
+refreshes.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Union
+
+PathLike = Union[str, Path]
+
+
+def canonical_hash(data: Any) -> str:
+    """sha256 of the key-sorted, whitespace-free JSON encoding of data."""
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _existing_hash(path: Path) -> Optional[str]:
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return canonical_hash(json.load(f))
+    except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+
+def _fsync_dir(directory: Path) -> None:
+    # Persist the rename itself; not supported on every platform.
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_json_atomic(path: PathLike, data: Any, indent: Optional[int] = 2, sort_keys: bool = False) -> bool:
+    """
+    Atomically replace path with the JSON encoding of data.
+
+    indent=None writes compact output. Returns True if the file was written,
+    False if its canonical content was already identical.
+    """
+    path = Path(path)
+    if _existing_hash(path) == canonical_hash(data):
+        return False
+
+    if indent is None:
+        encoded = json.dumps(data, sort_keys=sort_keys, separators=(",", ":"))
+    else:
+        encoded = json.dumps(data, sort_keys=sort_keys, indent=indent)
+    _replace_atomic(path, encoded.encode("utf-8"))
+    return True
+
+
+def write_bytes_atomic(path: PathLike, payload: bytes) -> bool:
+    """
+    Atomically replace path with payload (for non-JSON artifacts).
+
+    Returns True if the file was written, False if it already held payload.
+    """
+    path = Path(path)
+    try:
+        if path.read_bytes() == payload:
+            return False
+    except FileNotFoundError:
+        pass
+    _replace_atomic(path, payload)
+    return True
+
+
+def _replace_atomic(path: Path, payload: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+    _fsync_dir(path.parent)
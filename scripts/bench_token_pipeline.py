@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Benchmark the token pipeline's hot paths on synthetic corpora.
+
+Each case is run on generated corpora of --sizes tokens (default 10k, 100k
+and 1M). Addresses, names and tickers are random but seeded, with repeated
+tickers/names and mixed-case addresses like the real data. Cases:
+
+  load_addresses_from_file      get_token_data, comma/newline address file
+  try_decode_string_return      get_token_data, one eth_call result per token
+                                (ABI strings, bytes32, length-prefixed)
+  build_outputs                 get_token_data, metadata + lookup maps
+  append_tokens_to_metadata     top_pools_to_metadata, half the tokens exist
+  _update_address_metadata      trust_tokens, half the tokens exist
+  convert_address_to_metadata   convert_addresses_to_lowercase
+  convert_names_to_address      convert_addresses_to_lowercase
+  convert_tickers_to_address    convert_addresses_to_lowercase
+  write_json_pretty             get_token_data.write_json(pretty=True)
+  write_json_compact            get_token_data.write_json(pretty=False)
+
+Input files are rebuilt before every run and corpus generation is not
+measured. Time is the best of at least --repeat runs under perf_counter.
+Fast cases keep running until --min-time seconds have been timed (up to
+MAX_RUNS), so millisecond cases are not judged on a handful of samples.
+Peak memory comes from one extra run under tracemalloc (Python allocations
+made by the case itself, not the corpus it is handed). That run is several times slower
+than the timed ones, so a full run of all three sizes takes a while;
+--skip-memory leaves it out.
+
+Results can be saved as a baseline JSON:
+
+  {"version": 1, "python": "3.11.7",
+   "results": {case: {size: {"seconds": s, "peak_bytes": n}}}}
+
+--compare checks the results against the baseline and exits 1 if any
+case/size present in both is slower than the baseline by more than
+--threshold (default 25%) and by more than --noise-floor seconds, or uses
+more than --mem-threshold extra peak memory. Cases that look slower are
+re-timed up to --confirm times first and keep their best time. Timings are
+machine-specific, so the baseline is not checked in
+(scripts/data/bench_baseline.json is gitignored). `just bench-compare
+[base] [args]` records one on the spot instead: it checks out base
+(default main) in a temporary git worktree, runs --save-baseline there
+and then --compare on the working tree, on the same machine.
+
+Usage:
+  python scripts/bench_token_pipeline.py [--sizes 10000,100000] [--case build_outputs]
+  python scripts/bench_token_pipeline.py --save-baseline
+  python scripts/bench_token_pipeline.py --compare [--threshold 0.25] [--noise-floor 0.005]
+  just bench-compare origin/main --sizes 10000,100000
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import platform
+import random
+import shutil
+import string
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import convert_addresses_to_lowercase
+from atomic_json import write_json_atomic
+from get_token_data import build_outputs, load_addresses_from_file, try_decode_string_return, write_json
+from token_data_common import DATA_DIR
+from top_pools_to_metadata import append_tokens_to_metadata
+from trust_tokens import _update_address_metadata
+
+DEFAULT_BASELINE = DATA_DIR / "bench_baseline.json"
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+BASELINE_VERSION = 1
+MAX_RUNS = 50  # cap on timed runs per case when --min-time asks for more
+
+
+class Corpus:
+    """Seeded synthetic token data of a given size."""
+
+    def __init__(self, size: int, seed: int = 1):
+        rng = random.Random(seed)
+        words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(max(size // 20, 50))]
+        # Few tickers are unique: ~size/4 distinct tickers, ~size/2 distinct names
+        tickers = ["".join(rng.choices(string.ascii_uppercase, k=rng.randint(2, 6))) for _ in range(max(size // 4, 10))]
+
+        self.size = size
+        self.addresses = [f"0x{rng.getrandbits(160):040x}" for _ in range(size)]
+        self.mixed_addresses = [
+            a if i % 3 else "0x" + "".join(c.upper() if rng.random() < 0.5 else c for c in a[2:])
+            for i, a in enumerate(self.addresses)
+        ]
+        self.names = [
+            " ".join(rng.choice(words).capitalize() for _ in range(rng.randint(1, 3))) for _ in range(size)
+        ]
+        self.tickers = [rng.choice(tickers) for _ in range(size)]
+        self.decimals = [rng.choice((6, 8, 18, 18, 18)) for _ in range(size)]
+        self.call_results = [self._encode(name, i) for i, name in enumerate(self.names)]
+
+    @staticmethod
+    def _encode(value: str, i: int) -> str:
+        raw = value.encode("utf-8")
+        kind = i % 10
+        if kind < 7:  # ABI dynamic string
+            padded = raw.ljust((len(raw) + 31) // 32 * 32, b"\x00")
+            return "0x" + (32).to_bytes(32, "big").hex() + len(raw).to_bytes(32, "big").hex() + padded.hex()
+        if kind < 9:  # bytes32 (MKR-style)
+            return "0x" + raw[:32].ljust(32, b"\x00").hex()
+        return "0x" + len(raw).to_bytes(32, "big").hex() + raw.ljust(32, b"\x00").hex()
+
+    def metadata(self, mixed_case: bool = False) -> Dict[str, dict]:
+        keys = self.mixed_addresses if mixed_case else self.addresses
+        return {
+            addr: {"name": name, "ticker": ticker, "icon": None, "decimals": dec}
+            for addr, name, ticker, dec in zip(keys, self.names, self.tickers, self.decimals)
+        }
+
+    def lookup_map(self, values: List[str]) -> Dict[str, str]:
+        return dict(zip(values, self.mixed_addresses))
+
+    def trust_tokens(self) -> List[dict]:
+        return [
+            {"address": addr, "name": name, "symbol": ticker, "decimals": dec, "logoURI": f"https://x/{i}.png"}
+            for i, (addr, name, ticker, dec) in enumerate(
+                zip(self.mixed_addresses, self.names, self.tickers, self.decimals)
+            )
+        ]
+
+
+def _write_address_file(path: Path, addresses: List[str]) -> None:
+    # Rows of 20 comma-separated addresses, some duplicates, as in eth_tokens.txt
+    rows = [", ".join(addresses[i:i + 20]) for i in range(0, len(addresses), 20)]
+    path.write_text(",\n".join(rows + rows[: len(rows) // 10]) + "\n", encoding="utf-8")
+
+
+def _quiet(fn: Callable, *args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args)
+
+
+# Each case: (corpus, workdir) -> zero-argument callable. Setup outside the callable is not measured.
+def _case_load_addresses(c: Corpus, d: Path) -> Callable:
+    path = d / "addresses.txt"
+    _write_address_file(path, c.addresses)
+    return lambda: load_addresses_from_file(str(path))
+
+
+def _case_decode(c: Corpus, d: Path) -> Callable:
+    results = c.call_results
+    return lambda: [try_decode_string_return(r) for r in results]
+
+
+def _case_build_outputs(c: Corpus, d: Path) -> Callable:
+    meta = {addr: {"name": n, "ticker": t} for addr, n, t in zip(c.addresses, c.names, c.tickers)}
+    return lambda: build_outputs(1, meta)
+
+
+def _case_append_tokens(c: Corpus, d: Path) -> Callable:
+    path = d / "address_to_metadata.json"
+    metadata = c.metadata()
+    # Existing half without decimals, so the append path also fills them in
+    existing = {
+        addr: {k: v for k, v in meta.items() if k != "decimals"} for addr, meta in list(metadata.items())[: c.size // 2]
+    }
+    write_json_atomic(path, existing, indent=2, sort_keys=True)
+    return lambda: append_tokens_to_metadata(metadata, path)
+
+
+def _case_update_address_metadata(c: Corpus, d: Path) -> Callable:
+    path = d / "address_to_metadata.json"
+    write_json_atomic(path, dict(list(c.metadata().items())[: c.size // 2]), indent=2, sort_keys=True)
+    tokens = c.trust_tokens()
+    return lambda: _update_address_metadata(tokens, path)
+
+
+def _case_convert(converter: Callable, build: Callable[[Corpus], dict]) -> Callable:
+    def setup(c: Corpus, d: Path) -> Callable:
+        path = d / "input.json"
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(build(c), f, indent=2)
+        return lambda: _quiet(converter, path)
+    return setup
+
+
+def _case_write_json(pretty: bool) -> Callable:
+    def setup(c: Corpus, d: Path) -> Callable:
+        path = d / "out.json"
+        data = c.metadata()
+        return lambda: write_json(str(path), data, pretty)
+    return setup
+
+
+CASES: Dict[str, Callable[[Corpus, Path], Callable]] = {
+    "load_addresses_from_file": _case_load_addresses,
+    "try_decode_string_return": _case_decode,
+    "build_outputs": _case_build_outputs,
+    "append_tokens_to_metadata": _case_append_tokens,
+    "_update_address_metadata": _case_update_address_metadata,
+    "convert_address_to_metadata": _case_convert(
+        convert_addresses_to_lowercase.convert_address_to_metadata, lambda c: c.metadata(mixed_case=True)
+    ),
+    "convert_names_to_address": _case_convert(
+        convert_addresses_to_lowercase.convert_names_to_address, lambda c: c.lookup_map(c.names)
+    ),
+    "convert_tickers_to_address": _case_convert(
+        convert_addresses_to_lowercase.convert_tickers_to_address, lambda c: c.lookup_map(c.tickers)
+    ),
+    "write_json_pretty": _case_write_json(True),
+    "write_json_compact": _case_write_json(False),
+}
+
+
+def measure(
+    setup: Callable[[Corpus, Path], Callable],
+    corpus: Corpus,
+    repeat: int,
+    trace_memory: bool = True,
+    min_time: float = 0.0,
+) -> Tuple[float, Optional[int]]:
+    """
+    (best seconds over at least repeat runs, and until min_time seconds were
+    timed or MAX_RUNS; peak traced bytes of one more run). Fresh inputs for every run.
+    """
+    best = float("inf")
+    peak = None
+    runs = 0
+    timed = 0.0
+    while runs < repeat or (timed < min_time and runs < MAX_RUNS):
+        workdir = Path(tempfile.mkdtemp(prefix="bench_"))
+        try:
+            fn = setup(corpus, workdir)
+            # As timeit does: a collection landing in one run but not another is noise
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                fn()
+                elapsed = time.perf_counter() - start
+            finally:
+                gc.enable()
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+        best = min(best, elapsed)
+        timed += elapsed
+        runs += 1
+
+    if trace_memory:
+        workdir = Path(tempfile.mkdtemp(prefix="bench_"))
+        try:
+            fn = setup(corpus, workdir)
+            tracemalloc.start()
+            try:
+                fn()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+    return best, peak
+
+
+def _too_slow(current: dict, base: Optional[dict], threshold: float, noise_floor: float) -> bool:
+    return bool(base) and current["seconds"] > base["seconds"] + max(base["seconds"] * threshold, noise_floor)
+
+
+def compare(
+    results: Dict[str, Dict[str, dict]],
+    baseline: Dict[str, Dict[str, dict]],
+    threshold: float,
+    mem_threshold: float,
+    noise_floor: float = 0.0,
+) -> List[str]:
+    """
+    Regression messages for case/size pairs present in both. A slowdown must
+    exceed both the relative threshold and the absolute noise floor.
+    """
+    failures = []
+    for case, sizes in results.items():
+        for size, current in sizes.items():
+            base = baseline.get(case, {}).get(size)
+            if not base:
+                continue
+            if _too_slow(current, base, threshold, noise_floor):
+                failures.append(f"{case} @ {size}: {current['seconds']:.4f}s vs baseline {base['seconds']:.4f}s "
+                                f"(+{100 * (current['seconds'] / base['seconds'] - 1):.0f}%)")
+            if None in (current["peak_bytes"], base.get("peak_bytes")):
+                continue
+            if current["peak_bytes"] > base["peak_bytes"] * (1 + mem_threshold):
+                failures.append(f"{case} @ {size}: peak {current['peak_bytes'] / 2**20:.1f} MiB vs baseline "
+                                f"{base['peak_bytes'] / 2**20:.1f} MiB")
+    return failures
+
+
+def retime_slow_cases(results: Dict[str, Dict[str, dict]], baseline: Dict[str, Dict[str, dict]], args) -> None:
+    """
+    Time cases that look slower than the baseline again, up to --confirm more
+    times, keeping the best. A burst of load on a shared runner then has to
+    hit every attempt to fail the gate.
+    """
+    for _ in range(args.confirm):
+        suspects = [
+            (case, size) for case, sizes in results.items() for size, current in sizes.items()
+            if _too_slow(current, baseline.get(case, {}).get(size), args.threshold, args.noise_floor)
+        ]
+        if not suspects:
+            return
+        print(f"# re-timing {len(suspects)} case(s) slower than the baseline", file=sys.stderr)
+        for size in sorted({int(size) for _, size in suspects}):
+            corpus = Corpus(size, args.seed)
+            for case, key in suspects:
+                if key == str(size):
+                    seconds, _ = measure(CASES[case], corpus, args.repeat, False, args.min_time)
+                    results[case][key]["seconds"] = round(min(results[case][key]["seconds"], seconds), 6)
+            del corpus
+
+
+def _parse_sizes(value: str) -> List[int]:
+    sizes = []
+    for part in value.split(","):
+        part = part.strip().lower()
+        scale = {"k": 1_000, "m": 1_000_000}.get(part[-1:], 1)
+        sizes.append(int(float(part.rstrip("km")) * scale))
+    return sizes
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Time and memory benchmarks for the token pipeline's hot paths.")
+    p.add_argument("--sizes", type=_parse_sizes, default=list(DEFAULT_SIZES),
+                   help="Comma-separated corpus sizes, e.g. 10k,100k,1m.")
+    p.add_argument("--case", action="append", choices=sorted(CASES), help="Case to run (repeatable). Defaults to all.")
+    p.add_argument("--repeat", type=int, default=5, help="Minimum timed runs per case; the best is reported.")
+    p.add_argument("--min-time", type=float, default=0.5,
+                   help="Keep timing a case until this many seconds were measured (at most MAX_RUNS runs).")
+    p.add_argument("--seed", type=int, default=1, help="Corpus RNG seed.")
+    p.add_argument("--skip-memory", action="store_true",
+                   help="Skip the tracemalloc run (it dominates the wall time); memory is then not compared.")
+    p.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON path.")
+    p.add_argument("--save-baseline", action="store_true", help="Merge these results into the baseline file.")
+    p.add_argument("--compare", action="store_true", help="Fail on regressions against the baseline.")
+    p.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown as a fraction of baseline time.")
+    p.add_argument("--noise-floor", type=float, default=0.005,
+                   help="Slowdowns under this many seconds are never regressions.")
+    p.add_argument("--confirm", type=int, default=2,
+                   help="Re-time cases that look slower than the baseline up to this many times before failing.")
+    p.add_argument("--mem-threshold", type=float, default=0.25, help="Allowed peak memory growth as a fraction.")
+    p.add_argument("--out", type=Path, default=None, help="Also write these results as JSON.")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    cases = args.case or list(CASES)
+    results: Dict[str, Dict[str, dict]] = {case: {} for case in cases}
+
+    print(f"{'case':<30} {'size':>9} {'seconds':>10} {'peak MiB':>10}")
+    for size in args.sizes:
+        start = time.perf_counter()
+        corpus = Corpus(size, args.seed)
+        print(f"# corpus of {size} tokens generated in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+        for case in cases:
+            seconds, peak = measure(CASES[case], corpus, args.repeat, not args.skip_memory, args.min_time)
+            results[case][str(size)] = {"seconds": round(seconds, 6), "peak_bytes": peak}
+            peak_mib = f"{peak / 2**20:.1f}" if peak is not None else "-"
+            print(f"{case:<30} {size:>9} {seconds:>10.4f} {peak_mib:>10}", flush=True)
+        del corpus
+
+    report = {"version": BASELINE_VERSION, "python": platform.python_version(), "results": results}
+    exit_code = 0
+    if args.compare:
+        baseline: Optional[dict] = None
+        try:
+            with args.baseline.open("r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        except FileNotFoundError:
+            print(f"Error: no baseline at {args.baseline} (run with --save-baseline first)", file=sys.stderr)
+            sys.exit(1)
+        retime_slow_cases(results, baseline.get("results", {}), args)
+        failures = compare(results, baseline.get("results", {}), args.threshold, args.mem_threshold, args.noise_floor)
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        if failures:
+            exit_code = 1
+        else:
+            print(f"No regressions beyond {args.threshold:.0%} time / {args.mem_threshold:.0%} memory.")
+
+    if args.out:
+        write_json_atomic(args.out, report, indent=2, sort_keys=True)
+
+    if args.save_baseline:
+        try:
+            with args.baseline.open("r", encoding="utf-8") as f:
+                merged = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            merged = {}
+        merged_results = merged.get("results", {})
+        for case, sizes in results.items():
+            merged_results.setdefault(case, {}).update(sizes)
+        report["results"] = merged_results
+        write_json_atomic(args.baseline, report, indent=2, sort_keys=True)
+        print(f"Baseline saved to {args.baseline}")
+
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Pack the icons of the top-N tokens per chain into one sprite atlas.
+
+The asset selector renders dozens of icons at once, each a separate
+request. This script takes the --top-n tokens with an icon mirrored by
+mirror_icons.py, by popularity.json and liquidity.json rank (best of the
+two; unranked tokens fill up in metadata order), and lays their normalized
+<id>-<size>.webp files out on a square grid. Tokens sharing an icon share a cell. It writes:
+
+  <icons-dir>/atlas-<chain>-<signature>.webp
+  <out-root>/<chain>/icon_atlas.json:
+    {
+      "version": 1, "chain": 1, "signature": "...",
+      "image": "/token-icons/atlas-1-<signature>.webp",
+      "size": 64, "width": W, "height": H,
+      "icons": {address: [x, y], ...}     lowercase address -> cell offset
+    }
+
+so the selector's first paint costs one image request, with each icon drawn
+as a background-position of -x -y. The signature hashes the cell size and
+the sorted (address, icon id) pairs. Icon ids are content hashes, so it
+changes exactly when the token set or an icon changes. When it matches the
+existing icon_atlas.json and the image is present, nothing is written. The
+image name embeds the signature, so it can be served immutable next to the
+mirrored icons. Superseded atlas images are deleted.
+
+Reads address_to_metadata.mirrored.json, or address_to_metadata.json after
+mirror_icons.py --in-place. Needs Pillow with WebP support.
+
+Usage:
+  python scripts/build_icon_atlas.py [--chain 1] [--top-n 120] [--size 64] [--force]
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import math
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from atomic_json import write_bytes_atomic, write_json_atomic
+from token_data_common import CHAIN_IDS, REPO_ROOT, TOKEN_DATA_DIR, load_json
+
+try:
+    from PIL import Image
+except ImportError:  # checked in main(); only this stage needs it
+    Image = None
+
+ICONS_DIR = REPO_ROOT / "public" / "token-icons"
+ATLAS_VERSION = 1
+
+PADDING = 2  # transparent gutter so scaled-down icons do not bleed into neighbours
+WEBP_QUALITY = 90
+_MIRRORED_ICON_RE = re.compile(r"([0-9a-f]{16})-\d+\.webp$")
+
+
+def select_tokens(
+    metadata: Dict[str, dict], popularity: Dict[str, dict], liquidity: Dict[str, dict], url_prefix: str, top_n: int
+) -> List[Tuple[str, str]]:
+    """
+    (address, icon id) of the top_n tokens with a mirrored icon, best rank
+    first; unranked tokens follow in metadata order.
+    """
+    ranked = []
+    for position, (addr, meta) in enumerate(metadata.items()):
+        icon = meta.get("icon") if isinstance(meta, dict) else None
+        if not isinstance(icon, str) or not icon.startswith(url_prefix):
+            continue
+        m = _MIRRORED_ICON_RE.search(icon)
+        rank = min(popularity.get(addr, {}).get("rank", math.inf), liquidity.get(addr, {}).get("rank", math.inf))
+        if m:
+            ranked.append((rank, position, addr, m.group(1)))
+    ranked.sort()
+    return [(addr, icon_id) for _, _, addr, icon_id in ranked[:top_n]]
+
+
+def atlas_signature(tokens: List[Tuple[str, str]], size: int) -> str:
+    payload = json.dumps([ATLAS_VERSION, size, PADDING, sorted(tokens)], separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def build_atlas(tokens: List[Tuple[str, str]], icons_dir: Path, size: int) -> Tuple[bytes, int, int, Dict[str, list]]:
+    """Returns (WebP bytes, width, height, address -> [x, y])."""
+    icon_ids = list(dict.fromkeys(icon_id for _, icon_id in tokens))
+    cell = size + 2 * PADDING
+    cols = max(1, math.ceil(math.sqrt(len(icon_ids))))
+    rows = max(1, math.ceil(len(icon_ids) / cols))
+    atlas = Image.new("RGBA", (cols * cell, rows * cell), (0, 0, 0, 0))
+
+    offsets: Dict[str, list] = {}
+    for i, icon_id in enumerate(icon_ids):
+        x, y = (i % cols) * cell + PADDING, (i // cols) * cell + PADDING
+        with Image.open(icons_dir / f"{icon_id}-{size}.webp") as im:
+            icon = im.convert("RGBA")
+        if icon.size != (size, size):
+            icon = icon.resize((size, size), Image.LANCZOS)
+        atlas.paste(icon, (x, y))
+        offsets[icon_id] = [x, y]
+
+    buf = io.BytesIO()
+    atlas.save(buf, "WEBP", quality=WEBP_QUALITY, method=5)
+    return buf.getvalue(), atlas.width, atlas.height, {addr: offsets[icon_id] for addr, icon_id in tokens}
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Pack popular tokens' mirrored icons into one sprite atlas per chain.")
+    p.add_argument("--chain", type=int, action="append", help="Chain ID (repeatable). Defaults to all chains.")
+    p.add_argument("--out-root", type=Path, default=TOKEN_DATA_DIR, help="tokenData root containing <chain>/ dirs.")
+    p.add_argument("--icons-dir", type=Path, default=ICONS_DIR, help="mirror_icons.py output directory.")
+    p.add_argument("--url-prefix", default="/token-icons/", help="Public URL prefix of --icons-dir.")
+    p.add_argument("--top-n", type=int, default=120, help="Tokens per atlas.")
+    p.add_argument("--size", type=int, default=64, choices=(64, 128), help="Icon size in the atlas.")
+    p.add_argument("--force", action="store_true", help="Rebuild even if the signature is unchanged.")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    if Image is None:
+        print("Error: Pillow is required to build the atlas (pip install Pillow).", file=sys.stderr)
+        sys.exit(1)
+
+    for chain_id in args.chain or CHAIN_IDS:
+        chain_dir = args.out_root / str(chain_id)
+        metadata = load_json(chain_dir / "address_to_metadata.mirrored.json") or load_json(
+            chain_dir / "address_to_metadata.json"
+        )
+        popularity = load_json(chain_dir / "popularity.json")
+        liquidity = load_json(chain_dir / "liquidity.json")
+        if not popularity and not liquidity:
+            print(f"Warning: no popularity.json or liquidity.json for chain {chain_id}; "
+                  "atlas follows metadata order", file=sys.stderr)
+        tokens = select_tokens(metadata, popularity, liquidity, args.url_prefix, args.top_n)
+        if not tokens:
+            print(f"Warning: no mirrored icons for chain {chain_id}; run mirror_icons.py first", file=sys.stderr)
+            continue
+
+        signature = atlas_signature(tokens, args.size)
+        image_name = f"atlas-{chain_id}-{signature}.webp"
+        map_path = chain_dir / "icon_atlas.json"
+        if (not args.force and load_json(map_path).get("signature") == signature
+                and (args.icons_dir / image_name).exists()):
+            print(f"Chain {chain_id}: atlas unchanged ({signature}).")
+            continue
+
+        missing = [icon_id for _, icon_id in tokens if not (args.icons_dir / f"{icon_id}-{args.size}.webp").exists()]
+        if missing:
+            print(f"Error: {len(missing)} icon files missing from {args.icons_dir} (e.g. {missing[0]})",
+                  file=sys.stderr)
+            sys.exit(1)
+
+        payload, width, height, offsets = build_atlas(tokens, args.icons_dir, args.size)
+        write_bytes_atomic(args.icons_dir / image_name, payload)
+        write_json_atomic(map_path, {
+            "version": ATLAS_VERSION,
+            "chain": chain_id,
+            "signature": signature,
+            "image": f"{args.url_prefix}{image_name}",
+            "size": args.size,
+            "width": width,
+            "height": height,
+            "icons": dict(sorted(offsets.items())),
+        }, indent=None)
+        for old in args.icons_dir.glob(f"atlas-{chain_id}-*.webp"):
+            if old.name != image_name:
+                old.unlink()
+        print(f"Chain {chain_id}: packed {len(tokens)} tokens into {width}x{height} "
+              f"({len(payload)} bytes). Output: {args.icons_dir / image_name}, {map_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,8 @@ import json
 import os
 from pathlib import Path
 
+from atomic_json import write_json_atomic
+
 def convert_address_to_metadata(file_path):
     """Convert address keys to lowercase in address_to_metadata.json files"""
     print(f"Processing {file_path}...")
@@ -23,11 +25,11 @@ def convert_address_to_metadata(file_path):
     for address, metadata in data.items():
         new_data[address.lower()] = metadata
     
-    # Write back to file
-    with open(file_path, 'w') as f:
-        json.dump(new_data, f, indent=2)
-    
-    print(f"  Converted {len(new_data)} addresses to lowercase")
+    # Write back to file (skipped when nothing changed)
+    if write_json_atomic(file_path, new_data, indent=2):
+        print(f"  Converted {len(new_data)} addresses to lowercase")
+    else:
+        print(f"  Already lowercase, left {file_path} untouched")
 
 def convert_names_to_address(file_path):
     """Convert address values to lowercase in names_to_address.json files"""
@@ -41,11 +43,11 @@ def convert_names_to_address(file_path):
     for name, address in data.items():
         new_data[name] = address.lower()
     
-    # Write back to file
-    with open(file_path, 'w') as f:
-        json.dump(new_data, f, indent=2)
-    
-    print(f"  Converted {len(new_data)} addresses to lowercase")
+    # Write back to file (skipped when nothing changed)
+    if write_json_atomic(file_path, new_data, indent=2):
+        print(f"  Converted {len(new_data)} addresses to lowercase")
+    else:
+        print(f"  Already lowercase, left {file_path} untouched")
 
 def convert_tickers_to_address(file_path):
     """Convert address values to lowercase in tickers_to_address.json files"""
@@ -59,11 +61,11 @@ def convert_tickers_to_address(file_path):
     for ticker, address in data.items():
         new_data[ticker] = address.lower()
     
-    # Write back to file
-    with open(file_path, 'w') as f:
-        json.dump(new_data, f, indent=2)
-    
-    print(f"  Converted {len(new_data)} addresses to lowercase")
+    # Write back to file (skipped when nothing changed)
+    if write_json_atomic(file_path, new_data, indent=2):
+        print(f"  Converted {len(new_data)} addresses to lowercase")
+    else:
+        print(f"  Already lowercase, left {file_path} untouched")
 
 def main():
     """Main function to process all token data files"""
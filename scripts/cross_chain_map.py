@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Build a canonical cross-chain token map (e.g. USDC on 1 <-> USDC on 8453).
+
+Links come from, in decreasing confidence:
+
+  1.0  CANONICAL_ASSETS below (native ETH, WETH, USDC, DAI, cbBTC, ...)
+  0.9  bridgeInfo extensions in Uniswap-format token lists (--tokenlist)
+  0.8  the same address on both chains with the same ticker (CREATE2 and
+       deterministic deployments such as cbBTC)
+  0.6  the only token with this exact ticker on each chain, same decimals
+       and name
+  0.4  same ticker, decimals and name, using each chain's best address from
+       tickers_to_address.json when the ticker is ambiguous
+
+Names are compared after search_index.normalize with spaces dropped
+("USD Coin" == "usd-coin"). Unrelated tokens share short tickers all the
+time, so a ticker match alone never links.
+
+0.1 is subtracted when either side's decimals are unknown; a decimals
+mismatch never links. A token joins at most one asset (the highest
+confidence link wins).
+
+Writes <out-root>/cross_chain_map.json:
+
+  {
+    "version": 1,
+    "assets": {assetId: {"symbol": "USDC",
+                          "tokens": {"1": {"address", "confidence", "source"}, "8453": {...}}}},
+    "byToken": {"<chain>:<address>": assetId}
+  }
+
+so the UI can go from a token to its counterpart on another chain with two
+object lookups instead of comparing tickers across chains at runtime.
+
+Usage:
+  python scripts/cross_chain_map.py [--tokenlist uniswap.tokenlist.json] [--min-confidence 0.4]
+"""
+
+import argparse
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from atomic_json import write_json_atomic
+from search_index import normalize
+from token_data_common import CHAIN_IDS, TOKEN_DATA_DIR, load_json
+
+MAP_VERSION = 1
+
+# Hand-checked canonical deployments; asset id -> chain -> lowercased address
+CANONICAL_ASSETS: Dict[str, Dict[int, str]] = {
+    "ETH": {
+        1: "0x0000000000000000000000000000000000000000",
+        8453: "0x0000000000000000000000000000000000000000",
+    },
+    "WETH": {
+        1: "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2",
+        8453: "0x4200000000000000000000000000000000000006",
+    },
+    "USDC": {
+        1: "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48",
+        8453: "0x833589fcd6edb6e08f4c7c32d4f71b54bda02913",
+    },
+    "USDT": {
+        1: "0xdac17f958d2ee523a2206206994597c13d831ec7",
+        8453: "0xfde4c96c8593536e31f229ea8f37b2ada2699bb2",
+    },
+    "DAI": {
+        1: "0x6b175474e89094c44da98b954eedeac495271d0f",
+        8453: "0x50c5725949a6f0c72e6c4a641f24049a917db0cb",
+    },
+    "cbBTC": {
+        1: "0xcbb7c0000ab88b473b1f5afd9ef808440eed33bf",
+        8453: "0xcbb7c0000ab88b473b1f5afd9ef808440eed33bf",
+    },
+    "cbETH": {
+        1: "0xbe9895146f7af43049ca1c1ae358b0541ea49704",
+        8453: "0x2ae3f1ec7f1f5012cfeab0185bfc7aa3cf0dec22",
+    },
+}
+
+CONFIDENCE = {
+    "canonical": 1.0,
+    "bridge": 0.9,
+    "same-address": 0.8,
+    "unique-ticker": 0.6,
+    "best-ticker": 0.4,
+}
+UNKNOWN_DECIMALS_PENALTY = 0.1
+
+
+def bridge_links(tokenlist: dict, chain_ids) -> List[Tuple[str, Dict[int, str]]]:
+    """(symbol, chain -> address) groups from tokens' extensions.bridgeInfo."""
+    groups = []
+    for token in tokenlist.get("tokens", []):
+        chain_id = token.get("chainId")
+        bridge = (token.get("extensions") or {}).get("bridgeInfo") or {}
+        if chain_id not in chain_ids or not bridge:
+            continue
+        members = {chain_id: token["address"].lower()}
+        for other, info in bridge.items():
+            if int(other) in chain_ids and info.get("tokenAddress"):
+                members[int(other)] = info["tokenAddress"].lower()
+        if len(members) > 1:
+            groups.append((token.get("symbol") or "", members))
+    return groups
+
+
+def _name_key(meta: dict) -> str:
+    name = meta.get("name")
+    return normalize(name).replace(" ", "") if isinstance(name, str) else ""
+
+
+def _same_name(metadata: Dict[int, Dict[str, dict]], members: Dict[int, str]) -> bool:
+    names = {_name_key(metadata[c].get(a, {})) for c, a in members.items()}
+    return len(names) == 1 and "" not in names
+
+
+def heuristic_links(
+    metadata: Dict[int, Dict[str, dict]], best: Dict[int, Dict[str, str]]
+) -> List[Tuple[str, str, Dict[int, str]]]:
+    """(source, symbol, chain -> address) groups from address/ticker/name matches."""
+    chains = sorted(metadata)
+    by_ticker: Dict[int, Dict[str, List[str]]] = {}
+    for chain_id in chains:
+        index: Dict[str, List[str]] = defaultdict(list)
+        for addr, meta in metadata[chain_id].items():
+            if isinstance(meta.get("ticker"), str) and meta["ticker"].strip():
+                index[meta["ticker"].strip()].append(addr)
+        by_ticker[chain_id] = index
+
+    groups = []
+    base, others = chains[0], chains[1:]
+    for addr, meta in metadata[base].items():
+        ticker = (meta.get("ticker") or "").strip()
+        if not ticker:
+            continue
+        for other in others:
+            if (metadata[other].get(addr, {}).get("ticker") or "").strip() == ticker:
+                groups.append(("same-address", ticker, {base: addr, other: addr}))
+
+    for ticker, addrs in by_ticker[base].items():
+        for other in others:
+            candidates = by_ticker[other].get(ticker)
+            if not candidates:
+                continue
+            if len(addrs) == 1 and len(candidates) == 1:
+                source, members = "unique-ticker", {base: addrs[0], other: candidates[0]}
+            elif ticker in best[base] and ticker in best[other]:
+                source, members = "best-ticker", {base: best[base][ticker], other: best[other][ticker]}
+            else:
+                continue
+            if _same_name(metadata, members):
+                groups.append((source, ticker, members))
+    return groups
+
+
+def _decimals_confidence(metadata: Dict[int, Dict[str, dict]], members: Dict[int, str], base: float) -> Optional[float]:
+    """base adjusted for decimals; None if the members' decimals disagree."""
+    decimals = [metadata[c].get(a, {}).get("decimals") for c, a in members.items()]
+    known = {d for d in decimals if d is not None}
+    if len(known) > 1:
+        return None
+    return base - UNKNOWN_DECIMALS_PENALTY if None in decimals else base
+
+
+def build_cross_chain_map(
+    metadata: Dict[int, Dict[str, dict]],
+    best: Dict[int, Dict[str, str]],
+    tokenlist: Optional[dict] = None,
+    min_confidence: float = 0.4,
+) -> dict:
+    candidates: List[Tuple[float, str, str, Dict[int, str]]] = []
+    for asset_id, members in CANONICAL_ASSETS.items():
+        present = {c: a for c, a in members.items() if c in metadata}
+        candidates.append((CONFIDENCE["canonical"], "canonical", asset_id, present))
+    for symbol, members in bridge_links(tokenlist or {}, tuple(metadata)):
+        conf = _decimals_confidence(metadata, members, CONFIDENCE["bridge"])
+        if conf is not None:
+            candidates.append((conf, "bridge", symbol, members))
+    for source, symbol, members in heuristic_links(metadata, best):
+        conf = _decimals_confidence(metadata, members, CONFIDENCE[source])
+        if conf is not None:
+            candidates.append((conf, source, symbol, members))
+
+    assets: Dict[str, dict] = {}
+    by_token: Dict[str, str] = {}
+    # Highest confidence first; every token joins at most one asset
+    for conf, source, symbol, members in sorted(candidates, key=lambda c: (-c[0], c[2], sorted(c[3].items()))):
+        if conf < min_confidence or len(members) < 2:
+            continue
+        keys = {c: f"{c}:{a}" for c, a in members.items()}
+        if any(k in by_token for k in keys.values()):
+            continue
+        asset_id = symbol if symbol not in assets else f"{symbol}:{members[min(members)]}"
+        assets[asset_id] = {
+            "symbol": symbol,
+            "tokens": {
+                str(c): {"address": a, "confidence": round(conf, 2), "source": source}
+                for c, a in sorted(members.items())
+            },
+        }
+        for key in keys.values():
+            by_token[key] = asset_id
+
+    return {"version": MAP_VERSION, "assets": assets, "byToken": dict(sorted(by_token.items()))}
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Emit a canonical cross-chain token equivalence map with confidences.")
+    p.add_argument("--chain", type=int, action="append", help="Chain ID (repeatable). Defaults to all chains.")
+    p.add_argument("--out-root", type=Path, default=TOKEN_DATA_DIR, help="tokenData root containing <chain>/ dirs.")
+    p.add_argument("--tokenlist", type=Path, action="append", default=[],
+                   help="Uniswap-format token list with bridgeInfo extensions (repeatable).")
+    p.add_argument("--min-confidence", type=float, default=0.4, help="Drop links below this confidence.")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    chain_ids = args.chain or CHAIN_IDS
+    if len(chain_ids) < 2:
+        print("Error: need at least two chains to link", file=sys.stderr)
+        sys.exit(1)
+
+    metadata = {c: load_json(args.out_root / str(c) / "address_to_metadata.json") for c in chain_ids}
+    best = {c: load_json(args.out_root / str(c) / "tickers_to_address.json") for c in chain_ids}
+    tokenlist: dict = {"tokens": []}
+    for path in args.tokenlist:
+        tokenlist["tokens"].extend(load_json(path).get("tokens", []))
+
+    result = build_cross_chain_map(metadata, best, tokenlist, args.min_confidence)
+    out_path = args.out_root / "cross_chain_map.json"
+    write_json_atomic(out_path, result, indent=2)
+
+    by_source: Dict[str, int] = defaultdict(int)
+    for asset in result["assets"].values():
+        by_source[next(iter(asset["tokens"].values()))["source"]] += 1
+    summary = ", ".join(f"{n} {s}" for s, n in sorted(by_source.items()))
+    print(f"Linked {len(result['assets'])} assets ({summary}). Output: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
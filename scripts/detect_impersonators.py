@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Flag spam/impersonator tokens and write a denylist plus a filtered export.
+
+Protected tokens are the canonical assets from cross_chain_map.py plus the
+top --top-n by popularity.json and liquidity.json rank. Tickers and names of
+every other token are reduced to three keys, computed once per column:
+
+  plain      NFKC + lowercase
+  glyph      plain with HOMOGLYPHS and 0/1/i -> o/l/l folded
+  skeleton   glyph with diacritics and punctuation dropped (search_index.normalize)
+
+and looked up against the same keys of the protected tokens:
+
+  ticker-homoglyph   same glyph key, different plain ticker (UЅDС, U$DC)  +2
+  numbered-copy      a protected ticker plus digits (USDC2)              +2
+  ticker-copy        same plain ticker (bridged copies share these)      +1
+  ticker-variant     same skeleton only, i.e. punctuation (USDC+)        +1
+  name-copy          name skeleton equals a protected token's name       +1
+  zero-liquidity     liquidity.json exists and has nothing for it        +1
+  liquid             liquidity_usd >= --min-liquidity                    -2
+
+Tokens scoring >= DENY_SCORE are denylisted if they use a homoglyph or
+scored zero-liquidity. Bridged copies and real assets with numbered tickers
+(USDT0, USD0) also copy tickers and names, so a copy alone is only evidence
+once liquidity.json shows the token has no pools; without that, tokens
+scoring >= DENY_SCORE go to review.json instead. Protected tokens, Trust
+Wallet sourced tokens (provenance sidecar), tokens linked in
+cross_chain_map.json and the native-ETH placeholders are never flagged.
+
+Writes per chain:
+  - denylist.json: {address: {"score", "reasons", "impersonates", "ticker"}}
+  - review.json: same shape, copies that need liquidity data or a human look
+  - address_to_metadata.filtered.json: metadata without denylisted tokens
+
+Usage:
+  python scripts/detect_impersonators.py [--chain 1] [--top-n 100] [--min-liquidity 50000]
+"""
+
+import argparse
+import re
+import sys
+import unicodedata
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from atomic_json import write_json_atomic
+from cross_chain_map import CANONICAL_ASSETS
+from search_index import normalize
+from token_data_common import CHAIN_IDS, TOKEN_DATA_DIR, load_json
+
+DENY_SCORE = 2
+NATIVE_PLACEHOLDERS = {
+    "0x0000000000000000000000000000000000000000",
+    "0xeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeee",
+}
+
+# Look-alike letters that NFKC leaves alone (Cyrillic, Greek, symbols) -> Latin
+HOMOGLYPHS = str.maketrans({
+    "а": "a", "в": "b", "с": "c", "е": "e", "ё": "e", "н": "h", "і": "i", "ј": "j",
+    "к": "k", "м": "m", "о": "o", "р": "p", "ѕ": "s", "т": "t", "у": "y", "х": "x",
+    "α": "a", "β": "b", "ε": "e", "η": "n", "ι": "i", "κ": "k", "ν": "v", "ο": "o",
+    "ρ": "p", "τ": "t", "υ": "u", "χ": "x", "ω": "w", "ξ": "e", "μ": "u",
+    "$": "s", "€": "e", "₿": "b",
+})
+# Digit/letter confusables, folded on both sides
+_FOLD_CONFUSABLE = str.maketrans({"0": "o", "1": "l", "i": "l"})
+_TRAILING_DIGITS = re.compile(r"\d+$")
+# Reasons that flag a token without relying on a copied ticker or name
+DECEPTIVE_REASONS = frozenset({"ticker-homoglyph", "zero-liquidity"})
+
+
+def _plain(s: Optional[str]) -> str:
+    return unicodedata.normalize("NFKC", s).lower().strip() if isinstance(s, str) else ""
+
+
+def _glyph(plain: str) -> str:
+    return plain.translate(HOMOGLYPHS).translate(_FOLD_CONFUSABLE)
+
+
+def _skeleton(glyph: str) -> str:
+    return normalize(glyph).replace(" ", "")
+
+
+def skeleton(s: Optional[str]) -> str:
+    return _skeleton(_glyph(_plain(s)))
+
+
+def protected_addresses(
+    chain_id: int, metadata: Dict[str, dict], popularity: Dict[str, dict], liquidity: Dict[str, dict], top_n: int
+) -> Set[str]:
+    protected = {assets[chain_id] for assets in CANONICAL_ASSETS.values() if chain_id in assets}
+    for ranking in (popularity, liquidity):
+        protected.update(addr for addr, info in ranking.items() if info.get("rank", top_n + 1) <= top_n)
+    return {addr for addr in protected if addr in metadata and addr not in NATIVE_PLACEHOLDERS}
+
+
+def detect_impersonators(
+    chain_id: int,
+    metadata: Dict[str, dict],
+    popularity: Optional[Dict[str, dict]] = None,
+    liquidity: Optional[Dict[str, dict]] = None,
+    provenance: Optional[Dict[str, Dict[str, str]]] = None,
+    linked: Optional[Set[str]] = None,
+    top_n: int = 100,
+    min_liquidity: float = 50000.0,
+) -> Tuple[Dict[str, dict], Dict[str, dict]]:
+    """
+    Returns (denied, review), each address -> {score, reasons, impersonates,
+    ticker}. review holds tokens that score high enough but whose only
+    evidence is a copied ticker or name.
+    """
+    popularity = popularity or {}
+    liquidity = liquidity or {}
+    provenance = provenance or {}
+    protected = protected_addresses(chain_id, metadata, popularity, liquidity, top_n)
+    exempt = protected | NATIVE_PLACEHOLDERS | (linked or set()) | {
+        addr for addr, origin in provenance.items() if "trustwallet" in origin.values()
+    }
+
+    addresses = [a for a in metadata if a not in exempt]
+    plains = [_plain(metadata[a].get("ticker")) for a in addresses]
+    glyphs = list(map(_glyph, plains))
+    skeletons = list(map(_skeleton, glyphs))
+    name_skeletons = [skeleton(metadata[a].get("name")) for a in addresses]
+
+    targets = sorted(protected)
+    by_plain = {_plain(metadata[a].get("ticker")): a for a in targets}
+    by_glyph = {_glyph(p): a for p, a in by_plain.items()}
+    by_skeleton = {_skeleton(g): a for g, a in by_glyph.items()}
+    by_name = {skeleton(metadata[a].get("name")): a for a in targets}
+    for index in (by_plain, by_glyph, by_skeleton):
+        index.pop("", None)
+    by_name = {k: v for k, v in by_name.items() if len(k) >= 4}
+
+    denied: Dict[str, dict] = {}
+    review: Dict[str, dict] = {}
+    for addr, plain, glyph, skel, name in zip(addresses, plains, glyphs, skeletons, name_skeletons):
+        reasons = []
+        score = 0
+        target = None
+        if plain in by_plain:
+            target = by_plain[plain]
+            reasons.append("ticker-copy")
+            score += 1
+        elif glyph in by_glyph:
+            target = by_glyph[glyph]
+            reasons.append("ticker-homoglyph")
+            score += 2
+        elif skel in by_skeleton:
+            target = by_skeleton[skel]
+            reasons.append("ticker-variant")
+            score += 1
+        else:
+            stripped = _TRAILING_DIGITS.sub("", plain)
+            if stripped != plain and _glyph(stripped) in by_glyph:
+                target = by_glyph[_glyph(stripped)]
+                reasons.append("numbered-copy")
+                score += 2
+        if name in by_name:
+            target = target or by_name[name]
+            reasons.append("name-copy")
+            score += 1
+        if not reasons:
+            continue
+
+        liq = liquidity.get(addr, {}).get("liquidity_usd") or 0.0
+        if liquidity and liq <= 0:
+            reasons.append("zero-liquidity")
+            score += 1
+        elif liq >= min_liquidity:
+            reasons.append("liquid")
+            score -= 2
+
+        if score >= DENY_SCORE:
+            flagged = denied if DECEPTIVE_REASONS.intersection(reasons) else review
+            flagged[addr] = {
+                "score": score,
+                "reasons": reasons,
+                "impersonates": target,
+                "ticker": metadata[addr].get("ticker"),
+            }
+    return denied, review
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Denylist look-alike tokens that copy popular tickers and names.")
+    p.add_argument("--chain", type=int, action="append", help="Chain ID (repeatable). Defaults to all chains.")
+    p.add_argument("--out-root", type=Path, default=TOKEN_DATA_DIR, help="tokenData root containing <chain>/ dirs.")
+    p.add_argument("--top-n", type=int, default=100, help="Popularity/liquidity ranks treated as protected.")
+    p.add_argument("--min-liquidity", type=float, default=50000.0, help="USD liquidity that clears a look-alike.")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    cross_chain = load_json(args.out_root / "cross_chain_map.json")
+    for chain_id in args.chain or CHAIN_IDS:
+        chain_dir = args.out_root / str(chain_id)
+        metadata = load_json(chain_dir / "address_to_metadata.json")
+        if not metadata:
+            print(f"Warning: no metadata for chain {chain_id} in {chain_dir}", file=sys.stderr)
+            continue
+
+        prefix = f"{chain_id}:"
+        linked = {key[len(prefix):] for key in cross_chain.get("byToken", {}) if key.startswith(prefix)}
+        denied, review = detect_impersonators(
+            chain_id,
+            metadata,
+            popularity=load_json(chain_dir / "popularity.json"),
+            liquidity=load_json(chain_dir / "liquidity.json"),
+            provenance=load_json(chain_dir / "address_to_metadata.provenance.json"),
+            linked=linked,
+            top_n=args.top_n,
+            min_liquidity=args.min_liquidity,
+        )
+        filtered = {addr: meta for addr, meta in metadata.items() if addr not in denied}
+        write_json_atomic(chain_dir / "denylist.json", denied, indent=2, sort_keys=True)
+        write_json_atomic(chain_dir / "review.json", review, indent=2, sort_keys=True)
+        write_json_atomic(chain_dir / "address_to_metadata.filtered.json", filtered, indent=None, sort_keys=True)
+        print(f"Chain {chain_id}: denylisted {len(denied)} and flagged {len(review)} for review "
+              f"of {len(metadata)} tokens. Output: {chain_dir}")
+
+
+if __name__ == "__main__":
+    main()
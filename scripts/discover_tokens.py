@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Discover tokens from DEX factory PairCreated/PoolCreated logs via eth_getLogs.
+
+For each known Uniswap-style factory on the chain, logs are scanned from the
+last checkpointed block (or the factory's deployment block) up to
+head - confirmations:
+
+  - the range is cut into --chunk block slices, fetched concurrently on a
+    thread pool; every request goes through a shared token-bucket limiter
+    (--rps) and rpc_batch_call's 429/5xx backoff
+  - a slice the provider rejects as too large ("query returned more than
+    10000 results", "Log response size exceeded", ...) is halved and retried
+    recursively; a single block that is still refused aborts the run
+  - slices are consumed in block order, so after each one the discovered
+    pools are appended to <state-dir>/<chain>/pools.jsonl and the factory's
+    checkpoint is advanced; an interrupted run resumes where it stopped
+
+Both tokens of every new pool are checked against address_to_metadata.json,
+the --registry and every address fetched before; unknown ones are streamed
+in batches into get_token_data's fetch_metadata_one_chain. Each batch is
+appended to <state-dir>/<chain>/fetched.jsonl (tokens without metadata
+included, so they are not fetched again) and upserted into --registry.
+--out (default <state-dir>/<chain>/new_tokens.json) is written once at the
+end, also when the run fails, from everything fetched so far. Pools already in pools.jsonl are replayed first, so tokens whose
+metadata fetch was interrupted are picked up on the next run.
+
+pools.jsonl lines: {"pool", "token0", "token1", "factory", "kind", "fee", "block"},
+kind "v2" (getReserves) or "v3" (slot0/liquidity); liquidity_scores.py reads it.
+fetched.jsonl lines: {"address", "metadata"}, metadata null when the fetch found none.
+
+Usage:
+  python scripts/discover_tokens.py --chain 1 --rpc https://... [--out new_tokens.json] [--registry db]
+"""
+
+import argparse
+import itertools
+import json
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+from atomic_json import write_json_atomic
+from evm_address import event_topic
+from get_token_data import build_outputs, fetch_metadata_one_chain, rpc_batch_call
+from token_data_common import DATA_DIR, TOKEN_DATA_DIR, load_json
+from token_registry import chain_addresses, open_registry, upsert_tokens
+
+STATE_DIR = DATA_DIR / "discovery"
+
+PAIR_CREATED = event_topic("PairCreated(address,address,address,uint256)")
+V3_POOL_CREATED = event_topic("PoolCreated(address,address,uint24,int24,address)")
+SOLIDLY_POOL_CREATED = event_topic("PoolCreated(address,address,bool,address,uint256)")
+
+# topic0 -> (pool kind, index of the pool address among the 32-byte data words)
+EVENTS: Dict[str, Tuple[str, int]] = {
+    PAIR_CREATED: ("v2", 0),
+    V3_POOL_CREATED: ("v3", 1),
+    SOLIDLY_POOL_CREATED: ("v2", 0),  # Aerodrome/Velodrome pools expose getReserves
+}
+
+FACTORIES: Dict[int, List[dict]] = {
+    1: [
+        {"name": "uniswap-v2", "address": "0x5c69bee701ef814a2b6a3edd4b1652cb9cc5aa6f",
+         "topic": PAIR_CREATED, "start_block": 10000835},
+        {"name": "sushiswap", "address": "0xc0aee478e3658e2610c5f7a4a2e1777ce9e4f2ac",
+         "topic": PAIR_CREATED, "start_block": 10794229},
+        {"name": "uniswap-v3", "address": "0x1f98431c8ad98523631ae4a59f267346ea31f984",
+         "topic": V3_POOL_CREATED, "start_block": 12369621},
+    ],
+    8453: [
+        {"name": "uniswap-v2", "address": "0x8909dc15e40173ff4699343b6eb8132c65e18ec6",
+         "topic": PAIR_CREATED, "start_block": 6601915},
+        {"name": "uniswap-v3", "address": "0x33128a8fc17869897dce68ed026d694621f6fdfd",
+         "topic": V3_POOL_CREATED, "start_block": 1371680},
+        {"name": "aerodrome", "address": "0x420dd381b31aef6683db6b902084cb0ffece40da",
+         "topic": SOLIDLY_POOL_CREATED, "start_block": 3200559},
+    ],
+}
+
+# Lowercased substrings of the errors providers return when an eth_getLogs
+# range has too many results or spans too many blocks
+TOO_MANY_RESULTS = (
+    "query returned more than",  # geth, Infura
+    "log response size exceeded",  # Alchemy
+    "response size should not",  # Erigon
+    "query exceeds max results",  # Nethermind, dRPC
+    "block range is too wide",  # Ankr
+    "block range too large",
+    "exceed maximum block range",  # BlastAPI, Base public RPC
+    "eth_getlogs is limited to",  # QuickNode
+    "range too large",
+    "range is too large",
+    "query timeout exceeded",
+)
+
+
+class RangeTooLarge(RuntimeError):
+    """A getLogs range the provider refuses; fetch_logs splits it unless it is a single block."""
+
+
+class RateLimiter:
+    """Token bucket shared by all worker threads: `rate` requests/s, bursts up to `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _rpc(rpc_url: str, limiter: RateLimiter, method: str, params: list):
+    limiter.acquire()
+    reply = rpc_batch_call(rpc_url, [{"jsonrpc": "2.0", "id": 1, "method": method, "params": params}])[0]
+    if "error" in reply:
+        message = str(reply["error"].get("message", reply["error"]))
+        if any(s in message.lower() for s in TOO_MANY_RESULTS) or reply["error"].get("code") == -32005:
+            raise RangeTooLarge(message)
+        raise RuntimeError(f"{method} failed: {message}")
+    return reply["result"]
+
+
+def _topic_address(topic: str) -> str:
+    return "0x" + topic[-40:].lower()
+
+
+def parse_pool_log(log: dict, factory: dict) -> dict:
+    kind, pool_word = EVENTS[factory["topic"]]
+    data = log["data"][2:]
+    topics = log["topics"]
+    return {
+        "pool": "0x" + data[64 * pool_word + 24:64 * (pool_word + 1)].lower(),
+        "token0": _topic_address(topics[1]),
+        "token1": _topic_address(topics[2]),
+        "factory": factory["name"],
+        "kind": kind,
+        "fee": int(topics[3], 16) if kind == "v3" else None,
+        "block": int(log["blockNumber"], 16),
+    }
+
+
+def fetch_logs(rpc_url: str, limiter: RateLimiter, factory: dict, start: int, end: int) -> List[dict]:
+    """All pool-creation logs in [start, end], halving the range whenever the provider refuses it."""
+    params = [{
+        "address": factory["address"],
+        "topics": [factory["topic"]],
+        "fromBlock": hex(start),
+        "toBlock": hex(end),
+    }]
+    try:
+        logs = _rpc(rpc_url, limiter, "eth_getLogs", params)
+    except RangeTooLarge:
+        if start == end:
+            raise
+        mid = (start + end) // 2
+        return fetch_logs(rpc_url, limiter, factory, start, mid) + fetch_logs(rpc_url, limiter, factory, mid + 1, end)
+    return [parse_pool_log(log, factory) for log in logs if not log.get("removed")]
+
+
+def scan_factory(
+    rpc_url: str,
+    limiter: RateLimiter,
+    factory: dict,
+    start: int,
+    head: int,
+    chunk: int,
+    workers: int,
+) -> Iterator[Tuple[int, List[dict]]]:
+    """
+    Yield (last block of slice, pools) for consecutive slices of [start, head],
+    in block order, keeping at most 2 * workers slices in flight.
+    """
+    slices = ((lo, min(lo + chunk - 1, head)) for lo in range(start, head + 1, chunk))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending: deque = deque()
+
+        def submit_next() -> None:
+            for lo, hi in slices:
+                pending.append((hi, pool.submit(fetch_logs, rpc_url, limiter, factory, lo, hi)))
+                return
+
+        for _ in range(2 * workers):
+            submit_next()
+        try:
+            while pending:
+                # Oldest first, so checkpoints never skip an unfinished slice
+                hi, future = pending.popleft()
+                pools = future.result()
+                submit_next()
+                yield hi, pools
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def discover_pools(
+    rpc_url: str,
+    chain_id: int,
+    state_dir: Path,
+    limiter: RateLimiter,
+    chunk: int = 10000,
+    workers: int = 4,
+    confirmations: int = 12,
+    factories: Optional[List[str]] = None,
+) -> Iterator[dict]:
+    """Stream newly created pools for every factory, checkpointing as slices complete."""
+    chain_state = state_dir / str(chain_id)
+    checkpoint_path = chain_state / "checkpoint.json"
+    pools_path = chain_state / "pools.jsonl"
+    checkpoints = load_json(checkpoint_path)
+    head = int(_rpc(rpc_url, limiter, "eth_blockNumber", []), 16) - confirmations
+
+    for factory in FACTORIES.get(chain_id, []):
+        if factories and factory["name"] not in factories:
+            continue
+        start = checkpoints.get(factory["address"], factory["start_block"] - 1) + 1
+        if start > head:
+            continue
+        print(f"[{factory['name']}] scanning blocks {start}..{head}", file=sys.stderr)
+        for last_block, pools in scan_factory(rpc_url, limiter, factory, start, head, chunk, workers):
+            if pools:
+                chain_state.mkdir(parents=True, exist_ok=True)
+                with pools_path.open("a", encoding="utf-8") as f:
+                    for record in pools:
+                        f.write(json.dumps(record, sort_keys=True) + "\n")
+            # Pools are on disk before the checkpoint moves past them
+            checkpoints[factory["address"]] = last_block
+            write_json_atomic(checkpoint_path, checkpoints, indent=2, sort_keys=True)
+            yield from pools
+
+
+def read_pools(state_dir: Path, chain_id: int) -> Iterator[dict]:
+    """Pools recorded by earlier runs."""
+    try:
+        with (state_dir / str(chain_id) / "pools.jsonl").open("r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    except FileNotFoundError:
+        return
+
+
+def read_fetched(state_dir: Path, chain_id: int) -> Dict[str, Optional[dict]]:
+    """Address -> metadata (None if it had none) for every token fetched by earlier runs."""
+    fetched: Dict[str, Optional[dict]] = {}
+    try:
+        with (state_dir / str(chain_id) / "fetched.jsonl").open("r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    fetched[record["address"]] = record["metadata"]
+    except FileNotFoundError:
+        pass
+    return fetched
+
+
+def record_fetched(state_dir: Path, chain_id: int, batch: List[str], records: Dict[str, dict]) -> None:
+    chain_state = state_dir / str(chain_id)
+    chain_state.mkdir(parents=True, exist_ok=True)
+    with (chain_state / "fetched.jsonl").open("a", encoding="utf-8") as f:
+        for addr in batch:
+            f.write(json.dumps({"address": addr, "metadata": records.get(addr)}, sort_keys=True) + "\n")
+
+
+def new_token_batches(pools: Iterator[dict], known: set, batch_size: int) -> Iterator[List[str]]:
+    """Group unseen token addresses from a pool stream into batches."""
+    batch: List[str] = []
+    for record in pools:
+        for token in (record["token0"], record["token1"]):
+            if token not in known:
+                known.add(token)
+                batch.append(token)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+    if batch:
+        yield batch
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Find new tokens from DEX factory pool-creation logs and fetch their metadata.")
+    p.add_argument("--chain", type=int, required=True, help="Chain ID (e.g., 1 for Ethereum mainnet).")
+    p.add_argument("--rpc", required=True, help="HTTPS JSON-RPC endpoint for the specified chain.")
+    p.add_argument("--factory", action="append", help="Only scan this factory name (repeatable).")
+    p.add_argument("--state-dir", type=Path, default=STATE_DIR, help="Checkpoints and pools.jsonl location.")
+    p.add_argument("--metadata-root", type=Path, default=TOKEN_DATA_DIR,
+                   help="tokenData root; tokens already in <chain>/address_to_metadata.json are skipped.")
+    p.add_argument("--chunk", type=int, default=10000, help="Initial eth_getLogs block range per request.")
+    p.add_argument("--workers", type=int, default=4, help="Concurrent eth_getLogs requests.")
+    p.add_argument("--rps", type=float, default=10.0, help="Max RPC requests per second across all workers.")
+    p.add_argument("--confirmations", type=int, default=12, help="Stay this many blocks behind head.")
+    p.add_argument("--fetch-batch", type=int, default=200, help="New tokens per fetch_metadata_one_chain call.")
+    p.add_argument("--out", type=Path, default=None,
+                   help="Write discovered tokens' metadata to this JSON file (default <state-dir>/<chain>/new_tokens.json).")
+    p.add_argument("--registry", default=None, help="Also upsert discovered tokens into this registry (source 'rpc').")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.chain not in FACTORIES:
+        print(f"Error: no factories configured for chain {args.chain}", file=sys.stderr)
+        sys.exit(1)
+
+    limiter = RateLimiter(args.rps, burst=args.workers)
+    out_path = args.out or args.state_dir / str(args.chain) / "new_tokens.json"
+    fetched = read_fetched(args.state_dir, args.chain)
+    discovered: Dict[str, dict] = load_json(out_path)
+    discovered.update((addr, meta) for addr, meta in fetched.items() if meta)
+    conn = open_registry(Path(args.registry)) if args.registry else None
+    known = {addr.lower() for addr in load_json(args.metadata_root / str(args.chain) / "address_to_metadata.json")}
+    known.update(addr.lower() for addr in discovered)
+    known.update(fetched)
+    if conn is not None:
+        known |= chain_addresses(conn, args.chain)
+    # Tokens from already checkpointed pools whose metadata was never fetched come first
+    pools = itertools.chain(
+        read_pools(args.state_dir, args.chain),
+        discover_pools(
+            args.rpc, args.chain, args.state_dir, limiter,
+            chunk=args.chunk, workers=args.workers, confirmations=args.confirmations, factories=args.factory,
+        ),
+    )
+
+    fetched_now = 0
+    try:
+        for batch in new_token_batches(pools, known, args.fetch_batch):
+            meta = fetch_metadata_one_chain(args.rpc, args.chain, batch)
+            records, _, _ = build_outputs(args.chain, meta)
+            record_fetched(args.state_dir, args.chain, batch, records)
+            discovered.update(records)
+            fetched_now += len(batch)
+            if conn is not None:
+                upsert_tokens(conn, args.chain, records, "rpc")
+            print(f"Fetched metadata for {len(batch)} new tokens ({len(discovered)} total)")
+    except (requests.RequestException, RuntimeError) as e:
+        print(f"Error: {e} (progress is checkpointed; re-run to resume)", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if discovered:
+            write_json_atomic(out_path, discovered, indent=2, sort_keys=True)
+        if conn is not None:
+            conn.close()
+
+    print(f"Discovered {len(discovered)} new tokens on chain {args.chain} ({fetched_now} fetched this run). "
+          f"Output: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Keccak-256 and EIP-55 checksum addresses without third-party dependencies.
+
+hashlib.sha3_256 is the NIST SHA-3 variant (different padding), so the
+original Keccak permutation is implemented here for the few places the token
+scripts need Ethereum hashes: checksummed icon URLs and event topics.
+"""
+
+from typing import List
+
+_MASK = (1 << 64) - 1
+
+_ROUND_CONSTANTS = (
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+    0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+    0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+    0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+    0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+)
+
+# Rotation offsets indexed [x][y]
+_ROTATIONS = (
+    (0, 36, 3, 41, 18),
+    (1, 44, 10, 45, 2),
+    (62, 6, 43, 15, 61),
+    (28, 55, 25, 21, 56),
+    (27, 20, 39, 8, 14),
+)
+
+_RATE = 136  # bytes, for a 256-bit output
+
+
+def _rotl(v: int, n: int) -> int:
+    return ((v << n) | (v >> (64 - n))) & _MASK if n else v
+
+
+def _keccak_f(state: List[int]) -> None:
+    """Keccak-f[1600] in place; state[x + 5 * y] holds lane (x, y)."""
+    for rc in _ROUND_CONSTANTS:
+        # theta
+        c = [state[x] ^ state[x + 5] ^ state[x + 10] ^ state[x + 15] ^ state[x + 20] for x in range(5)]
+        d = [c[(x - 1) % 5] ^ _rotl(c[(x + 1) % 5], 1) for x in range(5)]
+        for i in range(25):
+            state[i] ^= d[i % 5]
+        # rho + pi
+        b = [0] * 25
+        for x in range(5):
+            for y in range(5):
+                b[y + 5 * ((2 * x + 3 * y) % 5)] = _rotl(state[x + 5 * y], _ROTATIONS[x][y])
+        # chi
+        for y in range(0, 25, 5):
+            row = b[y:y + 5]
+            for x in range(5):
+                state[y + x] = row[x] ^ ((~row[(x + 1) % 5]) & row[(x + 2) % 5])
+        # iota
+        state[0] ^= rc
+
+
+def keccak256(data: bytes) -> bytes:
+    padded = bytearray(data)
+    padded.append(0x01)
+    padded.extend(b"\x00" * (-len(padded) % _RATE))
+    padded[-1] |= 0x80
+
+    state = [0] * 25
+    for off in range(0, len(padded), _RATE):
+        block = padded[off:off + _RATE]
+        for i in range(_RATE // 8):
+            state[i] ^= int.from_bytes(block[8 * i:8 * i + 8], "little")
+        _keccak_f(state)
+
+    return b"".join(state[i].to_bytes(8, "little") for i in range(4))
+
+
+def checksum_address(address: str) -> str:
+    """EIP-55 mixed-case form of a 0x-prefixed 20-byte hex address."""
+    hex_addr = address[2:].lower() if address.startswith(("0x", "0X")) else address.lower()
+    digest = keccak256(hex_addr.encode("ascii")).hex()
+    return "0x" + "".join(
+        ch.upper() if ch.isalpha() and int(digest[i], 16) >= 8 else ch
+        for i, ch in enumerate(hex_addr)
+    )
+
+
+def event_topic(signature: str) -> str:
+    """topic0 for an event signature such as 'Transfer(address,address,uint256)'."""
+    return "0x" + keccak256(signature.encode("ascii")).hex()
@@ -4,11 +4,16 @@ import json
 import os
 import sys
 import time
-from collections import defaultdict, OrderedDict
+from collections import OrderedDict
+from pathlib import Path
 from typing import Dict, List, Optional
 import requests
 import random
 
+from atomic_json import write_json_atomic
+from resolve_tickers import resolve_lookups
+from token_registry import open_registry, upsert_tokens
+
 def _sleep_with_jitter(seconds: float):
     # Full jitter: U(0, seconds)
     time.sleep(random.uniform(0, max(0.0, seconds)))
@@ -256,49 +261,26 @@ def build_outputs(chain_id: int, meta_by_addr: Dict[str, Dict[str, Optional[str]
     """
     Returns:
       address_to_metadata (address -> {name,ticker,icon}),
-      names_map (Name/Name2 -> address),
-      tickers_map (SYM/SYM2 -> address)
+      names_map (name -> address),
+      tickers_map (ticker -> address)
+
+    Duplicate names/tickers are resolved by resolve_tickers.resolve_lookups;
+    with no market data yet the first address in input order wins. Run
+    resolve_tickers.py afterwards to rank by volume and liquidity.
     """
     address_to_metadata: Dict[str, Dict[str, Optional[str]]] = OrderedDict()
-    names_map: Dict[str, str] = OrderedDict()
-    tickers_map: Dict[str, str] = OrderedDict()
-    name_counts: Dict[str, int] = defaultdict(int)
-    ticker_counts: Dict[str, int] = defaultdict(int)
-
     for addr, nt in meta_by_addr.items():
-        name = nt.get("name")
-        ticker = nt.get("ticker")
         address_to_metadata[addr] = {
-            "name": name,
-            "ticker": ticker,
+            "name": nt.get("name"),
+            "ticker": nt.get("ticker"),
             "icon": make_icon_url(chain_id, addr),
         }
 
-        if name and name.strip():
-            base = name.strip()
-            key_lower = base.lower()
-            name_counts[key_lower] += 1
-            idx = name_counts[key_lower]
-            key = base if idx == 1 else f"{base}{idx}"
-            names_map[key] = addr
-
-        if ticker and ticker.strip():
-            base = ticker.strip()
-            key_lower = base.lower()
-            ticker_counts[key_lower] += 1
-            idx = ticker_counts[key_lower]
-            key = base if idx == 1 else f"{base}{idx}"
-            tickers_map[key] = addr
-
-    return address_to_metadata, names_map, tickers_map
-
-def write_json(path: str, data, pretty: bool):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w") as f:
-        if pretty:
-            json.dump(data, f, indent=2)
-        else:
-            json.dump(data, f, separators=(",", ":"))
+    best, _ = resolve_lookups(address_to_metadata)
+    return address_to_metadata, best["names"], best["tickers"]
+
+def write_json(path: str, data, pretty: bool) -> bool:
+    return write_json_atomic(path, data, indent=2 if pretty else None)
 
 def parse_args():
     p = argparse.ArgumentParser(description="Fetch ERC-20 metadata for a single chain and write 3 JSON outputs.")
@@ -313,6 +295,7 @@ def parse_args():
     p.add_argument("--backoff-initial", type=float, default=0.5, help="Initial backoff seconds for retries.")
     p.add_argument("--backoff-max", type=float, default=8.0, help="Max backoff seconds.")
     p.add_argument("--verbose", action="store_true", help="Log every token query and result.")
+    p.add_argument("--registry", default=None, help="Also upsert the results into this token registry database (source 'rpc').")
 
     return p.parse_args()
 
@@ -348,5 +331,13 @@ def main():
           f"  - names_to_address.json\n"
           f"  - tickers_to_address.json")
 
+    if args.registry:
+        conn = open_registry(Path(args.registry))
+        # invalid-address placeholders are only for visibility in the JSON output
+        resolved = {a: m for a, m in address_to_metadata.items() if is_valid_addr(a)}
+        inserted, updated = upsert_tokens(conn, args.chain, resolved, "rpc")
+        conn.close()
+        print(f"Registry {args.registry}: inserted {inserted}, updated {updated}")
+
 if __name__ == "__main__":
     main()
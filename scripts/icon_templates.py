@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Icon URL templating for token metadata exports.
+
+Almost every `icon` value is one of a few URL patterns with the token address
+substituted in (smold.app from make_icon_url, the Trust Wallet CDN with the
+EIP-55 address) or a fixed host prefix followed by an opaque path (CoinGecko
+and GeckoTerminal images). This module keeps those patterns in a template
+table, detects additional prefix templates from the data, and rewrites icons
+as template references.
+
+Template placeholders:
+  {chain}    chain id             {address}  lowercased 0x address
+  {slug}     Trust Wallet slug    {checksum} EIP-55 address
+  {param}    per-token string
+
+Template 0 is always "{param}" (a literal URL).
+
+The export pass writes, per chain:
+  - address_to_metadata.templated.json, where each `icon` is one of
+      null                 no icon
+      "https://..."        literal URL (no template matched)
+      <int>                template id, fully derived from chain/address
+      [<int>, "<param>"]   template id plus its {param} value
+  - icon_templates.json: {"version", "chain", "slugs", "templates", "stats"}
+
+and reports the bytes saved against the minified plain JSON.
+
+Usage:
+  python scripts/icon_templates.py [--chain 1] [--min-count 5]
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from atomic_json import write_json_atomic
+from evm_address import checksum_address
+from token_data_common import CHAIN_IDS, TOKEN_DATA_DIR, load_json
+
+TEMPLATES_VERSION = 1
+
+TRUST_SLUGS: Dict[int, str] = {1: "ethereum", 8453: "base"}
+
+# Known patterns; detect_prefix_templates() adds data-driven ones after these.
+ICON_TEMPLATES: List[str] = [
+    "{param}",
+    "https://assets.smold.app/api/token/{chain}/{address}/logo-128.png",
+    "https://assets-cdn.trustwallet.com/blockchains/{slug}/assets/{checksum}/logo.png",
+    "https://coin-images.coingecko.com/coins/images/{param}",
+    "https://assets.coingecko.com/coins/images/{param}",
+    "https://assets.geckoterminal.com/{param}",
+]
+
+
+def expand_template(template: str, chain_id: int, address: str, param: Optional[str]) -> str:
+    url = template.replace("{chain}", str(chain_id)).replace("{address}", address)
+    url = url.replace("{slug}", TRUST_SLUGS.get(chain_id, ""))
+    if "{checksum}" in url:
+        url = url.replace("{checksum}", checksum_address(address))
+    if "{param}" in url:
+        url = url.replace("{param}", param or "")
+    return url
+
+
+def match_icon(templates: List[str], chain_id: int, address: str, url: str) -> Tuple[int, Optional[str]]:
+    """
+    Return (template index, param) reproducing url exactly; falls back to the
+    literal template 0. Longer {param} prefixes are preferred so data-driven
+    templates win over the generic host prefixes they extend.
+    """
+    best: Tuple[int, Optional[str]] = (0, url)
+    best_len = -1
+    for idx, template in enumerate(templates):
+        if idx == 0:
+            continue
+        if "{param}" in template:
+            head, tail = template.split("{param}", 1)
+            head = expand_template(head, chain_id, address, None)
+            tail = expand_template(tail, chain_id, address, None)
+            if len(head) > best_len and url.startswith(head) and url.endswith(tail) and len(url) > len(head) + len(tail):
+                best, best_len = (idx, url[len(head):len(url) - len(tail)]), len(head)
+            continue
+        # Cheap prefix check first so checksums are only computed for candidates
+        prefix = template.split("{", 1)[0]
+        if url.startswith(prefix) and url == expand_template(template, chain_id, address, None):
+            return idx, None
+    return best
+
+
+def detect_prefix_templates(
+    chain_id: int, icons: List[Tuple[str, str]], templates: List[str], min_count: int
+) -> List[str]:
+    """
+    Propose "<prefix>{param}" templates for (address, url) pairs that only the
+    literal template matches.
+
+    Prefixes are cut at "/" boundaries; each URL votes for its longest prefix
+    shared by at least min_count uncovered URLs.
+    """
+    uncovered = [url for addr, url in icons if match_icon(templates, chain_id, addr, url)[0] == 0]
+
+    def slash_prefixes(url: str) -> List[str]:
+        start = url.find("://") + 3
+        return [url[:i + 1] for i in range(start, len(url) - 1) if url[i] == "/"]
+
+    counts: Counter = Counter(p for url in uncovered for p in slash_prefixes(url))
+    chosen = set()
+    for url in uncovered:
+        for prefix in reversed(slash_prefixes(url)):
+            if counts[prefix] >= min_count:
+                chosen.add(prefix)
+                break
+    return [f"{prefix}{{param}}" for prefix in sorted(chosen)]
+
+
+def build_template_table(chain_id: int, metadata: Dict[str, dict], min_count: int = 5) -> List[str]:
+    """Known templates plus prefixes detected from this chain's icons."""
+    icons = [
+        (addr.lower(), meta["icon"])
+        for addr, meta in metadata.items()
+        if isinstance(meta, dict) and isinstance(meta.get("icon"), str) and meta["icon"]
+    ]
+    return ICON_TEMPLATES + detect_prefix_templates(chain_id, icons, ICON_TEMPLATES, min_count)
+
+
+def templatize_metadata(
+    chain_id: int, metadata: Dict[str, dict], templates: List[str]
+) -> Tuple[Dict[str, dict], Counter]:
+    """Rewrite every icon as a template reference; returns (metadata, uses per template id)."""
+    uses: Counter = Counter()
+    out: Dict[str, dict] = {}
+    for addr in sorted(metadata):
+        meta = dict(metadata[addr])
+        icon = meta.get("icon")
+        if icon:
+            idx, param = match_icon(templates, chain_id, addr.lower(), icon)
+            uses[idx] += 1
+            if idx == 0:
+                meta["icon"] = icon
+            elif param is None:
+                meta["icon"] = idx
+            else:
+                meta["icon"] = [idx, param]
+        out[addr] = meta
+    return out, uses
+
+
+def expand_icon(ref, templates: List[str], chain_id: int, address: str) -> Optional[str]:
+    """Inverse of templatize_metadata for a single icon value."""
+    if ref is None or isinstance(ref, str):
+        return ref
+    if isinstance(ref, int):
+        return expand_template(templates[ref], chain_id, address.lower(), None)
+    idx, param = ref
+    return expand_template(templates[idx], chain_id, address.lower(), param)
+
+
+def _compact_size(data) -> int:
+    return len(json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Replace icon URLs with template references and report bytes saved.")
+    p.add_argument("--chain", type=int, action="append", help="Chain ID (repeatable). Defaults to all chains.")
+    p.add_argument("--out-root", type=Path, default=TOKEN_DATA_DIR, help="tokenData root containing <chain>/ dirs.")
+    p.add_argument("--min-count", type=int, default=5, help="URLs that must share a prefix to make it a template.")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    for chain_id in args.chain or CHAIN_IDS:
+        chain_dir = args.out_root / str(chain_id)
+        metadata = load_json(chain_dir / "address_to_metadata.json")
+        if not metadata:
+            print(f"Warning: no metadata for chain {chain_id} in {chain_dir}", file=sys.stderr)
+            continue
+
+        templates = build_template_table(chain_id, metadata, args.min_count)
+        templated, uses = templatize_metadata(chain_id, metadata, templates)
+
+        # Sanity check: every rewritten icon must expand back to the original
+        for addr, meta in templated.items():
+            if expand_icon(meta.get("icon"), templates, chain_id, addr) != metadata[addr].get("icon"):
+                print(f"Error: icon for {addr} does not round-trip", file=sys.stderr)
+                sys.exit(1)
+
+        before = _compact_size(metadata)
+        after = _compact_size(templated)
+        table = {
+            "version": TEMPLATES_VERSION,
+            "chain": chain_id,
+            "slugs": TRUST_SLUGS,
+            "templates": templates,
+            "stats": {
+                "uses": {str(i): uses[i] for i in range(len(templates))},
+                "bytesBefore": before,
+                "bytesAfter": after,
+            },
+        }
+        write_json_atomic(chain_dir / "address_to_metadata.templated.json", templated, indent=None, sort_keys=True)
+        write_json_atomic(chain_dir / "icon_templates.json", table, indent=2)
+
+        print(f"Chain {chain_id}: {len(templates)} templates, {sum(uses.values()) - uses[0]} of "
+              f"{sum(uses.values())} icons templated; {before} -> {after} bytes "
+              f"(saved {before - after}, {100 * (before - after) / before:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Per-token liquidity scores from on-chain pool state, read through Multicall3.
+
+Pools come from discover_tokens.py's pools.jsonl. Only pools paired with an
+anchor asset (WETH or a major stablecoin) can be priced, so only those are
+read:
+
+  v2 pools   getReserves()  -> reserve0, reserve1
+  v3 pools   slot0()        -> sqrtPriceX96
+             liquidity()    -> active liquidity L; the in-range virtual
+                               reserves are L / sqrtP and L * sqrtP
+
+Calls are packed into Multicall3 aggregate3 batches (allowFailure, so one
+broken pool does not sink a batch), and several batches go out in one
+JSON-RPC request through get_token_data's rpc_batch_call. Stablecoins are
+priced at $1; WETH is priced from the deepest WETH/stablecoin pool in the
+same snapshot (or --eth-usd).
+
+A pool's liquidity is twice the USD value of its anchor side, and is
+credited to both of its tokens. Writes <out-root>/<chain>/liquidity.json:
+
+  {address: {"rank": 1, "liquidity_usd": 123456.78, "pools": 3}, ...}
+
+resolve_tickers.py reads liquidity_usd as a ranking signal. V3 virtual
+reserves overstate TVL for concentrated positions, which is fine for
+ranking but not for display.
+
+Usage:
+  python scripts/liquidity_scores.py --chain 1 --rpc https://... [--eth-usd 3000]
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+from atomic_json import write_json_atomic
+from get_token_data import chunks, hex_to_bytes, rpc_batch_call
+from token_data_common import DATA_DIR, TOKEN_DATA_DIR
+
+STATE_DIR = DATA_DIR / "discovery"
+
+MULTICALL3 = "0xca11bde05977b3631167028862be2a173976ca11"  # same address on every chain
+SELECTOR_AGGREGATE3 = "82ad56cb"  # aggregate3((address,bool,bytes)[])
+SELECTOR_GET_RESERVES = "0902f1ac"
+SELECTOR_SLOT0 = "3850c7bd"
+SELECTOR_LIQUIDITY = "1a686502"
+
+Q96 = 2 ** 96
+
+# address -> (symbol, decimals); stablecoins are $1, WETH is priced per run
+ANCHORS: Dict[int, Dict[str, Tuple[str, int]]] = {
+    1: {
+        "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2": ("WETH", 18),
+        "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48": ("USDC", 6),
+        "0xdac17f958d2ee523a2206206994597c13d831ec7": ("USDT", 6),
+        "0x6b175474e89094c44da98b954eedeac495271d0f": ("DAI", 18),
+    },
+    8453: {
+        "0x4200000000000000000000000000000000000006": ("WETH", 18),
+        "0x833589fcd6edb6e08f4c7c32d4f71b54bda02913": ("USDC", 6),
+        "0xd9aaec86b65d86f6a7b5b1b0c42ffa531710b6ca": ("USDbC", 6),
+        "0x50c5725949a6f0c72e6c4a641f24049a917db0cb": ("DAI", 18),
+    },
+}
+WETH_SYMBOL = "WETH"
+
+
+def _word(value: int) -> str:
+    return f"{value:064x}"
+
+
+def encode_aggregate3(calls: List[Tuple[str, str]]) -> str:
+    """ABI-encode aggregate3 for (target, 4-byte selector hex) calls, all with allowFailure=true."""
+    heads: List[str] = []
+    tails: List[str] = []
+    offset = 32 * len(calls)
+    for target, selector in calls:
+        data = selector.ljust(64, "0")  # a bare selector padded to one word
+        tail = _word(int(target, 16)) + _word(1) + _word(96) + _word(len(selector) // 2) + data
+        heads.append(_word(offset))
+        tails.append(tail)
+        offset += len(tail) // 2
+    return "0x" + SELECTOR_AGGREGATE3 + _word(32) + _word(len(calls)) + "".join(heads) + "".join(tails)
+
+
+def decode_aggregate3(result_hex: str) -> List[Optional[bytes]]:
+    """Return data per call, or None where the call failed."""
+    raw = hex_to_bytes(result_hex)
+
+    def word(pos: int) -> int:
+        return int.from_bytes(raw[pos:pos + 32], "big")
+
+    array = word(0)
+    count = word(array)
+    base = array + 32
+    out: List[Optional[bytes]] = []
+    for i in range(count):
+        item = base + word(base + 32 * i)
+        success = word(item) != 0
+        data_pos = item + word(item + 32)
+        length = word(data_pos)
+        out.append(raw[data_pos + 32:data_pos + 32 + length] if success else None)
+    return out
+
+
+def _uint(data: bytes, index: int) -> int:
+    return int.from_bytes(data[32 * index:32 * (index + 1)], "big")
+
+
+def load_pools(path: Path, anchors: Dict[str, Tuple[str, int]]) -> List[dict]:
+    """Unique pools from pools.jsonl with at least one anchor token."""
+    pools: Dict[str, dict] = {}
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record["token0"] in anchors or record["token1"] in anchors:
+                    pools[record["pool"]] = record
+    except FileNotFoundError:
+        pass
+    return list(pools.values())
+
+
+def _pool_calls(pool: dict) -> List[Tuple[str, str]]:
+    if pool["kind"] == "v3":
+        return [(pool["pool"], SELECTOR_SLOT0), (pool["pool"], SELECTOR_LIQUIDITY)]
+    return [(pool["pool"], SELECTOR_GET_RESERVES)]
+
+
+def v3_virtual_reserves(sqrt_price_x96: int, active: int) -> Tuple[int, int]:
+    """Virtual (reserve0, reserve1) of a v3 pool's active range: L / sqrtP and L * sqrtP."""
+    return active * Q96 // sqrt_price_x96, active * sqrt_price_x96 // Q96
+
+
+def _group_reserves(group: List[dict], results: List[Optional[bytes]]) -> Iterator[Tuple[dict, int, int]]:
+    results_iter = iter(results)
+    for pool in group:
+        if pool["kind"] == "v3":
+            slot0, liquidity = next(results_iter), next(results_iter)
+            if not slot0 or not liquidity:
+                continue
+            sqrt_price = _uint(slot0, 0)
+            if sqrt_price == 0:
+                continue
+            yield (pool, *v3_virtual_reserves(sqrt_price, _uint(liquidity, 0)))
+        else:
+            reserves = next(results_iter)
+            if reserves:
+                yield pool, _uint(reserves, 0), _uint(reserves, 1)
+
+
+def read_reserves(
+    rpc_url: str, pools: List[dict], batch_size: int = 500, batches_per_request: int = 4
+) -> Iterator[Tuple[dict, int, int]]:
+    """
+    Yield (pool, reserve0, reserve1) in raw token units. V3 reserves are the
+    virtual reserves of the active range. Pools whose calls fail, or whose
+    batch gets no usable reply, are skipped.
+    """
+    groups = list(chunks(pools, batch_size))
+    for request_groups in chunks(groups, batches_per_request):
+        payload = []
+        id_map = {}
+        for i, group in enumerate(request_groups):
+            calls = [call for pool in group for call in _pool_calls(pool)]
+            id_map[i] = (group, len(calls))
+            payload.append({
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "eth_call",
+                "params": [{"to": MULTICALL3, "data": encode_aggregate3(calls)}, "latest"],
+            })
+        # Replies may come back in any order, and some may be missing; match them by id
+        for reply in rpc_batch_call(rpc_url, payload):
+            _id = reply.get("id")
+            if _id not in id_map:
+                continue
+            group, expected = id_map.pop(_id)
+            if "error" in reply:
+                print(f"[warn] multicall failed: {reply['error']}", file=sys.stderr)
+                continue
+            results = decode_aggregate3(reply.get("result") or "0x")
+            if len(results) != expected:
+                print(f"[warn] multicall returned {len(results)} results for {expected} calls", file=sys.stderr)
+                continue
+            yield from _group_reserves(group, results)
+        for group, _ in id_map.values():
+            print(f"[warn] no multicall reply for {len(group)} pools", file=sys.stderr)
+
+
+def anchor_prices(
+    reserves: List[Tuple[dict, int, int]], anchors: Dict[str, Tuple[str, int]], eth_usd: Optional[float]
+) -> Dict[str, float]:
+    """USD price per whole token for each anchor."""
+    prices = {addr: 1.0 for addr, (symbol, _) in anchors.items() if symbol != WETH_SYMBOL}
+    weth = next((addr for addr, (symbol, _) in anchors.items() if symbol == WETH_SYMBOL), None)
+    if weth is None:
+        return prices
+    if eth_usd is not None:
+        prices[weth] = eth_usd
+        return prices
+
+    # Deepest WETH/stablecoin pool by stablecoin reserve
+    best_depth = 0.0
+    for pool, r0, r1 in reserves:
+        pair = {pool["token0"]: r0, pool["token1"]: r1}
+        stable = next((a for a in pair if a in prices), None)
+        if weth not in pair or stable is None or pair[weth] == 0:
+            continue
+        stable_amount = pair[stable] / 10 ** anchors[stable][1]
+        if stable_amount > best_depth:
+            best_depth = stable_amount
+            prices[weth] = stable_amount / (pair[weth] / 10 ** anchors[weth][1])
+    return prices
+
+
+def liquidity_scores(
+    reserves: List[Tuple[dict, int, int]], anchors: Dict[str, Tuple[str, int]], prices: Dict[str, float]
+) -> Dict[str, dict]:
+    """address -> {rank, liquidity_usd, pools}, ranked by liquidity (ties by address)."""
+    totals: Dict[str, float] = defaultdict(float)
+    counts: Dict[str, int] = defaultdict(int)
+    for pool, r0, r1 in reserves:
+        sides = ((pool["token0"], r0), (pool["token1"], r1))
+        # Value the pool by its most valuable anchor side
+        value = max(
+            (amount / 10 ** anchors[token][1] * prices[token] for token, amount in sides if token in prices),
+            default=0.0,
+        )
+        if value <= 0:
+            continue
+        for token, _ in sides:
+            totals[token] += 2 * value
+            counts[token] += 1
+
+    ordered = sorted(totals.items(), key=lambda kv: (-kv[1], kv[0]))
+    return {
+        addr: {"rank": rank, "liquidity_usd": round(total, 2), "pools": counts[addr]}
+        for rank, (addr, total) in enumerate(ordered, start=1)
+    }
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Score tokens by on-chain pool liquidity against anchor assets.")
+    p.add_argument("--chain", type=int, required=True, help="Chain ID (e.g., 1 for Ethereum mainnet).")
+    p.add_argument("--rpc", required=True, help="HTTPS JSON-RPC endpoint for the specified chain.")
+    p.add_argument("--pools", type=Path, default=None,
+                   help="pools.jsonl to read (defaults to discover_tokens.py's state for the chain).")
+    p.add_argument("--out-root", type=Path, default=TOKEN_DATA_DIR, help="tokenData root containing <chain>/ dirs.")
+    p.add_argument("--batch-size", type=int, default=500, help="Pools per aggregate3 call.")
+    p.add_argument("--batches-per-request", type=int, default=4, help="aggregate3 calls per JSON-RPC request.")
+    p.add_argument("--eth-usd", type=float, default=None, help="Fixed WETH price instead of deriving it from pools.")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    anchors = ANCHORS.get(args.chain)
+    if not anchors:
+        print(f"Error: no anchor assets configured for chain {args.chain}", file=sys.stderr)
+        sys.exit(1)
+
+    pools_path = args.pools or STATE_DIR / str(args.chain) / "pools.jsonl"
+    pools = load_pools(pools_path, anchors)
+    if not pools:
+        print(f"Error: no anchor pools in {pools_path} (run discover_tokens.py first)", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        reserves = list(read_reserves(args.rpc, pools, args.batch_size, args.batches_per_request))
+    except requests.RequestException as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    prices = anchor_prices(reserves, anchors, args.eth_usd)
+    missing = [anchors[a][0] for a in anchors if a not in prices]
+    if missing:
+        print(f"Warning: no price for {', '.join(missing)}; their pools are not scored", file=sys.stderr)
+
+    scores = liquidity_scores(reserves, anchors, prices)
+    out_path = args.out_root / str(args.chain) / "liquidity.json"
+    write_json_atomic(out_path, scores, indent=2, sort_keys=True)
+    print(f"Read {len(reserves)} of {len(pools)} anchor pools; scored {len(scores)} tokens. Output: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
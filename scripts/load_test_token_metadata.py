@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Load-test token_metadata_service.py under bursty traffic and count upstream calls.
+
+Starts stand_in_upstream.py in a background thread, then runs the service
+in-process twice against it, once without and once with request coalescing,
+and replays the same traffic against both. The traffic is --bursts bursts.
+In each burst --clients clients arrive at once and ask for 1 to 3 of that
+burst's --hot freshly trending (uncached) addresses plus one token from our
+curated files, which mimics many users opening the app as a new token
+starts trending. --gap seconds pass between bursts.
+
+Prints upstream calls, addresses sent upstream, largest batch and client
+latency for each mode, then the reduction in upstream calls:
+
+  mode        calls  addresses  max batch    p50 ms    p95 ms
+  direct        ...
+  coalesced     ...
+
+Usage:
+  python scripts/load_test_token_metadata.py [--bursts 10] [--clients 200] [--hot 8] [--latency 0.12]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from stand_in_upstream import make_server
+from token_metadata_service import (
+    NETWORKS,
+    TOKEN_DATA_DIR,
+    Coalescer,
+    MetadataService,
+    TTLCache,
+    Upstream,
+    load_index,
+)
+
+
+async def _get(host: str, port: int, target: str) -> dict:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(f"GET {target} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode("latin-1"))
+        await writer.drain()
+        raw = await reader.read()
+    finally:
+        writer.close()
+    head, _, body = raw.partition(b"\r\n\r\n")
+    if not head.startswith(b"HTTP/1.1 200"):
+        raise RuntimeError(head.split(b"\r\n", 1)[0].decode("latin-1"))
+    return json.loads(body)
+
+
+def make_traffic(seed: int, bursts: int, clients: int, hot: int, known: List[str]) -> List[List[str]]:
+    """Per burst, one address list per client."""
+    rng = random.Random(seed)
+    traffic = []
+    for _ in range(bursts):
+        trending = [f"0x{rng.getrandbits(160):040x}" for _ in range(hot)]
+        traffic.append([rng.sample(trending, rng.randint(1, min(3, hot))) + [rng.choice(known)]
+                        for _ in range(clients)])
+    return traffic
+
+
+async def run_mode(
+    coalesce: bool, index: Dict[int, Dict[str, dict]], upstream_url: str, traffic: List[List[List[str]]],
+    network: str, gap: float, window: float, pool_size: int,
+) -> Dict[str, float]:
+    upstream = Upstream(upstream_url, None, pool_size)
+    service = MetadataService(index, Coalescer(upstream, window) if coalesce else upstream, TTLCache(100000))
+    server = await asyncio.start_server(service.handle_connection, "127.0.0.1", 0, backlog=1024)
+    port = server.sockets[0].getsockname()[1]
+    latencies: List[float] = []
+
+    async def client(addresses: List[str]) -> None:
+        start = time.perf_counter()
+        result = await _get("127.0.0.1", port, f"/api/token-metadata?network={network}&addresses={','.join(addresses)}")
+        latencies.append(time.perf_counter() - start)
+        if result["count"] != len(addresses):
+            raise RuntimeError(f"expected {len(addresses)} tokens, got {result['count']}")
+
+    try:
+        for burst in traffic:
+            await asyncio.gather(*(client(addresses) for addresses in burst))
+            await asyncio.sleep(gap)
+    finally:
+        server.close()
+        await server.wait_closed()
+        upstream.close()
+
+    latencies.sort()
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Compare upstream call volume with and without request coalescing.")
+    p.add_argument("--bursts", type=int, default=10, help="Number of traffic bursts.")
+    p.add_argument("--clients", type=int, default=200, help="Concurrent clients per burst.")
+    p.add_argument("--hot", type=int, default=8, help="New trending addresses per burst.")
+    p.add_argument("--gap", type=float, default=0.2, help="Seconds between bursts.")
+    p.add_argument("--latency", type=float, default=0.12, help="Stand-in upstream latency in seconds.")
+    p.add_argument("--window", type=float, default=0.01, help="Coalescing window in seconds.")
+    p.add_argument("--pool-size", type=int, default=8, help="Upstream connections and worker threads.")
+    p.add_argument("--network", default="ethereum", choices=sorted(NETWORKS), help="Network to query.")
+    p.add_argument("--out-root", type=Path, default=TOKEN_DATA_DIR, help="tokenData root containing <chain>/ dirs.")
+    p.add_argument("--seed", type=int, default=1, help="Traffic RNG seed.")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    chain_id = NETWORKS[args.network][1]
+    index = load_index(args.out_root, None, (chain_id,))
+    known = sorted(index[chain_id]) or ["0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48"]
+    traffic = make_traffic(args.seed, args.bursts, args.clients, args.hot, known)
+
+    upstream_server = make_server("127.0.0.1", 0, args.latency)
+    threading.Thread(target=upstream_server.serve_forever, daemon=True).start()
+    upstream_url = f"http://127.0.0.1:{upstream_server.server_address[1]}"
+
+    results = {}
+    try:
+        for mode, coalesce in (("direct", False), ("coalesced", True)):
+            upstream_server.stats.reset()
+            latency = asyncio.run(run_mode(
+                coalesce, index, upstream_url, traffic, args.network, args.gap, args.window, args.pool_size
+            ))
+            results[mode] = {**upstream_server.stats.snapshot(), **latency}
+    finally:
+        upstream_server.shutdown()
+        upstream_server.server_close()
+
+    requests_sent = args.bursts * args.clients
+    print(f"{requests_sent} requests in {args.bursts} bursts of {args.clients}, "
+          f"{args.hot} new addresses per burst, upstream latency {args.latency * 1000:.0f} ms")
+    print(f"{'mode':<10} {'calls':>7} {'addresses':>10} {'max batch':>10} {'p50 ms':>9} {'p95 ms':>9}")
+    for mode, r in results.items():
+        print(f"{mode:<10} {r['calls']:>7} {r['addresses']:>10} {r['maxAddresses']:>10} "
+              f"{r['p50_ms']:>9.1f} {r['p95_ms']:>9.1f}")
+    direct, coalesced = results["direct"]["calls"], results["coalesced"]["calls"]
+    if direct:
+        print(f"Upstream calls: {direct} -> {coalesced} ({100 * (1 - coalesced / direct):.1f}% fewer)")
+
+
+if __name__ == "__main__":
+    main()
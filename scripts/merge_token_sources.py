@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Merge per-source token metadata into address_to_metadata.json in one pass.
+
+Each source is a lowercased address -> {name, ticker, icon, decimals} map:
+  - rpc:         address_to_metadata.json written by get_token_data.py
+  - coingecko:   scripts/data/coingecko_tokens_<chain>.json, the GeckoTerminal
+                 top-pools records written by top_pools_to_metadata.py
+  - trustwallet: scripts/data/trust_tokens_<chain>.jsonl, or a record map from
+                 trust_wallet_assets.py --records-out
+  - existing:    the current address_to_metadata.json (hand-curated entries)
+
+Every field is resolved independently: the first source in FIELD_PRECEDENCE
+with a non-empty value wins. The winning source per field is written to the
+address_to_metadata.provenance.json sidecar, so re-running the merge gives the
+same result regardless of which ingest script ran last.
+
+Icons rewritten by mirror_icons.py --in-place are kept: when the winning icon
+URL is the one address_to_metadata.icon_origins.json records for the token,
+the existing mirrored path stays. A token whose source URL changed gets the
+new URL and is mirrored again on the next mirror_icons.py run.
+
+Usage:
+  python scripts/merge_token_sources.py --chain 1 --rpc out/1/address_to_metadata.json \
+      [--coingecko cg/1.json] [--trust records/1.json] [--no-existing]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from atomic_json import write_json_atomic
+from mirror_icons import ORIGINS_FILE
+from token_data_common import DATA_DIR, TOKEN_DATA_DIR, load_json
+from trust_tokens import load_trust_tokens
+
+FIELDS = ("name", "ticker", "icon", "decimals")
+
+# Per-field source order, most trusted first.
+FIELD_PRECEDENCE: Dict[str, Tuple[str, ...]] = {
+    "name":     ("trustwallet", "coingecko", "rpc", "existing"),
+    "ticker":   ("trustwallet", "rpc", "coingecko", "existing"),
+    "icon":     ("trustwallet", "coingecko", "existing", "rpc"),
+    "decimals": ("rpc", "trustwallet", "coingecko", "existing"),
+}
+
+
+def _has_value(value) -> bool:
+    if value is None:
+        return False
+    if isinstance(value, str):
+        return bool(value.strip())
+    return True
+
+
+def trust_records(chain_id: int, tokenlist_root: Optional[Path] = None) -> Dict[str, dict]:
+    """Trust Wallet tokenlist entries for chain_id in record form."""
+    return {
+        t["address"].lower(): {
+            "name": t.get("name"),
+            "ticker": t.get("symbol"),
+            "icon": t.get("logoURI"),
+            "decimals": t.get("decimals"),
+        }
+        for t in load_trust_tokens(chain_id, tokenlist_root)
+        if t.get("address")
+    }
+
+
+def merge_sources(
+    sources: Dict[str, Dict[str, dict]], icon_origins: Optional[Dict[str, str]] = None
+) -> Tuple[Dict[str, dict], Dict[str, Dict[str, str]]]:
+    """
+    Returns (address -> merged metadata, address -> field -> winning source),
+    in address order. icon_origins maps addresses to the URL their existing
+    (mirrored) icon was made from; if that URL wins, the mirrored icon is kept.
+    """
+    icon_origins = icon_origins or {}
+    lowered = {
+        name: {addr.lower(): meta for addr, meta in records.items() if isinstance(meta, dict)}
+        for name, records in sources.items()
+    }
+    merged: Dict[str, dict] = {}
+    provenance: Dict[str, Dict[str, str]] = {}
+    empty: dict = {}
+
+    for addr in sorted(set().union(*lowered.values())):
+        by_source = {name: records.get(addr, empty) for name, records in lowered.items()}
+        meta: Dict[str, object] = {}
+        origin: Dict[str, str] = {}
+        for field in FIELDS:
+            meta[field] = None
+            for source in FIELD_PRECEDENCE[field]:
+                value = by_source.get(source, {}).get(field)
+                if _has_value(value):
+                    meta[field] = value
+                    origin[field] = source
+                    break
+        mirrored = by_source.get("existing", {}).get("icon")
+        if _has_value(mirrored) and meta["icon"] == icon_origins.get(addr):
+            meta["icon"] = mirrored
+        merged[addr] = meta
+        provenance[addr] = origin
+
+    return merged, provenance
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Merge RPC, CoinGecko and Trust Wallet token metadata with per-field precedence.")
+    p.add_argument("--chain", type=int, required=True, help="Chain ID (e.g., 1 for Ethereum mainnet).")
+    p.add_argument("--rpc", type=Path, default=None, help="address_to_metadata.json produced by get_token_data.py.")
+    p.add_argument("--coingecko", type=Path, default=None,
+                   help="CoinGecko token record map (defaults to scripts/data/coingecko_tokens_<chain>.json).")
+    p.add_argument("--trust", type=Path, default=None,
+                   help="Trust Wallet record map (defaults to scripts/data/trust_tokens_<chain>.jsonl).")
+    p.add_argument("--no-existing", action="store_true",
+                   help="Rebuild from the given sources only, dropping entries no source provides.")
+    p.add_argument("--out-root", type=Path, default=None,
+                   help="Root output directory (defaults to src/utils/tokenData).")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    out_dir = (args.out_root or TOKEN_DATA_DIR) / str(args.chain)
+    out_path = out_dir / "address_to_metadata.json"
+
+    sources: Dict[str, Dict[str, dict]] = {}
+    if args.rpc is not None:
+        sources["rpc"] = load_json(args.rpc)
+    sources["coingecko"] = load_json(args.coingecko or DATA_DIR / f"coingecko_tokens_{args.chain}.json")
+    sources["trustwallet"] = load_json(args.trust) if args.trust is not None else trust_records(args.chain)
+    icon_origins: Dict[str, str] = {}
+    if not args.no_existing:
+        sources["existing"] = load_json(out_path)
+        icon_origins = load_json(out_dir / ORIGINS_FILE)
+
+    merged, provenance = merge_sources(sources, icon_origins)
+    if not merged:
+        print("Error: no token records found in any source.", file=sys.stderr)
+        sys.exit(1)
+
+    write_json_atomic(out_path, merged, indent=2, sort_keys=True)
+    write_json_atomic(out_dir / "address_to_metadata.provenance.json", provenance, indent=2, sort_keys=True)
+
+    counts = {name: len(records) for name, records in sources.items()}
+    print(f"Merged {len(merged)} tokens from {counts}. Output: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Mirror token icons into a local static dir as normalized 64/128 px WebP.
+
+`icon` values point at the Trust Wallet CDN, smold.app (make_icon_url) and
+CoinGecko/GeckoTerminal, at whatever size and format each host serves. This
+stage fetches every icon URL concurrently through one pooled session, pads
+it to a square on a transparent background, resizes it to 64 and 128 px and
+writes
+
+  <out-dir>/<id>-64.webp
+  <out-dir>/<id>-128.webp
+
+where <id> is the first 16 hex digits of the sha256 of the normalized 128 px
+pixels. Identical images therefore share one file pair however many tokens
+or URLs use them. Identical source bytes are not even decoded twice.
+
+It is incremental. The state file stores, per source URL, its ETag,
+Last-Modified, source sha256 and icon id. URLs checked within
+--refresh-after are skipped. Older ones are revalidated with a conditional
+GET, so an unchanged icon costs a 304 and no image work. Failed URLs (HTTP
+errors, SVG or other undecodable bodies) are retried after --retry-after.
+Meanwhile they keep their mirrored icon if they had one, and their original
+URL otherwise.
+
+Writes per chain address_to_metadata.mirrored.json, with each mirrored
+`icon` rewritten to <url-prefix><id>-128.webp (swap -128 for -64 for the
+small size). With --in-place, address_to_metadata.json itself is rewritten
+and the original URLs go to <chain>/address_to_metadata.icon_origins.json
+(checked in next to it, not published), so later runs can still revalidate
+them without the state file. merge_token_sources.py reads the same file and
+keeps a mirrored icon while its source URL still wins the merge, so the
+merge can be re-run after mirroring.
+
+--prune deletes icon files that no chain's metadata references, whether or
+not the chain was part of this run, and drops state for URLs no token uses.
+
+Needs Pillow with WebP support (pip install Pillow). --origin-override
+sends every request to another origin (e.g. stand_in_icon_server.py) with
+the original host as the first path segment; state stays keyed by the
+original URL.
+
+Usage:
+  python scripts/mirror_icons.py [--chain 1] [--workers 16] [--in-place] [--prune]
+  python scripts/mirror_icons.py --origin-override http://127.0.0.1:8548 --out-dir /tmp/icons
+"""
+
+import argparse
+import hashlib
+import io
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from atomic_json import write_bytes_atomic, write_json_atomic
+from token_data_common import CHAIN_IDS, DATA_DIR, REPO_ROOT, TOKEN_DATA_DIR, load_json
+
+try:
+    from PIL import Image
+except ImportError:  # checked in main(); only this stage needs it
+    Image = None
+
+DEFAULT_OUT_DIR = REPO_ROOT / "public" / "token-icons"
+DEFAULT_STATE = DATA_DIR / "icon_mirror_state.json"
+
+SIZES = (64, 128)
+WEBP_QUALITY = 85
+WEBP_METHOD = 5  # 6 is ~30x slower for a few bytes per icon
+MAX_ICON_BYTES = 2 * 1024 * 1024
+ORIGINS_FILE = "address_to_metadata.icon_origins.json"
+_ICON_FILE_RE = re.compile(r"^([0-9a-f]{16})-\d+\.webp$")
+
+
+def _icon_files_exist(out_dir: Path, icon_id: str) -> bool:
+    return all((out_dir / f"{icon_id}-{size}.webp").exists() for size in SIZES)
+
+
+def normalize_icon(body: bytes, out_dir: Path) -> str:
+    """Write the WebP sizes of body and return their icon id. Raises on undecodable input."""
+    with Image.open(io.BytesIO(body)) as im:
+        im.seek(0)  # first frame of animated GIF/WebP
+        rgba = im.convert("RGBA")
+    side = max(rgba.size)
+    canvas = Image.new("RGBA", (side, side), (0, 0, 0, 0))
+    canvas.paste(rgba, ((side - rgba.width) // 2, (side - rgba.height) // 2))
+
+    resized = {size: canvas.resize((size, size), Image.LANCZOS) for size in SIZES}
+    icon_id = hashlib.sha256(resized[max(SIZES)].tobytes()).hexdigest()[:16]
+    for size, img in resized.items():
+        path = out_dir / f"{icon_id}-{size}.webp"
+        if path.exists():
+            continue
+        buf = io.BytesIO()
+        img.save(buf, "WEBP", quality=WEBP_QUALITY, method=WEBP_METHOD)
+        write_bytes_atomic(path, buf.getvalue())
+    return icon_id
+
+
+def request_url(url: str, origin_override: Optional[str]) -> str:
+    if not origin_override:
+        return url
+    parts = urlsplit(url)
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{origin_override.rstrip('/')}/{parts.netloc}{parts.path}{query}"
+
+
+def mirror_one(
+    session: requests.Session,
+    url: str,
+    previous: dict,
+    sources: Dict[str, str],
+    out_dir: Path,
+    origin_override: Optional[str],
+    timeout: float,
+) -> Tuple[dict, str]:
+    """
+    Returns (new state entry, outcome) with outcome one of unchanged/fetched/encoded/error.
+    A failed revalidation keeps the previous icon and validators, so a
+    transient error does not unmirror the token.
+    """
+    now = int(time.time())
+    headers = {}
+    mirrored = bool(previous.get("icon")) and _icon_files_exist(out_dir, previous["icon"])
+    if mirrored:
+        if previous.get("etag"):
+            headers["If-None-Match"] = previous["etag"]
+        if previous.get("lastModified"):
+            headers["If-Modified-Since"] = previous["lastModified"]
+    kept = {k: v for k, v in previous.items() if k not in ("error", "checked")} if mirrored else {}
+
+    try:
+        resp = session.get(request_url(url, origin_override), headers=headers, timeout=timeout)
+    except requests.RequestException as e:
+        return {**kept, "error": type(e).__name__, "checked": now}, "error"
+    if resp.status_code == 304 and headers:
+        return {**kept, "checked": now}, "unchanged"
+    if resp.status_code != 200:
+        return {**kept, "error": f"HTTP {resp.status_code}", "checked": now}, "error"
+    body = resp.content
+    if len(body) > MAX_ICON_BYTES:
+        return {**kept, "error": "too large", "checked": now}, "error"
+
+    entry = {
+        "etag": resp.headers.get("ETag"),
+        "lastModified": resp.headers.get("Last-Modified"),
+        "sha256": hashlib.sha256(body).hexdigest(),
+        "checked": now,
+    }
+    icon_id = sources.get(entry["sha256"])
+    if icon_id and _icon_files_exist(out_dir, icon_id):
+        return {**entry, "icon": icon_id}, "fetched"
+    try:
+        icon_id = normalize_icon(body, out_dir)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return {**kept, "error": "undecodable", "checked": now}, "error"
+    sources[entry["sha256"]] = icon_id
+    return {**entry, "icon": icon_id}, "encoded"
+
+
+def _needs_check(entry: Optional[dict], now: int, refresh_after: float, retry_after: float) -> bool:
+    if not entry:
+        return True
+    age = now - entry.get("checked", 0)
+    return age >= (retry_after if entry.get("error") or not entry.get("icon") else refresh_after)
+
+
+def referenced_icons(out_root: Path, chain_ids, url_prefix: str) -> Tuple[set, set]:
+    """(icon ids, source URLs) referenced by the metadata files and icon origins on disk for chain_ids."""
+    icon_ids, urls = set(), set()
+    for chain_id in chain_ids:
+        chain_dir = out_root / str(chain_id)
+        origins = load_json(chain_dir / ORIGINS_FILE)
+        urls.update(u for u in origins.values() if isinstance(u, str))
+        for name in ("address_to_metadata.json", "address_to_metadata.mirrored.json"):
+            for addr, meta in load_json(chain_dir / name).items():
+                icon = meta.get("icon") if isinstance(meta, dict) else None
+                if not isinstance(icon, str):
+                    continue
+                if icon.startswith(url_prefix):
+                    m = _ICON_FILE_RE.match(icon[len(url_prefix):])
+                    if m:
+                        icon_ids.add(m.group(1))
+                elif icon.startswith(("https://", "http://")):
+                    urls.add(icon)
+    return icon_ids, urls
+
+
+def prune(out_dir: Path, keep: set) -> int:
+    removed = 0
+    for path in out_dir.glob("*.webp"):
+        m = _ICON_FILE_RE.match(path.name)
+        if m and m.group(1) not in keep:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Mirror token icons as content-addressed 64/128 px WebP files.")
+    p.add_argument("--chain", type=int, action="append", help="Chain ID (repeatable). Defaults to all chains.")
+    p.add_argument("--out-root", type=Path, default=TOKEN_DATA_DIR, help="tokenData root containing <chain>/ dirs.")
+    p.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR, help="Directory for the WebP files.")
+    p.add_argument("--url-prefix", default="/token-icons/", help="Public URL prefix of --out-dir.")
+    p.add_argument("--state", type=Path, default=DEFAULT_STATE, help="Incremental state file.")
+    p.add_argument("--workers", type=int, default=16, help="Concurrent downloads.")
+    p.add_argument("--timeout", type=float, default=15.0, help="Per-request timeout in seconds.")
+    p.add_argument("--refresh-after", type=float, default=7 * 86400, help="Seconds before a mirrored URL is revalidated.")
+    p.add_argument("--retry-after", type=float, default=86400, help="Seconds before a failed URL is retried.")
+    p.add_argument("--origin-override", default=None, help="Fetch from this origin instead (testing).")
+    p.add_argument("--in-place", action="store_true", help="Rewrite address_to_metadata.json itself.")
+    p.add_argument("--prune", action="store_true", help="Delete icon files and state no token references.")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    if Image is None:
+        print("Error: Pillow is required to mirror icons (pip install Pillow).", file=sys.stderr)
+        sys.exit(1)
+
+    state = load_json(args.state)
+    urls: Dict[str, dict] = state.setdefault("urls", {})
+    sources: Dict[str, str] = state.setdefault("sources", {})
+
+    chain_ids = args.chain or CHAIN_IDS
+    metadata: Dict[int, Dict[str, dict]] = {}
+    origins: Dict[int, Dict[str, str]] = {}
+    wanted: Dict[Tuple[int, str], str] = {}
+    for chain_id in chain_ids:
+        chain_dir = args.out_root / str(chain_id)
+        metadata[chain_id] = load_json(chain_dir / "address_to_metadata.json")
+        origins[chain_id] = load_json(chain_dir / ORIGINS_FILE)
+        for addr, meta in metadata[chain_id].items():
+            icon = meta.get("icon") if isinstance(meta, dict) else None
+            if isinstance(icon, str) and icon.startswith(args.url_prefix):
+                icon = origins[chain_id].get(addr)
+            if isinstance(icon, str) and icon.startswith(("https://", "http://")):
+                wanted[(chain_id, addr)] = icon
+
+    now = int(time.time())
+    todo = sorted(u for u in set(wanted.values()) if _needs_check(urls.get(u), now, args.refresh_after, args.retry_after))
+    print(f"{len(set(wanted.values()))} icon URLs for {len(wanted)} tokens; checking {len(todo)}")
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=args.workers)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+
+    outcomes: Dict[str, int] = {"unchanged": 0, "fetched": 0, "encoded": 0, "error": 0}
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = [
+            (url, executor.submit(mirror_one, session, url, urls.get(url, {}), sources, args.out_dir,
+                                  args.origin_override, args.timeout))
+            for url in todo
+        ]
+        for done, (url, future) in enumerate(futures, start=1):
+            entry, outcome = future.result()
+            urls[url] = entry
+            outcomes[outcome] += 1
+            if done % 500 == 0:
+                print(f"  {done}/{len(todo)} checked")
+
+    for chain_id in chain_ids:
+        chain_dir = args.out_root / str(chain_id)
+        rewritten = 0
+        out = {}
+        chain_origins: Dict[str, str] = {}
+        for addr, meta in metadata[chain_id].items():
+            url = wanted.get((chain_id, addr))
+            icon_id = urls.get(url, {}).get("icon") if url else None
+            if icon_id:
+                meta = {**meta, "icon": f"{args.url_prefix}{icon_id}-{max(SIZES)}.webp"}
+                chain_origins[addr] = url
+                rewritten += 1
+            elif url:
+                meta = {**meta, "icon": url}
+            out[addr] = meta
+        if args.in_place:
+            # Written first: the rewritten metadata is only usable with its origins on record
+            write_json_atomic(chain_dir / ORIGINS_FILE, chain_origins, indent=2, sort_keys=True)
+        name = "address_to_metadata.json" if args.in_place else "address_to_metadata.mirrored.json"
+        out_path = chain_dir / name
+        write_json_atomic(out_path, out, indent=2 if args.in_place else None, sort_keys=True)
+        print(f"Chain {chain_id}: {rewritten} of {len(out)} icons mirrored. Output: {out_path}")
+
+    if args.prune:
+        # Every chain on disk, not just this run's, so a --chain subset never deletes other chains' icons
+        keep, live = referenced_icons(args.out_root, sorted(set(CHAIN_IDS) | set(chain_ids)), args.url_prefix)
+        for url in [u for u in urls if u not in live]:
+            del urls[url]
+        keep.update(entry["icon"] for entry in urls.values() if entry.get("icon"))
+        for sha in [s for s, icon_id in sources.items() if icon_id not in keep]:
+            del sources[sha]
+        print(f"Pruned {prune(args.out_dir, keep)} unreferenced icon files")
+
+    write_json_atomic(args.state, state, indent=None, sort_keys=True)
+    unique = len({entry["icon"] for entry in urls.values() if entry.get("icon")})
+    print(f"{outcomes['unchanged']} unchanged (304), {outcomes['fetched']} fetched with known content, "
+          f"{outcomes['encoded']} encoded, {outcomes['error']} failed; {unique} unique icons in {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Publish token-data artifacts as minified, precompressed, content-hashed files.
+
+For every client-facing artifact under src/utils/tokenData/<chain>/ (JSON
+outputs, shards, .bin files and version patches; provenance and icon-origin
+sidecars and full version snapshots are internal and skipped) this writes to
+<out-dir>/<chain>/ (and cross-chain files such as cross_chain_map.json to <out-dir>/):
+
+  <stem>.<hash><ext>        minified bytes (JSON re-encoded without whitespace)
+  <stem>.<hash><ext>.gz     gzip level 9, mtime 0 so output is reproducible
+  <stem>.<hash><ext>.br     brotli quality 11 (needs `pip install brotli`;
+                            --no-brotli publishes without .br variants)
+
+<hash> is the first 12 hex chars of the sha256 of the minified bytes, so every
+file name is immutable and can be served with
+`Cache-Control: public, max-age=31536000, immutable`. <out-dir>/manifest.json
+maps logical names (e.g. "1/address_to_metadata.json") to the hashed files and
+is the only file that must be revalidated. A --chain run replaces only that
+chain's entries (and the root-level files) in an existing manifest, so
+--prune never removes another chain's files.
+
+Nothing is written unless validate_token_data.py passes for the same chains.
+
+Usage:
+  python scripts/publish_token_data.py [--out-dir public/token-data] [--prune] [--no-brotli]
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import List
+
+from atomic_json import write_bytes_atomic, write_json_atomic
+from token_data_common import CHAIN_IDS, REPO_ROOT, TOKEN_DATA_DIR
+from validate_token_data import report, validate
+
+try:
+    import brotli
+except ImportError:  # checked in main(); only --no-brotli runs can do without it
+    brotli = None
+
+DEFAULT_OUT_DIR = REPO_ROOT / "public" / "token-data"
+MANIFEST_VERSION = 1
+HASH_LEN = 12
+# Sidecars kept next to the exports for the pipeline, never served to clients
+INTERNAL_SUFFIXES = (".provenance.json", ".icon_origins.json")
+
+
+def collect_artifacts(root: Path, chain_ids) -> List[Path]:
+    """Client-facing artifacts for the given chains (plus cross-chain files at the root), in a stable order."""
+    paths: List[Path] = sorted(root.glob("*.json"))
+    for chain_id in chain_ids:
+        chain_dir = root / str(chain_id)
+        for pattern in ("*.json", "*.bin", "shards/*.json", "versions/patch_*.json"):
+            paths.extend(p for p in sorted(chain_dir.glob(pattern)) if not p.name.endswith(INTERNAL_SUFFIXES))
+    return paths
+
+
+def minify(path: Path) -> bytes:
+    raw = path.read_bytes()
+    if path.suffix != ".json":
+        return raw
+    data = json.loads(raw)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _variant_info(path: Path, payload: bytes, out_dir: Path) -> dict:
+    written = write_bytes_atomic(path, payload)
+    return {"file": path.relative_to(out_dir).as_posix(), "bytes": len(payload), "written": written}
+
+
+def publish_artifact(src: Path, logical: str, out_dir: Path, with_brotli: bool = True) -> dict:
+    payload = minify(src)
+    digest = hashlib.sha256(payload).hexdigest()
+    logical_path = Path(logical)
+    hashed = out_dir / logical_path.parent / f"{logical_path.stem}.{digest[:HASH_LEN]}{logical_path.suffix}"
+
+    entry = {"sha256": digest, **_variant_info(hashed, payload, out_dir)}
+    entry["gzip"] = _variant_info(hashed.with_name(hashed.name + ".gz"), gzip.compress(payload, 9, mtime=0), out_dir)
+    if with_brotli:
+        entry["br"] = _variant_info(hashed.with_name(hashed.name + ".br"), brotli.compress(payload, quality=11), out_dir)
+    return entry
+
+
+def merge_base(manifest_path: Path, chain_ids) -> dict:
+    """
+    The existing manifest minus the entries this run republishes (the given
+    chains and root-level files), so a --chain run keeps the other chains.
+    """
+    try:
+        with manifest_path.open("r", encoding="utf-8") as f:
+            existing = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        existing = {}
+    if not isinstance(existing, dict) or existing.get("version") != MANIFEST_VERSION:
+        return {"version": MANIFEST_VERSION, "files": {}}
+    republished = {str(chain_id) for chain_id in chain_ids}
+    files = {
+        logical: entry
+        for logical, entry in existing.get("files", {}).items()
+        if "/" in logical and logical.split("/", 1)[0] not in republished
+    }
+    return {"version": MANIFEST_VERSION, "files": files}
+
+
+def prune(out_dir: Path, manifest: dict) -> int:
+    """Remove hashed files no longer referenced by the manifest."""
+    keep = {"manifest.json"}
+    for entry in manifest["files"].values():
+        keep.add(entry["file"])
+        for variant in ("gzip", "br"):
+            if variant in entry:
+                keep.add(entry[variant]["file"])
+    removed = 0
+    for path in out_dir.rglob("*"):
+        if path.is_file() and path.relative_to(out_dir).as_posix() not in keep:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Write minified, gzip and brotli content-hashed token-data artifacts.")
+    p.add_argument("--chain", type=int, action="append", help="Chain ID (repeatable). Defaults to all chains.")
+    p.add_argument("--src-root", type=Path, default=TOKEN_DATA_DIR, help="tokenData root containing <chain>/ dirs.")
+    p.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR, help="Publish directory (served statically).")
+    p.add_argument("--prune", action="store_true", help="Delete hashed files not referenced by the new manifest.")
+    p.add_argument("--no-brotli", action="store_true", help="Publish without .br variants.")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    if brotli is None and not args.no_brotli:
+        print("Error: the 'brotli' package is required for .br variants (pip install brotli, "
+              "or pass --no-brotli to publish without them).", file=sys.stderr)
+        sys.exit(1)
+
+    chain_ids = args.chain or CHAIN_IDS
+    if report(validate(args.src_root, chain_ids)):
+        print("Error: token data failed validation; nothing published.", file=sys.stderr)
+        sys.exit(1)
+
+    artifacts = collect_artifacts(args.src_root, chain_ids)
+    if not artifacts:
+        print(f"Error: no artifacts found under {args.src_root}", file=sys.stderr)
+        sys.exit(1)
+
+    manifest = merge_base(args.out_dir / "manifest.json", chain_ids)
+    totals = {"raw": 0, "min": 0, "gzip": 0, "br": 0}
+    written = 0
+    for src in artifacts:
+        logical = src.relative_to(args.src_root).as_posix()
+        entry = publish_artifact(src, logical, args.out_dir, not args.no_brotli)
+        written += sum(1 for v in (entry, entry["gzip"], entry.get("br")) if v and v.pop("written"))
+        manifest["files"][logical] = entry
+        totals["raw"] += src.stat().st_size
+        totals["min"] += entry["bytes"]
+        totals["gzip"] += entry["gzip"]["bytes"]
+        totals["br"] += entry.get("br", {}).get("bytes", 0)
+
+    write_json_atomic(args.out_dir / "manifest.json", manifest, indent=2, sort_keys=True)
+    removed = prune(args.out_dir, manifest) if args.prune else 0
+
+    print(f"Published {len(artifacts)} artifacts ({written} files written, {removed} pruned) to {args.out_dir}")
+    print(f"  raw {totals['raw']} -> minified {totals['min']} -> gzip {totals['gzip']}"
+          + ("" if args.no_brotli else f" / brotli {totals['br']}") + " bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Resolve tickers and names to the best token address by liquidity and trust.
+
+Several tokens often share a ticker (USDC, plus bridged copies and
+impostors). Instead of letting input order decide and numbering the rest
+(USDC2, USDC3, ...), every candidate gets a score:
+
+  score = log10(1 + 24h volume USD)       from <chain>/popularity.json
+        + log10(1 + pool liquidity USD)   from <chain>/liquidity.json
+        + SOURCE_TRUST[source]            ticker/name source from the provenance sidecar
+
+and the highest score wins. Ties (e.g. no market data yet) go to the address
+the existing map already resolves the key to, then to the earlier entry in
+address_to_metadata.json. Matching is case-insensitive and whitespace-trimmed;
+every spelling seen in a group maps to the group's winner, so lookups for
+"USDC" and "usdc" agree. All tickers and names are ranked in one sort over
+(kind, key, -score, incumbent, position) followed by a single grouped scan.
+
+Writes per chain:
+  - tickers_to_address.json / names_to_address.json: key -> best address
+  - lookup_candidates.json: {"tickers": {key: [[address, score], ...]},
+                             "names":   {...}}, best first, for keys with more
+                             than one candidate
+
+Missing popularity/liquidity/provenance files simply contribute 0.
+
+Usage:
+  python scripts/resolve_tickers.py [--chain 1] [--out-root src/utils/tokenData]
+"""
+
+import argparse
+import math
+import sys
+from itertools import groupby
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from atomic_json import write_json_atomic
+from token_data_common import CHAIN_IDS, TOKEN_DATA_DIR, load_json
+
+
+# Added to the score of a candidate whose ticker/name came from this source.
+# Small next to log10 volume, so it mostly separates tokens with no market data.
+SOURCE_TRUST: Dict[str, float] = {
+    "trustwallet": 2.0,
+    "coingecko": 1.0,
+    "rpc": 0.5,
+    "existing": 0.5,
+}
+
+# Field in the metadata record and provenance sidecar for each lookup kind
+LOOKUP_FIELDS = (("tickers", "ticker"), ("names", "name"))
+
+
+def market_score(volume_usd: float, liquidity_usd: float) -> float:
+    return math.log10(1 + max(volume_usd, 0.0)) + math.log10(1 + max(liquidity_usd, 0.0))
+
+
+def resolve_lookups(
+    metadata: Dict[str, dict],
+    popularity: Optional[Dict[str, dict]] = None,
+    liquidity: Optional[Dict[str, dict]] = None,
+    provenance: Optional[Dict[str, Dict[str, str]]] = None,
+    incumbents: Optional[Dict[str, Dict[str, str]]] = None,
+) -> Tuple[Dict[str, Dict[str, str]], Dict[str, Dict[str, List[list]]]]:
+    """
+    Returns (kind -> key -> best address, kind -> key -> ranked [address, score]
+    for ambiguous keys), kind being "tickers" or "names". incumbents is the
+    current kind -> key -> address map, used only to break score ties.
+    """
+    popularity = popularity or {}
+    liquidity = liquidity or {}
+    provenance = provenance or {}
+    current = {
+        (kind, key.strip().lower(), addr.lower())
+        for kind, mapping in (incumbents or {}).items()
+        for key, addr in mapping.items()
+        if isinstance(addr, str)
+    }
+
+    rows = []
+    empty: dict = {}
+    for position, (addr, meta) in enumerate(metadata.items()):
+        if not isinstance(meta, dict):
+            continue
+        market = market_score(
+            popularity.get(addr, empty).get("volume_usd_h24") or 0.0,
+            liquidity.get(addr, empty).get("liquidity_usd") or 0.0,
+        )
+        origin = provenance.get(addr, empty)
+        for kind, field in LOOKUP_FIELDS:
+            value = meta.get(field)
+            if not isinstance(value, str) or not value.strip():
+                continue
+            spelling = value.strip()
+            key = spelling.lower()
+            score = market + SOURCE_TRUST.get(origin.get(field, ""), 0.0)
+            rows.append((kind, key, -score, (kind, key, addr) not in current, position, addr, spelling))
+
+    rows.sort()
+
+    best: Dict[str, Dict[str, str]] = {kind: {} for kind, _ in LOOKUP_FIELDS}
+    candidates: Dict[str, Dict[str, List[list]]] = {kind: {} for kind, _ in LOOKUP_FIELDS}
+    for (kind, _), group in groupby(rows, key=lambda row: row[:2]):
+        group = list(group)
+        winner = group[0]
+        for spelling in sorted({row[6] for row in group}):
+            best[kind][spelling] = winner[5]
+        if len(group) > 1:
+            candidates[kind][winner[6]] = [[row[5], round(-row[2], 4)] for row in group]
+    return best, candidates
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Map tickers and names to their most liquid, most trusted token address.")
+    p.add_argument("--chain", type=int, action="append", help="Chain ID (repeatable). Defaults to all chains.")
+    p.add_argument("--out-root", type=Path, default=TOKEN_DATA_DIR, help="tokenData root containing <chain>/ dirs.")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    for chain_id in args.chain or CHAIN_IDS:
+        chain_dir = args.out_root / str(chain_id)
+        metadata = load_json(chain_dir / "address_to_metadata.json")
+        if not metadata:
+            print(f"Warning: no metadata for chain {chain_id} in {chain_dir}", file=sys.stderr)
+            continue
+
+        best, candidates = resolve_lookups(
+            metadata,
+            popularity=load_json(chain_dir / "popularity.json"),
+            liquidity=load_json(chain_dir / "liquidity.json"),
+            provenance=load_json(chain_dir / "address_to_metadata.provenance.json"),
+            incumbents={
+                "tickers": load_json(chain_dir / "tickers_to_address.json"),
+                "names": load_json(chain_dir / "names_to_address.json"),
+            },
+        )
+        write_json_atomic(chain_dir / "tickers_to_address.json", best["tickers"], indent=2, sort_keys=True)
+        write_json_atomic(chain_dir / "names_to_address.json", best["names"], indent=2, sort_keys=True)
+        write_json_atomic(chain_dir / "lookup_candidates.json", candidates, indent=None, sort_keys=True)
+
+        print(f"Chain {chain_id}: {len(best['tickers'])} tickers ({len(candidates['tickers'])} ambiguous), "
+              f"{len(best['names'])} names ({len(candidates['names'])} ambiguous). Output: {chain_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Build a precomputed token search index matching src/utils/tokenSearch.ts.
+
+tokenSearch.ts derives nameNorm, tickerNorm and nameWords for every token at
+module load. This script does the same offline with a Python port of its
+normalize() and writes <out-root>/<chain>/search_index.json in a columnar
+layout (one array per field, all of length `count`):
+
+  {
+    "version": 1, "chain": 1, "count": N,
+    "address":    [lowercased address, ...],
+    "name":       [raw name or null, ...],
+    "ticker":     [raw ticker or null, ...],
+    "icon":       [icon URL or null, ...],
+    "decimals":   [decimals or null, ...],
+    "nameNorm":   [normalize(name), ...],
+    "tickerNorm": [normalize(ticker), ...],
+    "nameWords":  [[word, ...], ...]
+  }
+
+Defaults (FALLBACK_TOKEN_ICON, 18 decimals) are left to the client, exactly
+as buildIndex applies them today.
+
+--verify runs the TypeScript normalize() under node against every name and
+ticker plus a fuzz corpus and fails on any mismatch.
+
+Usage:
+  python scripts/search_index.py [--chain 1] [--verify]
+"""
+
+import argparse
+import json
+import random
+import re
+import subprocess
+import sys
+import unicodedata
+from pathlib import Path
+from typing import Dict, List
+
+from atomic_json import write_json_atomic
+from token_data_common import CHAIN_IDS, REPO_ROOT, TOKEN_DATA_DIR, load_json
+
+TOKEN_SEARCH_TS = REPO_ROOT / "src" / "utils" / "tokenSearch.ts"
+INDEX_VERSION = 1
+
+# Code point ranges of the Unicode `Diacritic` property, as matched by the
+# /\p{Diacritic}/u regex in tokenSearch.ts (generated from node, Unicode 16.0).
+_DIACRITIC_RANGES = (
+    (0x005E, 0x005E), (0x0060, 0x0060), (0x00A8, 0x00A8), (0x00AF, 0x00AF), (0x00B4, 0x00B4),
+    (0x00B7, 0x00B8), (0x02B0, 0x034E), (0x0350, 0x0357), (0x035D, 0x0362), (0x0374, 0x0375),
+    (0x037A, 0x037A), (0x0384, 0x0385), (0x0483, 0x0487), (0x0559, 0x0559), (0x0591, 0x05A1),
+    (0x05A3, 0x05BD), (0x05BF, 0x05BF), (0x05C1, 0x05C2), (0x05C4, 0x05C4), (0x064B, 0x0652),
+    (0x0657, 0x0658), (0x06DF, 0x06E0), (0x06E5, 0x06E6), (0x06EA, 0x06EC), (0x0730, 0x074A),
+    (0x07A6, 0x07B0), (0x07EB, 0x07F5), (0x0818, 0x0819), (0x0898, 0x089F), (0x08C9, 0x08D2),
+    (0x08E3, 0x08FE), (0x093C, 0x093C), (0x094D, 0x094D), (0x0951, 0x0954), (0x0971, 0x0971),
+    (0x09BC, 0x09BC), (0x09CD, 0x09CD), (0x0A3C, 0x0A3C), (0x0A4D, 0x0A4D), (0x0ABC, 0x0ABC),
+    (0x0ACD, 0x0ACD), (0x0AFD, 0x0AFF), (0x0B3C, 0x0B3C), (0x0B4D, 0x0B4D), (0x0B55, 0x0B55),
+    (0x0BCD, 0x0BCD), (0x0C3C, 0x0C3C), (0x0C4D, 0x0C4D), (0x0CBC, 0x0CBC), (0x0CCD, 0x0CCD),
+    (0x0D3B, 0x0D3C), (0x0D4D, 0x0D4D), (0x0DCA, 0x0DCA), (0x0E3A, 0x0E3A), (0x0E47, 0x0E4C),
+    (0x0E4E, 0x0E4E), (0x0EBA, 0x0EBA), (0x0EC8, 0x0ECC), (0x0F18, 0x0F19), (0x0F35, 0x0F35),
+    (0x0F37, 0x0F37), (0x0F39, 0x0F39), (0x0F3E, 0x0F3F), (0x0F82, 0x0F84), (0x0F86, 0x0F87),
+    (0x0FC6, 0x0FC6), (0x1037, 0x1037), (0x1039, 0x103A), (0x1063, 0x1064), (0x1069, 0x106D),
+    (0x1087, 0x108D), (0x108F, 0x108F), (0x109A, 0x109B), (0x135D, 0x135F), (0x1714, 0x1715),
+    (0x1734, 0x1734), (0x17C9, 0x17D3), (0x17DD, 0x17DD), (0x1939, 0x193B), (0x1A60, 0x1A60),
+    (0x1A75, 0x1A7C), (0x1A7F, 0x1A7F), (0x1AB0, 0x1ABE), (0x1AC1, 0x1ACB), (0x1B34, 0x1B34),
+    (0x1B44, 0x1B44), (0x1B6B, 0x1B73), (0x1BAA, 0x1BAB), (0x1BE6, 0x1BE6), (0x1BF2, 0x1BF3),
+    (0x1C36, 0x1C37), (0x1C78, 0x1C7D), (0x1CD0, 0x1CE8), (0x1CED, 0x1CED), (0x1CF4, 0x1CF4),
+    (0x1CF7, 0x1CF9), (0x1D2C, 0x1D6A), (0x1DC4, 0x1DCF), (0x1DF5, 0x1DFF), (0x1FBD, 0x1FBD),
+    (0x1FBF, 0x1FC1), (0x1FCD, 0x1FCF), (0x1FDD, 0x1FDF), (0x1FED, 0x1FEF), (0x1FFD, 0x1FFE),
+    (0x2CEF, 0x2CF1), (0x2E2F, 0x2E2F), (0x302A, 0x302F), (0x3099, 0x309C), (0x30FC, 0x30FC),
+    (0xA66F, 0xA66F), (0xA67C, 0xA67D), (0xA67F, 0xA67F), (0xA69C, 0xA69D), (0xA6F0, 0xA6F1),
+    (0xA700, 0xA721), (0xA788, 0xA78A), (0xA7F8, 0xA7F9), (0xA806, 0xA806), (0xA82C, 0xA82C),
+    (0xA8C4, 0xA8C4), (0xA8E0, 0xA8F1), (0xA92B, 0xA92E), (0xA953, 0xA953), (0xA9B3, 0xA9B3),
+    (0xA9C0, 0xA9C0), (0xA9E5, 0xA9E5), (0xAA7B, 0xAA7D), (0xAABF, 0xAAC2), (0xAAF6, 0xAAF6),
+    (0xAB5B, 0xAB5F), (0xAB69, 0xAB6B), (0xABEC, 0xABED), (0xFB1E, 0xFB1E), (0xFE20, 0xFE2F),
+    (0xFF3E, 0xFF3E), (0xFF40, 0xFF40), (0xFF70, 0xFF70), (0xFF9E, 0xFF9F), (0xFFE3, 0xFFE3),
+    (0x102E0, 0x102E0), (0x10780, 0x10785), (0x10787, 0x107B0), (0x107B2, 0x107BA), (0x10A38, 0x10A3A),
+    (0x10A3F, 0x10A3F), (0x10AE5, 0x10AE6), (0x10D22, 0x10D27), (0x10D4E, 0x10D4E), (0x10D69, 0x10D6D),
+    (0x10EFD, 0x10EFF), (0x10F46, 0x10F50), (0x10F82, 0x10F85), (0x11046, 0x11046), (0x11070, 0x11070),
+    (0x110B9, 0x110BA), (0x11133, 0x11134), (0x11173, 0x11173), (0x111C0, 0x111C0), (0x111CA, 0x111CC),
+    (0x11235, 0x11236), (0x112E9, 0x112EA), (0x1133B, 0x1133C), (0x1134D, 0x1134D), (0x11366, 0x1136C),
+    (0x11370, 0x11374), (0x113CE, 0x113D0), (0x113D2, 0x113D3), (0x113E1, 0x113E2), (0x11442, 0x11442),
+    (0x11446, 0x11446), (0x114C2, 0x114C3), (0x115BF, 0x115C0), (0x1163F, 0x1163F), (0x116B6, 0x116B7),
+    (0x1172B, 0x1172B), (0x11839, 0x1183A), (0x1193D, 0x1193E), (0x11943, 0x11943), (0x119E0, 0x119E0),
+    (0x11A34, 0x11A34), (0x11A47, 0x11A47), (0x11A99, 0x11A99), (0x11C3F, 0x11C3F), (0x11D42, 0x11D42),
+    (0x11D44, 0x11D45), (0x11D97, 0x11D97), (0x11F41, 0x11F42), (0x11F5A, 0x11F5A), (0x13447, 0x13455),
+    (0x1612F, 0x1612F), (0x16AF0, 0x16AF4), (0x16B30, 0x16B36), (0x16D6B, 0x16D6C), (0x16F8F, 0x16F9F),
+    (0x16FF0, 0x16FF1), (0x1AFF0, 0x1AFF3), (0x1AFF5, 0x1AFFB), (0x1AFFD, 0x1AFFE), (0x1CF00, 0x1CF2D),
+    (0x1CF30, 0x1CF46), (0x1D167, 0x1D169), (0x1D16D, 0x1D172), (0x1D17B, 0x1D182), (0x1D185, 0x1D18B),
+    (0x1D1AA, 0x1D1AD), (0x1E030, 0x1E06D), (0x1E130, 0x1E136), (0x1E2AE, 0x1E2AE), (0x1E2EC, 0x1E2EF),
+    (0x1E5EE, 0x1E5EF), (0x1E8D0, 0x1E8D6), (0x1E944, 0x1E946), (0x1E948, 0x1E94A),
+)
+
+_DIACRITIC_DELETE = {cp: None for start, end in _DIACRITIC_RANGES for cp in range(start, end + 1)}
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(s: str) -> str:
+    """Port of tokenSearch.ts normalize(): lowercase, NFD, drop diacritics, collapse to [a-z0-9 ]."""
+    s = unicodedata.normalize("NFD", s.lower()).translate(_DIACRITIC_DELETE)
+    return _NON_ALNUM.sub(" ", s).strip(" ")
+
+
+def build_search_index(chain_id: int, metadata: Dict[str, dict]) -> dict:
+    """Columnar search index for one chain, in address order."""
+    index: Dict[str, object] = {"version": INDEX_VERSION, "chain": chain_id}
+    columns: Dict[str, List] = {
+        key: [] for key in ("address", "name", "ticker", "icon", "decimals", "nameNorm", "tickerNorm", "nameWords")
+    }
+    for addr in sorted(metadata, key=str.lower):
+        meta = metadata[addr]
+        name_norm = normalize(meta.get("name") or "")
+        columns["address"].append(addr.lower())
+        columns["name"].append(meta.get("name"))
+        columns["ticker"].append(meta.get("ticker"))
+        columns["icon"].append(meta.get("icon"))
+        columns["decimals"].append(meta.get("decimals"))
+        columns["nameNorm"].append(name_norm)
+        columns["tickerNorm"].append(normalize(meta.get("ticker") or ""))
+        columns["nameWords"].append([w for w in name_norm.split(" ") if w])
+    index["count"] = len(columns["address"])
+    index.update(columns)
+    return index
+
+
+def _ts_normalize_source() -> str:
+    """Extract normalize() from tokenSearch.ts and strip its type annotations."""
+    source = TOKEN_SEARCH_TS.read_text(encoding="utf-8")
+    match = re.search(r"const normalize = \(s: string\): string =>([\s\S]*?);\n", source)
+    if not match:
+        raise RuntimeError(f"normalize() not found in {TOKEN_SEARCH_TS}")
+    return f"const normalize = (s) =>{match.group(1)};"
+
+
+def _fuzz_corpus(size: int, seed: int = 1) -> List[str]:
+    # Latin with accents, Greek, Cyrillic, spacing modifiers, combining marks,
+    # fullwidth forms, punctuation and emoji.
+    pools = [
+        (0x20, 0x7E), (0xA0, 0x24F), (0x2B0, 0x36F), (0x370, 0x4FF),
+        (0x1E00, 0x1EFF), (0x2000, 0x206F), (0xFF00, 0xFFEF), (0x1F300, 0x1F64F),
+    ]
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        chars = []
+        for _ in range(rng.randint(1, 12)):
+            lo, hi = rng.choice(pools)
+            chars.append(chr(rng.randint(lo, hi)))
+        corpus.append("".join(chars))
+    return corpus
+
+
+def verify_against_ts(samples: List[str]) -> List[dict]:
+    """Run the TS normalize() under node over samples; return mismatches."""
+    script = (
+        _ts_normalize_source()
+        + "let input='';process.stdin.on('data',d=>input+=d);"
+        + "process.stdin.on('end',()=>process.stdout.write(JSON.stringify(JSON.parse(input).map(normalize))));"
+    )
+    result = subprocess.run(
+        ["node", "-e", script],
+        input=json.dumps(samples),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    expected = json.loads(result.stdout)
+    return [
+        {"input": s, "ts": ts, "py": normalize(s)}
+        for s, ts in zip(samples, expected)
+        if normalize(s) != ts
+    ]
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Write precomputed search_index.json files matching tokenSearch.ts.")
+    p.add_argument("--chain", type=int, action="append", help="Chain ID (repeatable). Defaults to all chains.")
+    p.add_argument("--out-root", type=Path, default=TOKEN_DATA_DIR, help="tokenData root containing <chain>/ dirs.")
+    p.add_argument("--verify", action="store_true", help="Check normalize() against the TypeScript version via node.")
+    p.add_argument("--fuzz", type=int, default=20000, help="Random strings added to the --verify corpus.")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    chain_ids = args.chain or list(CHAIN_IDS)
+    samples: List[str] = []
+
+    for chain_id in chain_ids:
+        chain_dir = args.out_root / str(chain_id)
+        metadata = load_json(chain_dir / "address_to_metadata.json")
+        if not metadata:
+            print(f"Warning: no metadata for chain {chain_id} in {chain_dir}", file=sys.stderr)
+            continue
+        index = build_search_index(chain_id, metadata)
+        out_path = chain_dir / "search_index.json"
+        write_json_atomic(out_path, index, indent=None)
+        print(f"Chain {chain_id}: indexed {index['count']} tokens. Output: {out_path}")
+        for meta in metadata.values():
+            samples.extend(v for v in (meta.get("name"), meta.get("ticker")) if v)
+
+    if args.verify:
+        samples.extend(_fuzz_corpus(args.fuzz))
+        mismatches = verify_against_ts(samples)
+        if mismatches:
+            for m in mismatches[:20]:
+                print(f"[mismatch] {m}", file=sys.stderr)
+            print(f"Error: {len(mismatches)}/{len(samples)} strings normalize differently from tokenSearch.ts", file=sys.stderr)
+            sys.exit(1)
+        print(f"normalize() matches tokenSearch.ts on {len(samples)} strings")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Build prefix tries and a trigram index over the token search index.
+
+searchTokens() in tokenSearch.ts runs rankItem() over every token on every
+keystroke. This script precomputes lookup structures so candidates come from
+index lookups instead, and writes them to <out-root>/<chain>/search_trie.json.
+
+Item ids are positions in search_index.json (tokens in address order), so
+the two artifacts share one id space.
+
+Layout:
+
+  {
+    "version": 1, "chain": 1, "count": N,
+    "tries": {
+      "ticker":   <trie over tickerNorm>,
+      "nameWord": <trie over every word of nameWords>,
+      "address":  <trie over lowercased "0x..." addresses>
+    },
+    "trigrams": { "<3 chars>": <delta-encoded ids>, ... }
+  }
+
+A trie is a radix (path-compressed) trie flattened into parallel arrays, one
+entry per node, node 0 being the root:
+
+  "label":      edge label leading into the node ("" for the root)
+  "firstChild": index of the node's first child; children are contiguous and
+                sorted by label
+  "childCount": number of children
+  "lo", "hi":   slice bounds into "items"
+  "items":      item ids listed in depth-first order, so the ids of every key
+                under a node are exactly items[lo:hi] (an id can repeat when a
+                token has several keys, e.g. name words)
+
+Prefix lookup walks from the root matching edge labels; when the query is
+exhausted (possibly part-way through a label) the candidates are
+items[lo:hi] of the node reached.
+
+Trigram postings cover tickerNorm, nameNorm and the lowercased address of each
+item. Postings are sorted and delta-encoded (first value is an id, each
+following value the gap to the previous id). For a substring query of 3+
+characters, intersect the postings of all its trigrams, then confirm with
+includes() as rankItem does. Queries shorter than 3 characters fall back to
+the prefix tries.
+
+Usage:
+  python scripts/search_trie.py [--chain 1] [--check]
+"""
+
+import argparse
+import bisect
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from atomic_json import write_json_atomic
+from search_index import build_search_index, normalize
+from token_data_common import CHAIN_IDS, TOKEN_DATA_DIR, load_json
+
+TRIE_VERSION = 1
+
+
+def _common_prefix_len(a: str, b: str) -> int:
+    n = min(len(a), len(b))
+    for i in range(n):
+        if a[i] != b[i]:
+            return i
+    return n
+
+
+def build_trie(pairs: Iterable[Tuple[str, int]]) -> dict:
+    """Flattened radix trie over (key, item id) pairs; see module docstring."""
+    # Sorting once makes every subtree a contiguous run of keys, so the trie
+    # can be built over index ranges without intermediate node objects.
+    entries = sorted((key, item) for key, item in pairs if key)
+    keys = [k for k, _ in entries]
+    ids = [i for _, i in entries]
+
+    label: List[str] = [""]
+    first_child: List[int] = [0]
+    child_count: List[int] = [0]
+    lo: List[int] = [0]
+    hi: List[int] = [len(entries)]
+
+    # Breadth-first so that each node's children occupy consecutive slots.
+    queue: List[Tuple[int, int, int, int]] = [(0, 0, len(entries), 0)]  # node, start, end, depth
+    head = 0
+    while head < len(queue):
+        node, start, end, depth = queue[head]
+        head += 1
+        # Keys that end exactly at this depth terminate here
+        while start < end and len(keys[start]) == depth:
+            start += 1
+        first_child[node] = len(label)
+        children = 0
+        i = start
+        while i < end:
+            ch = keys[i][depth]
+            j = bisect.bisect_left(keys, keys[i][:depth] + chr(ord(ch) + 1), i, end)
+            # The edge spans the run's common prefix: first and last key bound
+            # it, and a key ending early sorts first so it stops the edge too.
+            edge_end = _common_prefix_len(keys[i], keys[j - 1])
+            child = len(label)
+            label.append(keys[i][depth:edge_end])
+            first_child.append(0)
+            child_count.append(0)
+            lo.append(i)
+            hi.append(j)
+            queue.append((child, i, j, edge_end))
+            children += 1
+            i = j
+        child_count[node] = children
+
+    return {
+        "label": label,
+        "firstChild": first_child,
+        "childCount": child_count,
+        "lo": lo,
+        "hi": hi,
+        "items": ids,
+    }
+
+
+def prefix_lookup(trie: dict, prefix: str) -> List[int]:
+    """Item ids of every key starting with prefix (may contain repeats)."""
+    label, first, count = trie["label"], trie["firstChild"], trie["childCount"]
+    node, rest = 0, prefix
+    while rest:
+        start = first[node]
+        # Children are sorted by label, binary search on the first char
+        labels = label[start:start + count[node]]
+        k = bisect.bisect_left(labels, rest[0])
+        if k == len(labels) or not labels[k].startswith(rest[0]):
+            return []
+        edge = labels[k]
+        if rest.startswith(edge):
+            rest = rest[len(edge):]
+        elif edge.startswith(rest):
+            rest = ""
+        else:
+            return []
+        node = start + k
+    return trie["items"][trie["lo"][node]:trie["hi"][node]]
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _delta_encode(ids: List[int]) -> List[int]:
+    return [ids[0]] + [b - a for a, b in zip(ids, ids[1:])] if ids else []
+
+
+def _delta_decode(deltas: List[int]) -> List[int]:
+    out, total = [], 0
+    for d in deltas:
+        total += d
+        out.append(total)
+    return out
+
+
+def build_trigram_index(index: dict) -> Dict[str, List[int]]:
+    postings: Dict[str, List[int]] = {}
+    for item, (ticker, name, addr) in enumerate(zip(index["tickerNorm"], index["nameNorm"], index["address"])):
+        for gram in _trigrams(ticker) | _trigrams(name) | _trigrams(addr):
+            postings.setdefault(gram, []).append(item)
+    # Items are visited in id order, so each posting list is already sorted
+    return {gram: _delta_encode(ids) for gram, ids in sorted(postings.items())}
+
+
+def substring_candidates(trigrams: Dict[str, List[int]], query: str) -> Optional[Set[int]]:
+    """Ids whose indexed text may contain query, or None if query is too short."""
+    grams = _trigrams(query)
+    if not grams:
+        return None
+    lists = sorted((_delta_decode(trigrams.get(g, [])) for g in grams), key=len)
+    result = set(lists[0])
+    for ids in lists[1:]:
+        result.intersection_update(ids)
+        if not result:
+            break
+    return result
+
+
+def build_search_trie(chain_id: int, metadata: Dict[str, dict]) -> dict:
+    index = build_search_index(chain_id, metadata)
+    word_pairs = ((word, item) for item, words in enumerate(index["nameWords"]) for word in words)
+    return {
+        "version": TRIE_VERSION,
+        "chain": chain_id,
+        "count": index["count"],
+        "tries": {
+            "ticker": build_trie((t, i) for i, t in enumerate(index["tickerNorm"])),
+            "nameWord": build_trie(word_pairs),
+            "address": build_trie((a, i) for i, a in enumerate(index["address"])),
+        },
+        "trigrams": build_trigram_index(index),
+    }
+
+
+def check_against_scan(chain_id: int, metadata: Dict[str, dict], artifact: dict) -> List[str]:
+    """Compare index lookups with a full scan for a spread of queries; returns failures."""
+    index = build_search_index(chain_id, metadata)
+    tries, trigrams = artifact["tries"], artifact["trigrams"]
+    failures: List[str] = []
+
+    queries: Set[str] = set()
+    for t in index["tickerNorm"][::7]:
+        queries.update(t[:n] for n in (1, 2, 3, len(t)))
+    for words in index["nameWords"][::11]:
+        queries.update(w[:n] for w in words for n in (2, 4))
+    for a in index["address"][::13]:
+        queries.update((a[:5], a[10:16]))
+    queries.discard("")
+
+    for q in sorted(queries):
+        qn = normalize(q)
+        expected_prefix = {i for i, t in enumerate(index["tickerNorm"]) if qn and t.startswith(qn)}
+        if qn and set(prefix_lookup(tries["ticker"], qn)) != expected_prefix:
+            failures.append(f"ticker prefix {q!r}")
+        expected_words = {i for i, ws in enumerate(index["nameWords"]) if qn and any(w.startswith(qn) for w in ws)}
+        if qn and set(prefix_lookup(tries["nameWord"], qn)) != expected_words:
+            failures.append(f"name word prefix {q!r}")
+        expected_addr = {i for i, a in enumerate(index["address"]) if a.startswith(q)}
+        if set(prefix_lookup(tries["address"], q)) != expected_addr:
+            failures.append(f"address prefix {q!r}")
+        cands = substring_candidates(trigrams, qn)
+        if cands is not None:
+            hits = {i for i in range(index["count"]) if qn in index["tickerNorm"][i] or qn in index["nameNorm"][i]}
+            if not hits <= cands:
+                failures.append(f"substring {q!r}")
+    return failures
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Write prefix trie / trigram search artifacts per chain.")
+    p.add_argument("--chain", type=int, action="append", help="Chain ID (repeatable). Defaults to all chains.")
+    p.add_argument("--out-root", type=Path, default=TOKEN_DATA_DIR, help="tokenData root containing <chain>/ dirs.")
+    p.add_argument("--check", action="store_true", help="Verify lookups against a full scan before writing.")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    for chain_id in args.chain or CHAIN_IDS:
+        chain_dir = args.out_root / str(chain_id)
+        metadata = load_json(chain_dir / "address_to_metadata.json")
+        if not metadata:
+            print(f"Warning: no metadata for chain {chain_id} in {chain_dir}", file=sys.stderr)
+            continue
+        artifact = build_search_trie(chain_id, metadata)
+        if args.check:
+            failures = check_against_scan(chain_id, metadata, artifact)
+            if failures:
+                for f in failures[:20]:
+                    print(f"[mismatch] chain {chain_id}: {f}", file=sys.stderr)
+                print(f"Error: {len(failures)} lookups disagree with a full scan", file=sys.stderr)
+                sys.exit(1)
+        out_path = chain_dir / "search_trie.json"
+        write_json_atomic(out_path, artifact, indent=None)
+        nodes = sum(len(t["label"]) for t in artifact["tries"].values())
+        print(f"Chain {chain_id}: {artifact['count']} tokens, {nodes} trie nodes, "
+              f"{len(artifact['trigrams'])} trigrams. Output: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
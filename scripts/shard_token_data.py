@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Split each chain's address_to_metadata.json into address-prefix shards.
+
+Writes <out-root>/<chain>/shards/:
+  - core.json:      the popular tokens (top of popularity.json plus native ETH),
+                    small enough to import synchronously
+  - <prefix>.json:  every token whose lowercased address starts with 0x<prefix>
+  - manifest.json:  prefix length, counts and content hashes of every shard
+
+Shards are written compact, so a lookup for one address only has to load
+core.json or the single shard for its prefix. With the default out-root the
+frontend can `import()` a shard on demand and get its own chunk.
+
+Usage:
+  python scripts/shard_token_data.py [--chain 1] [--prefix-len 1] [--core-size 100]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, Set
+
+from atomic_json import canonical_hash, write_json_atomic
+from token_data_common import CHAIN_IDS, TOKEN_DATA_DIR, load_json
+
+NATIVE_ETH = "0x0000000000000000000000000000000000000000"
+MANIFEST_VERSION = 1
+
+
+def core_addresses(metadata: Dict[str, dict], popularity: Dict[str, dict], core_size: int) -> Set[str]:
+    """Top core_size addresses by popularity rank that exist in metadata, plus native ETH."""
+    ranked = sorted(
+        (addr for addr in popularity if addr in metadata),
+        key=lambda addr: popularity[addr].get("rank", sys.maxsize),
+    )
+    core = set(ranked[:core_size])
+    if NATIVE_ETH in metadata:
+        core.add(NATIVE_ETH)
+    return core
+
+
+def shard_metadata(metadata: Dict[str, dict], prefix_len: int) -> Dict[str, Dict[str, dict]]:
+    """Group lowercased address -> metadata by the first prefix_len hex chars after 0x."""
+    shards: Dict[str, Dict[str, dict]] = {}
+    for addr in sorted(metadata):
+        key = addr.lower()
+        shards.setdefault(key[2:2 + prefix_len], {})[key] = metadata[addr]
+    return shards
+
+
+def write_chain_shards(chain_dir: Path, prefix_len: int, core_size: int) -> dict:
+    """Write core, prefix shards and manifest for one chain; returns the manifest."""
+    metadata = load_json(chain_dir / "address_to_metadata.json")
+    popularity = load_json(chain_dir / "popularity.json")
+    out_dir = chain_dir / "shards"
+
+    core = {addr: metadata[addr] for addr in sorted(core_addresses(metadata, popularity, core_size))}
+    shards = shard_metadata(metadata, prefix_len)
+
+    write_json_atomic(out_dir / "core.json", core, indent=None)
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "prefixLength": prefix_len,
+        "total": len(metadata),
+        "core": {"file": "core.json", "count": len(core), "hash": canonical_hash(core)[:16]},
+        "shards": {},
+    }
+    for prefix, entries in shards.items():
+        file_name = f"{prefix}.json"
+        write_json_atomic(out_dir / file_name, entries, indent=None)
+        manifest["shards"][prefix] = {"file": file_name, "count": len(entries), "hash": canonical_hash(entries)[:16]}
+
+    # Drop shards left over from a run with a different prefix length
+    keep = {"manifest.json", "core.json"} | {s["file"] for s in manifest["shards"].values()}
+    for stale in out_dir.glob("*.json"):
+        if stale.name not in keep:
+            stale.unlink()
+
+    write_json_atomic(out_dir / "manifest.json", manifest, indent=2)
+    return manifest
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Shard address_to_metadata.json by address prefix for lazy loading.")
+    p.add_argument("--chain", type=int, action="append", help="Chain ID (repeatable). Defaults to all chains.")
+    p.add_argument("--out-root", type=Path, default=TOKEN_DATA_DIR, help="tokenData root containing <chain>/ dirs.")
+    p.add_argument("--prefix-len", type=int, default=1, choices=(1, 2, 3),
+                   help="Hex chars of the address used as shard key (16^n shards).")
+    p.add_argument("--core-size", type=int, default=100, help="Number of top popularity.json tokens in core.json.")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    for chain_id in args.chain or CHAIN_IDS:
+        chain_dir = args.out_root / str(chain_id)
+        if not (chain_dir / "address_to_metadata.json").exists():
+            print(f"Warning: no address_to_metadata.json for chain {chain_id} in {chain_dir}", file=sys.stderr)
+            continue
+        manifest = write_chain_shards(chain_dir, args.prefix_len, args.core_size)
+        sizes = [s["count"] for s in manifest["shards"].values()]
+        print(
+            f"Chain {chain_id}: {manifest['total']} tokens -> core {manifest['core']['count']}, "
+            f"{len(sizes)} shards (max {max(sizes, default=0)} tokens). Output: {chain_dir / 'shards'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Local stand-in image host for testing mirror_icons.py.
+
+Answers GET for any path with a PNG generated from the path, so token icon
+URLs can be replayed against it with mirror_icons.py --origin-override:
+
+  - the colour is picked from --distinct palette entries by hashing the path,
+    so many URLs serve byte-identical images (exercises content dedupe)
+  - sizes vary between 32x32 and 256x192 (exercises resizing and padding)
+  - a strong ETag is sent and If-None-Match is answered with 304
+  - paths containing "missing" are 404, "broken" serves bytes that are not
+    an image
+
+  GET /stats   -> {"requests": N, "notModified": N, "bytes": N}
+  POST /reset  -> zeroes the counters
+
+The PNG encoder is a few lines of zlib, so the server itself does not need
+Pillow.
+
+Usage:
+  python scripts/stand_in_icon_server.py [--port 8548] [--distinct 40]
+"""
+
+import argparse
+import hashlib
+import json
+import struct
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple
+
+SIZES = ((32, 32), (64, 64), (128, 128), (200, 200), (256, 192))
+
+
+def encode_png(width: int, height: int, rgba: Tuple[int, int, int, int]) -> bytes:
+    """Solid-colour RGBA PNG with a transparent 1px border."""
+    pixel = bytes(rgba)
+    clear = b"\x00\x00\x00\x00"
+    edge = b"\x00" + clear * width
+    inner = b"\x00" + clear + pixel * (width - 2) + clear
+    raw = edge + inner * (height - 2) + edge
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw, 9)) + chunk(b"IEND", b"")
+
+
+def image_for(path: str, distinct: int) -> bytes:
+    slot = int.from_bytes(hashlib.sha256(path.encode("utf-8")).digest()[:4], "big") % distinct
+    seed = hashlib.sha256(str(slot).encode("ascii")).digest()
+    width, height = SIZES[slot % len(SIZES)]
+    return encode_png(width, height, (seed[0], seed[1], seed[2], 255))
+
+
+class IconStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = self.not_modified = self.bytes = 0
+
+    def record(self, size: int, not_modified: bool = False) -> None:
+        with self.lock:
+            self.requests += 1
+            self.not_modified += int(not_modified)
+            self.bytes += size
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {"requests": self.requests, "notModified": self.not_modified, "bytes": self.bytes}
+
+    def reset(self) -> None:
+        with self.lock:
+            self.requests = self.not_modified = self.bytes = 0
+
+
+def make_server(host: str, port: int, distinct: int) -> ThreadingHTTPServer:
+    stats = IconStats()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, status: int, body: bytes, content_type: str, etag: str = "") -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            if etag:
+                self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            path = self.path.split("?", 1)[0]
+            if path == "/stats":
+                return self._send(200, json.dumps(stats.snapshot()).encode("utf-8"), "application/json")
+            if "missing" in path:
+                stats.record(0)
+                return self._send(404, b"", "text/plain")
+            body = b"not an image" if "broken" in path else image_for(path, distinct)
+            etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+            if self.headers.get("If-None-Match") == etag:
+                stats.record(0, not_modified=True)
+                return self._send(304, b"", "image/png", etag)
+            stats.record(len(body))
+            self._send(200, body, "image/png", etag)
+
+        def do_POST(self):
+            if self.path == "/reset":
+                stats.reset()
+                return self._send(200, json.dumps(stats.snapshot()).encode("utf-8"), "application/json")
+            self._send(404, b"", "text/plain")
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    server.stats = stats
+    return server
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Serve generated PNG icons with ETags for local testing.")
+    p.add_argument("--host", default="127.0.0.1", help="Interface to bind.")
+    p.add_argument("--port", type=int, default=8548, help="Port to listen on.")
+    p.add_argument("--distinct", type=int, default=40, help="Number of distinct images served.")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    server = make_server(args.host, args.port, args.distinct)
+    print(f"Stand-in icon server on http://{args.host}:{args.port} ({args.distinct} distinct images)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
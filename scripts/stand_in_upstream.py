@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the GeckoTerminal `tokens/multi` endpoint.
+
+Serves
+
+  GET /networks/<network>/tokens/multi/<addr,addr,...>
+
+with the same JSON:API shape as the real API ({"data": [{"id", "type",
+"attributes": {address, name, symbol, decimals, image_url, price_usd}}]}),
+after an optional fixed --latency. Tokens are synthesised from the address,
+so any address resolves, except ones starting with 0xdead (never found, to
+exercise negative caching). More than 30 addresses per call is a 400, as
+upstream.
+
+  GET /stats   -> {"calls": N, "addresses": N, "maxAddresses": N}
+  POST /reset  -> zeroes the counters
+
+Used to exercise token_metadata_service.py without an API key or network
+access.
+
+Usage:
+  python scripts/stand_in_upstream.py [--port 8547] [--latency 0.12]
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+MAX_ADDRESSES = 30
+UNKNOWN_PREFIX = "0xdead"
+
+
+def token_attributes(address: str) -> Optional[dict]:
+    """Deterministic fake attributes for address, None if it is 'unknown'."""
+    address = address.lower()
+    if address.startswith(UNKNOWN_PREFIX):
+        return None
+    tag = address[2:8].upper()
+    return {
+        "address": address,
+        "name": f"Stand-in {tag}",
+        "symbol": f"S{tag[:4]}",
+        "decimals": 18 if int(address[-1], 16) % 2 == 0 else 6,
+        "image_url": None,
+        "price_usd": f"{int(address[-4:], 16) / 100:.2f}",
+    }
+
+
+class UpstreamStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.addresses = 0
+        self.max_addresses = 0
+
+    def record(self, count: int) -> None:
+        with self.lock:
+            self.calls += 1
+            self.addresses += count
+            self.max_addresses = max(self.max_addresses, count)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self.lock:
+            return {"calls": self.calls, "addresses": self.addresses, "maxAddresses": self.max_addresses}
+
+    def reset(self) -> None:
+        with self.lock:
+            self.calls = self.addresses = self.max_addresses = 0
+
+
+def make_server(host: str, port: int, latency: float) -> ThreadingHTTPServer:
+    stats = UpstreamStats()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, status: int, payload: dict) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            parts = self.path.split("?", 1)[0].strip("/").split("/")
+            if parts == ["stats"]:
+                return self._send(200, stats.snapshot())
+            if len(parts) != 5 or parts[0] != "networks" or parts[2:4] != ["tokens", "multi"]:
+                return self._send(404, {"errors": [{"status": "404", "title": "Not Found"}]})
+
+            addresses: List[str] = [a for a in parts[4].split(",") if a]
+            if len(addresses) > MAX_ADDRESSES:
+                return self._send(400, {"errors": [{"status": "400", "title": "Too many addresses"}]})
+            stats.record(len(addresses))
+            if latency:
+                time.sleep(latency)
+            data = []
+            for address in addresses:
+                attributes = token_attributes(address)
+                if attributes:
+                    data.append({"id": f"{parts[1]}_{address.lower()}", "type": "token", "attributes": attributes})
+            self._send(200, {"data": data})
+
+        def do_POST(self):
+            if self.path == "/reset":
+                stats.reset()
+                return self._send(200, stats.snapshot())
+            self._send(404, {})
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    server.stats = stats
+    return server
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Serve fake GeckoTerminal tokens/multi responses for local testing.")
+    p.add_argument("--host", default="127.0.0.1", help="Interface to bind.")
+    p.add_argument("--port", type=int, default=8547, help="Port to listen on.")
+    p.add_argument("--latency", type=float, default=0.12, help="Seconds to wait before answering each call.")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    server = make_server(args.host, args.port, args.latency)
+    print(f"Stand-in upstream on http://{args.host}:{args.port} (latency {args.latency}s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+from cross_chain_map import build_cross_chain_map
+
+A1 = "0x" + "a1" * 20
+A2 = "0x" + "a2" * 20
+B1 = "0x" + "b1" * 20
+B2 = "0x" + "b2" * 20
+
+
+def test_ticker_links_need_a_matching_name():
+    metadata = {
+        1: {
+            A1: {"name": "Pipe Network", "ticker": "PIPE", "decimals": 9},
+            B1: {"name": "Tree", "ticker": "TREE", "decimals": 18},
+        },
+        8453: {
+            A2: {"name": "pipe-network", "ticker": "PIPE", "decimals": 9},
+            B2: {"name": "Tree Finance", "ticker": "TREE", "decimals": 18},
+        },
+    }
+    result = build_cross_chain_map(metadata, {1: {}, 8453: {}})
+    assert result["assets"]["PIPE"]["tokens"] == {
+        "1": {"address": A1, "confidence": 0.6, "source": "unique-ticker"},
+        "8453": {"address": A2, "confidence": 0.6, "source": "unique-ticker"},
+    }
+    assert "TREE" not in result["assets"]
+    assert f"1:{B1}" not in result["byToken"]
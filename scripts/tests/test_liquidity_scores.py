@@ -0,0 +1,89 @@
+from typing import List, Optional
+
+import liquidity_scores
+from liquidity_scores import (
+    MULTICALL3,
+    Q96,
+    SELECTOR_AGGREGATE3,
+    SELECTOR_GET_RESERVES,
+    SELECTOR_SLOT0,
+    decode_aggregate3,
+    encode_aggregate3,
+    read_reserves,
+    v3_virtual_reserves,
+)
+
+POOL_A = "0x" + "0a" * 20
+POOL_B = "0x" + "0b" * 20
+
+
+def _word(value: int) -> bytes:
+    return value.to_bytes(32, "big")
+
+
+def encode_results(results: List[Optional[bytes]]) -> str:
+    """aggregate3's return value: (bool success, bytes returnData)[]"""
+    tails = []
+    for data in results:
+        body = data or b""
+        padded = body + b"\0" * (-len(body) % 32)
+        tails.append(_word(data is not None) + _word(64) + _word(len(body)) + padded)
+    heads, offset = [], 32 * len(results)
+    for tail in tails:
+        heads.append(_word(offset))
+        offset += len(tail)
+    return "0x" + (_word(32) + _word(len(results)) + b"".join(heads) + b"".join(tails)).hex()
+
+
+def test_encode_aggregate3_layout():
+    encoded = encode_aggregate3([(POOL_A, SELECTOR_GET_RESERVES), (POOL_B, SELECTOR_SLOT0)])
+    raw = bytes.fromhex(encoded[2:])
+    assert raw[:4].hex() == SELECTOR_AGGREGATE3
+    words = [int.from_bytes(raw[4 + 32 * i:4 + 32 * (i + 1)], "big") for i in range((len(raw) - 4) // 32)]
+    assert words[:4] == [32, 2, 64, 64 + 160]  # array offset, length, per-call offsets
+    first = words[4:9]
+    assert first[0] == int(POOL_A, 16)
+    assert first[1:4] == [1, 96, 4]  # allowFailure, calldata offset, calldata length
+    assert raw[4 + 32 * 8:4 + 32 * 8 + 4].hex() == SELECTOR_GET_RESERVES
+    assert words[9] == int(POOL_B, 16)
+
+
+def test_decode_aggregate3_keeps_order_and_marks_failures():
+    reserves = _word(5) + _word(7) + _word(123)
+    assert decode_aggregate3(encode_results([reserves, None, _word(9)])) == [reserves, None, _word(9)]
+    assert decode_aggregate3("0x") == []
+
+
+def test_v3_virtual_reserves():
+    # sqrtP = 2 (price 4): L / sqrtP and L * sqrtP
+    assert v3_virtual_reserves(2 * Q96, 1000) == (500, 2000)
+    r0, r1 = v3_virtual_reserves(Q96 * 3 // 2, 10 ** 18)
+    assert abs(r1 / r0 - 2.25) < 1e-9
+    assert r0 * r1 <= 10 ** 36  # never more than L^2
+
+
+def test_read_reserves_matches_replies_by_id(monkeypatch):
+    v2 = {"pool": POOL_A, "token0": "t0", "token1": "t1", "kind": "v2"}
+    v3 = {"pool": POOL_B, "token0": "t0", "token1": "t1", "kind": "v3"}
+    lost = {"pool": "0x" + "0c" * 20, "token0": "t0", "token1": "t1", "kind": "v2"}
+
+    def fake_batch_call(rpc_url, payload):
+        assert [p["params"][0]["to"] for p in payload] == [MULTICALL3] * 3
+        # Out of order, one reply dropped, one with a short result
+        return [
+            {"id": 1, "result": encode_results([_word(2 * Q96), _word(1000)])},
+            {"id": 0, "result": encode_results([_word(11) + _word(22) + _word(0)])},
+            {"id": 7, "result": "0x"},
+        ]
+
+    monkeypatch.setattr(liquidity_scores, "rpc_batch_call", fake_batch_call)
+    out = list(read_reserves("http://rpc", [v2, v3, lost], batch_size=1, batches_per_request=3))
+    assert out == [(v3, 500, 2000), (v2, 11, 22)]
+
+
+def test_read_reserves_skips_mismatched_result_count(monkeypatch):
+    v3 = {"pool": POOL_B, "token0": "t0", "token1": "t1", "kind": "v3"}
+    monkeypatch.setattr(
+        liquidity_scores, "rpc_batch_call", lambda url, payload: [{"id": 0, "result": encode_results([_word(1)])}]
+    )
+    assert list(read_reserves("http://rpc", [v3])) == []
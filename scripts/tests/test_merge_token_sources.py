@@ -0,0 +1,25 @@
+from merge_token_sources import merge_sources
+
+A = "0x" + "aa" * 20
+B = "0x" + "bb" * 20
+MIRRORED = "/token-icons/0123456789abcdef-128.webp"
+
+
+def test_fields_follow_precedence_per_source():
+    merged, provenance = merge_sources({
+        "rpc": {A: {"name": "alpha", "ticker": "ALP", "decimals": 18}},
+        "coingecko": {A.upper().replace("0X", "0x"): {"name": "Alpha", "icon": "https://cg/a.png", "decimals": 8}},
+    })
+    assert merged == {A: {"name": "Alpha", "ticker": "ALP", "icon": "https://cg/a.png", "decimals": 18}}
+    assert provenance == {A: {"name": "coingecko", "ticker": "rpc", "icon": "coingecko", "decimals": "rpc"}}
+
+
+def test_mirrored_icon_survives_a_rerun_until_its_source_changes():
+    sources = {
+        "trustwallet": {A: {"icon": "https://tw/a.png"}, B: {"icon": "https://tw/b-new.png"}},
+        "existing": {A: {"icon": MIRRORED}, B: {"icon": MIRRORED}},
+    }
+    origins = {A: "https://tw/a.png", B: "https://tw/b-old.png"}
+    merged, _ = merge_sources(sources, origins)
+    assert merged[A]["icon"] == MIRRORED
+    assert merged[B]["icon"] == "https://tw/b-new.png"
@@ -0,0 +1,93 @@
+import json
+import re
+import sys
+import threading
+
+import pytest
+
+features = pytest.importorskip("PIL.features")
+if not features.check("webp"):
+    pytest.skip("Pillow without WebP support", allow_module_level=True)
+
+import mirror_icons  # noqa: E402
+from stand_in_icon_server import make_server  # noqa: E402
+
+GOOD = {"0x%040x" % i: f"https://cdn.example/{i}.png" for i in range(1, 13)}
+MISSING = ("0x" + "dd" * 20, "https://cdn.example/missing.png")
+BROKEN = ("0x" + "ee" * 20, "https://cdn.example/broken.png")
+OTHER_CHAIN_ICON = "aaaaaaaaaaaaaaaa"
+STRAY_ICON = "ffffffffffffffff"
+MIRRORED_RE = re.compile(r"^/token-icons/([0-9a-f]{16})-128\.webp$")
+
+
+@pytest.fixture
+def icon_server():
+    server = make_server("127.0.0.1", 0, 3)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def tree(tmp_path):
+    chain_dir = tmp_path / "tokenData" / "1"
+    chain_dir.mkdir(parents=True)
+    metadata = {addr: {"name": addr, "ticker": "T", "icon": url} for addr, url in [*GOOD.items(), MISSING, BROKEN]}
+    (chain_dir / "address_to_metadata.json").write_text(json.dumps(metadata))
+    return tmp_path
+
+
+def run_mirror(monkeypatch, tree, icon_server, *extra):
+    host, port = icon_server.server_address[:2]
+    argv = [
+        "mirror_icons.py", "--chain", "1", "--in-place",
+        "--out-root", str(tree / "tokenData"), "--out-dir", str(tree / "icons"), "--state", str(tree / "state.json"),
+        "--origin-override", f"http://{host}:{port}", "--refresh-after", "0", "--retry-after", "0", *extra,
+    ]
+    monkeypatch.setattr(sys, "argv", argv)
+    mirror_icons.main()
+    return json.loads((tree / "tokenData" / "1" / "address_to_metadata.json").read_text())
+
+
+def test_mirror_dedupes_revalidates_and_keeps_failed_urls(monkeypatch, tree, icon_server):
+    metadata = run_mirror(monkeypatch, tree, icon_server)
+
+    ids = {addr: MIRRORED_RE.match(metadata[addr]["icon"]).group(1) for addr in GOOD}
+    assert 1 < len(set(ids.values())) <= 3  # 12 URLs over 3 distinct images
+    files = {p.name for p in (tree / "icons").iterdir()}
+    assert files == {f"{icon_id}-{size}.webp" for icon_id in ids.values() for size in mirror_icons.SIZES}
+    assert metadata[MISSING[0]]["icon"] == MISSING[1]
+    assert metadata[BROKEN[0]]["icon"] == BROKEN[1]
+    origins = json.loads((tree / "tokenData" / "1" / mirror_icons.ORIGINS_FILE).read_text())
+    assert origins == GOOD
+
+    icon_server.stats.reset()
+    assert run_mirror(monkeypatch, tree, icon_server) == metadata
+    stats = icon_server.stats.snapshot()
+    assert stats["notModified"] == len(GOOD)
+    assert stats["requests"] == len(GOOD) + 2  # plus the 404 and the broken body, retried
+
+
+def test_prune_keeps_referenced_icons(monkeypatch, tree, icon_server):
+    run_mirror(monkeypatch, tree, icon_server)
+    icons = tree / "icons"
+    for icon_id in (OTHER_CHAIN_ICON, STRAY_ICON):
+        for size in mirror_icons.SIZES:
+            (icons / f"{icon_id}-{size}.webp").write_bytes(b"")
+    # Referenced only by a chain this run does not touch
+    other = tree / "tokenData" / "8453"
+    other.mkdir()
+    (other / "address_to_metadata.json").write_text(
+        json.dumps({"0x" + "01" * 20: {"icon": f"/token-icons/{OTHER_CHAIN_ICON}-128.webp"}})
+    )
+    before = {p.name for p in icons.iterdir()}
+
+    metadata = run_mirror(monkeypatch, tree, icon_server, "--prune")
+
+    after = {p.name for p in icons.iterdir()}
+    assert after == {name for name in before if not name.startswith(STRAY_ICON)}
+    for addr in GOOD:
+        icon_id = MIRRORED_RE.match(metadata[addr]["icon"]).group(1)
+        assert all((icons / f"{icon_id}-{size}.webp").exists() for size in mirror_icons.SIZES)
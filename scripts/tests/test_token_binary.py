@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+import token_binary
+from icon_templates import build_template_table
+from token_binary import CHAIN_IDS, TOKEN_DATA_DIR, _normalized, decode_metadata, encode_metadata
+
+
+@pytest.mark.parametrize("chain_id", CHAIN_IDS)
+def test_checked_in_metadata_round_trips(chain_id):
+    with (TOKEN_DATA_DIR / str(chain_id) / "address_to_metadata.json").open(encoding="utf-8") as f:
+        metadata = json.load(f)
+    data = encode_metadata(chain_id, metadata, build_template_table(chain_id, metadata))
+    decoded_chain, decoded = decode_metadata(data)
+    assert decoded_chain == chain_id
+    assert decoded == _normalized(metadata)
+
+
+def test_templates_past_the_cap_fall_back_to_literals():
+    # One prefix template per token, so the last ones land beyond index 254
+    templates = ["{param}"] + [f"https://icons{i}.example/{{param}}" for i in range(1, 300)]
+    metadata = {
+        "0x" + f"{i:040x}": {"name": f"T{i}", "ticker": f"T{i}", "icon": f"https://icons{i}.example/logo.png", "decimals": 18}
+        for i in range(1, 300)
+    }
+    decoded_chain, decoded = decode_metadata(encode_metadata(1, metadata, templates))
+    assert decoded_chain == 1
+    assert decoded == _normalized(metadata)
+
+
+def test_null_fields_round_trip():
+    metadata = {"0x" + "ab" * 20: {"name": None, "ticker": "X"}}
+    assert decode_metadata(encode_metadata(8453, metadata))[1] == {
+        "0x" + "ab" * 20: {"name": None, "ticker": "X", "icon": None, "decimals": None}
+    }
+
+
+def test_template_index_past_null_marker_is_rejected(monkeypatch):
+    # Bypass the cap to reach the writer's own guard, which must hold under python -O too
+    monkeypatch.setattr(token_binary, "MAX_TEMPLATES", 1000)
+    templates = ["{param}"] + [f"https://icons{i}.example/{{param}}" for i in range(1, 300)]
+    metadata = {"0x" + "cd" * 20: {"icon": "https://icons280.example/logo.png"}}
+    with pytest.raises(ValueError, match="null marker"):
+        encode_metadata(1, metadata, templates)
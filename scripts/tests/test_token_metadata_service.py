@@ -0,0 +1,200 @@
+import asyncio
+import threading
+
+import pytest
+
+from stand_in_upstream import make_server
+from token_metadata_service import MAX_ADDRESSES_PER_CALL, Coalescer, MetadataService, TTLCache, Upstream
+
+KNOWN = "0x" + "ab" * 20
+REMOTE = "0x" + "12" * 20
+UNKNOWN = "0xdead" + "00" * 18
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def upstream_server():
+    server = make_server("127.0.0.1", 0, 0)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def service(upstream_server, clock):
+    host, port = upstream_server.server_address[:2]
+    upstream = Upstream(f"http://{host}:{port}", None, pool_size=2, timeout=5)
+    index = {1: {KNOWN: {"address": KNOWN, "name": "Known", "ticker": "KNW", "icon": None, "price": 0.0, "decimals": 18}}}
+    svc = MetadataService(index, upstream, TTLCache(100, clock=clock), ttl=3600, negative_ttl=60)
+    yield svc
+    upstream.close()
+
+
+def get(service, target):
+    return asyncio.run(service.handle_get(target))
+
+
+def test_local_hit_does_not_call_upstream(service, upstream_server):
+    status, payload = get(service, f"/api/token-metadata?network=ethereum&addresses={KNOWN.upper().replace('0X', '0x')}")
+    assert status == 200
+    assert [r["name"] for r in payload["data"]] == ["Known"]
+    assert upstream_server.stats.snapshot()["calls"] == 0
+
+
+def test_upstream_miss_is_fetched_once_then_cached(service, upstream_server):
+    target = f"/api/token-metadata?network=ethereum&addresses={KNOWN},{REMOTE}"
+    for _ in range(2):
+        status, payload = get(service, target)
+        assert status == 200
+        assert [r["address"] for r in payload["data"]] == [KNOWN, REMOTE]
+    assert upstream_server.stats.snapshot() == {"calls": 1, "addresses": 1, "maxAddresses": 1}
+
+
+def test_not_found_is_cached_for_the_negative_ttl(service, upstream_server, clock):
+    target = f"/api/token-metadata?network=ethereum&addresses={UNKNOWN}"
+    assert get(service, target) == (200, {"data": [], "count": 0})
+    clock.now += 59
+    get(service, target)
+    assert upstream_server.stats.snapshot()["calls"] == 1
+    clock.now += 2
+    get(service, target)
+    assert upstream_server.stats.snapshot()["calls"] == 2
+
+
+def test_failed_batch_is_not_cached(service, upstream_server):
+    base_url = service.upstream.base_url
+    service.upstream.base_url = base_url + "/broken"  # the stand-in answers 404
+    target = f"/api/token-metadata?network=base&addresses={REMOTE}"
+    assert get(service, target) == (200, {"data": [], "count": 0})
+    assert len(service.cache) == 0
+
+    service.upstream.base_url = base_url
+    status, payload = get(service, target)
+    assert [r["address"] for r in payload["data"]] == [REMOTE]
+    assert upstream_server.stats.snapshot()["calls"] == 1
+
+
+@pytest.mark.parametrize("query, error", [
+    ("network=solana&addresses=" + KNOWN, "unsupported_network"),
+    ("network=ethereum&addresses=0x1234", "invalid_addresses"),
+    ("network=ethereum&addresses=" + "0x" + "zz" * 20, "invalid_addresses"),
+    ("network=ethereum", "invalid_addresses"),
+])
+def test_bad_requests_are_400(service, upstream_server, query, error):
+    status, payload = get(service, "/api/token-metadata?" + query)
+    assert status == 400
+    assert payload["error"] == error
+    assert upstream_server.stats.snapshot()["calls"] == 0
+
+
+class FakeUpstream:
+    """Counts calls; blocks each call on `gate` if set, raises `error` if set."""
+
+    def __init__(self, error: BaseException = None):
+        self.calls = 0
+        self.batches = []
+        self.gate = None
+        self.error = error
+
+    async def fetch(self, network_id, addresses):
+        self.calls += 1
+        self.batches.append(list(addresses))
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return {addr: {"address": addr} for addr in addresses}
+
+
+def test_coalescer_single_flight():
+    async def scenario():
+        fake = FakeUpstream()
+        fake.gate = asyncio.Event()
+        coalescer = Coalescer(fake, window=0.01)
+        first = asyncio.ensure_future(coalescer.fetch("eth", [REMOTE]))
+        second = asyncio.ensure_future(coalescer.fetch("eth", [REMOTE, KNOWN]))
+        await asyncio.sleep(0.05)
+        fake.gate.set()
+        return fake, await first, await second
+
+    fake, first, second = asyncio.run(scenario())
+    assert fake.calls == 1
+    assert fake.batches == [[REMOTE, KNOWN]]
+    assert first == {REMOTE: {"address": REMOTE}}
+    assert set(second) == {REMOTE, KNOWN}
+
+
+def test_coalescer_flushes_per_window_and_at_the_call_limit():
+    addresses = ["0x%040x" % i for i in range(1, 36)]
+
+    async def scenario():
+        fake = FakeUpstream()
+        coalescer = Coalescer(fake, window=0.02)
+        # Separate callers inside one window share a call; 35 addresses need two
+        results = await asyncio.gather(*(coalescer.fetch("eth", [a]) for a in addresses))
+        await coalescer.fetch("eth", [REMOTE])  # a later window is a new call
+        return fake, results
+
+    fake, results = asyncio.run(scenario())
+    assert [len(batch) for batch in fake.batches] == [MAX_ADDRESSES_PER_CALL, 5, 1]
+    assert fake.batches[-1] == [REMOTE]
+    assert all(len(result) == 1 for result in results)
+
+
+def test_coalescer_drops_failed_lookups_and_retries_them():
+    async def scenario():
+        fake = FakeUpstream(error=RuntimeError("boom"))
+        coalescer = Coalescer(fake, window=0)
+        failed = await coalescer.fetch("eth", [REMOTE])
+        fake.error = None
+        return fake, failed, await coalescer.fetch("eth", [REMOTE])
+
+    fake, failed, retried = asyncio.run(scenario())
+    assert failed == {}
+    assert retried == {REMOTE: {"address": REMOTE}}
+    assert fake.calls == 2
+
+
+def test_coalescer_cancelled_lookup_releases_every_waiter():
+    async def scenario():
+        fake = FakeUpstream(error=asyncio.CancelledError())
+        coalescer = Coalescer(fake, window=0)
+        results = await asyncio.wait_for(
+            asyncio.gather(coalescer.fetch("eth", [REMOTE]), coalescer.fetch("eth", [REMOTE])), timeout=1
+        )
+        return results, coalescer._inflight
+
+    results, inflight = asyncio.run(scenario())
+    assert results == [{}, {}]
+    assert inflight == {}
+
+
+def test_cancelled_caller_does_not_cancel_a_shared_lookup():
+    async def scenario():
+        fake = FakeUpstream()
+        fake.gate = asyncio.Event()
+        coalescer = Coalescer(fake, window=0)
+        impatient = asyncio.ensure_future(coalescer.fetch("eth", [REMOTE]))
+        patient = asyncio.ensure_future(coalescer.fetch("eth", [REMOTE]))
+        await asyncio.sleep(0.01)
+        impatient.cancel()
+        fake.gate.set()
+        return await patient, impatient.cancelled()
+
+    result, cancelled = asyncio.run(scenario())
+    assert cancelled
+    assert result == {REMOTE: {"address": REMOTE}}
@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from token_snapshots import PatchError, apply_patch, make_patch, snapshot_chain
+
+A = "0x" + "aa" * 20
+B = "0x" + "bb" * 20
+C = "0x" + "cc" * 20
+
+V1 = {
+    A: {"name": "Alpha", "ticker": "ALP", "icon": "https://example.com/a.png", "decimals": 18},
+    B: {"name": "Beta", "ticker": "BET", "decimals": 6},
+}
+V2 = {
+    A: {"name": "Alpha Token", "ticker": "ALP", "decimals": 18},  # field changed, icon unset
+    C: {"name": "Gamma", "ticker": "GAM", "decimals": 8},  # B removed, C added
+}
+
+
+def test_patch_covers_add_remove_change_and_unset():
+    patch = make_patch(1, 1, V1, 2, V2)
+    assert patch["added"] == {C: V2[C]}
+    assert patch["removed"] == [B]
+    assert patch["changed"] == {A: {"name": "Alpha Token"}}
+    assert patch["unset"] == {A: ["icon"]}
+    assert apply_patch(V1, patch) == V2
+
+
+def test_apply_patch_does_not_mutate_base():
+    base = json.loads(json.dumps(V1))
+    apply_patch(base, make_patch(1, 1, V1, 2, V2))
+    assert base == V1
+
+
+def test_apply_patch_rejects_wrong_base():
+    with pytest.raises(PatchError):
+        apply_patch(V2, make_patch(1, 1, V1, 2, V2))
+
+
+def test_snapshot_patches_reproduce_latest_version(tmp_path):
+    v3 = dict(V2, **{B: {"name": "Beta", "ticker": "BET", "decimals": 6}})
+    versions = [V1, V2, v3]
+    for metadata in versions:
+        index = snapshot_chain(tmp_path, 1, metadata, keep=5)
+    assert index["version"] == 3
+    assert snapshot_chain(tmp_path, 1, v3, keep=5) == index  # unchanged data is not a new version
+
+    for m, info in index["patches"].items():
+        patch = json.loads((tmp_path / info["file"]).read_text(encoding="utf-8"))
+        assert apply_patch(versions[int(m) - 1], patch) == v3
+
+
+def test_bases_are_rebuilt_from_committed_files_only(tmp_path):
+    v3 = dict(V2, **{B: {"name": "Beta", "ticker": "BET", "decimals": 6}})
+    v4 = dict(v3, **{A: {"name": "Alpha", "ticker": "ALP", "decimals": 18}})
+    versions = [V1, V2, v3]
+    for metadata in versions:
+        snapshot_chain(tmp_path, 1, metadata, keep=5)
+    # One full snapshot; older versions live on as revert patches
+    assert sorted(p.name for p in (tmp_path / "versions").glob("v*.json")) == ["v3.json"]
+
+    index = snapshot_chain(tmp_path, 1, v4, keep=5)
+    assert sorted(index["patches"], key=int) == ["1", "2", "3"]
+    for m, info in index["patches"].items():
+        patch = json.loads((tmp_path / info["file"]).read_text(encoding="utf-8"))
+        assert apply_patch(versions[int(m) - 1], patch) == v4
+
+
+def test_apply_patch_rejects_malformed_patch():
+    with pytest.raises(PatchError, match="missing"):
+        apply_patch(V1, {})
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Compact binary encoding of address_to_metadata.json.
+
+The JSON files repeat the "name"/"ticker"/"icon"/"decimals" keys and a 42-char
+hex address for every token. This format stores each address as 20 raw bytes,
+names/tickers/icon parameters once in a deduplicated string table, decimals
+in one byte, and icons as an index into a small URL template table.
+
+Layout (all integers unsigned; "varint" is LEB128):
+
+  magic        4 bytes  b"RTKN"
+  version      u8       1
+  chain_id     varint
+  templates    varint count, then per template: varint byte length + UTF-8
+  strings      varint count, then per string:   varint byte length + UTF-8
+  records      varint count, then per record, sorted by address:
+                 address   20 bytes
+                 name      varint  string index + 1 (0 = null)
+                 ticker    varint  string index + 1 (0 = null)
+                 decimals  u8      0-254, 255 = null
+                 icon      u8      template index, 255 = null
+                 param     varint  string index, only if the template has {param}
+
+Templates are URLs with placeholders expanded by the reader:
+  {chain}    chain id             {address}  lowercased 0x address
+  {slug}     Trust Wallet slug    {checksum} EIP-55 address
+  {param}    per-record string from the string table
+
+Template 0 is always "{param}", i.e. a literal URL. The table is the known
+templates from icon_templates.py plus the prefixes it detects for the chain,
+capped at 255 entries (MAX_TEMPLATES); icons that would match a template past
+the cap are stored as literals.
+
+Addresses must be lowercase 0x-prefixed 20-byte hex (as written by
+convert_addresses_to_lowercase.py); decoding yields lowercase keys.
+
+Usage:
+  python scripts/token_binary.py encode [--chain 1] [--check]
+  python scripts/token_binary.py decode src/utils/tokenData/1/address_to_metadata.bin
+"""
+
+import argparse
+import io
+import json
+import sys
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Tuple
+
+from atomic_json import write_bytes_atomic
+from icon_templates import ICON_TEMPLATES, build_template_table, expand_template, match_icon
+from token_data_common import CHAIN_IDS, TOKEN_DATA_DIR, load_json
+
+
+MAGIC = b"RTKN"
+FORMAT_VERSION = 1
+NULL_BYTE = 0xFF
+MAX_TEMPLATES = NULL_BYTE  # icon index is a u8 and 0xFF means null
+
+
+def _write_varint(out: BinaryIO, value: int) -> None:
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.write(bytes((byte | 0x80,)))
+        else:
+            out.write(bytes((byte,)))
+            return
+
+
+def _read_varint(buf: BinaryIO) -> int:
+    shift = result = 0
+    while True:
+        raw = buf.read(1)
+        if not raw:
+            raise ValueError("truncated varint")
+        result |= (raw[0] & 0x7F) << shift
+        if raw[0] < 0x80:
+            return result
+        shift += 7
+
+
+def _write_str(out: BinaryIO, s: str) -> None:
+    raw = s.encode("utf-8")
+    _write_varint(out, len(raw))
+    out.write(raw)
+
+
+def _read_str(buf: BinaryIO) -> str:
+    length = _read_varint(buf)
+    raw = buf.read(length)
+    if len(raw) != length:
+        raise ValueError("truncated string")
+    return raw.decode("utf-8")
+
+
+def encode_metadata(chain_id: int, metadata: Dict[str, dict], templates: List[str] = ICON_TEMPLATES) -> bytes:
+    templates = templates[:MAX_TEMPLATES]
+    strings: Dict[str, int] = {}
+
+    def intern(s: str) -> int:
+        if s not in strings:
+            strings[s] = len(strings)
+        return strings[s]
+
+    records = []
+    for addr in sorted(metadata):
+        meta = metadata[addr]
+        raw_addr = bytes.fromhex(addr[2:])
+        if not addr.startswith("0x") or len(raw_addr) != 20 or addr != addr.lower():
+            raise ValueError(f"not a lowercase 20-byte address: {addr!r}")
+
+        name = meta.get("name")
+        ticker = meta.get("ticker")
+        decimals = meta.get("decimals")
+        if decimals is not None and not (0 <= decimals < NULL_BYTE):
+            raise ValueError(f"decimals out of range for {addr}: {decimals!r}")
+
+        icon = meta.get("icon")
+        if icon is None:
+            icon_idx, param_idx = NULL_BYTE, None
+        else:
+            icon_idx, param = match_icon(templates, chain_id, addr, icon)
+            if icon_idx >= NULL_BYTE:
+                raise ValueError(f"template index {icon_idx} for {addr} collides with the null marker")
+            param_idx = intern(param) if param is not None else None
+
+        records.append((
+            raw_addr,
+            0 if name is None else intern(name) + 1,
+            0 if ticker is None else intern(ticker) + 1,
+            NULL_BYTE if decimals is None else decimals,
+            icon_idx,
+            param_idx,
+        ))
+
+    out = io.BytesIO()
+    out.write(MAGIC)
+    out.write(bytes((FORMAT_VERSION,)))
+    _write_varint(out, chain_id)
+    _write_varint(out, len(templates))
+    for template in templates:
+        _write_str(out, template)
+    _write_varint(out, len(strings))
+    for s in strings:  # dicts keep insertion order == index order
+        _write_str(out, s)
+    _write_varint(out, len(records))
+    for raw_addr, name_ref, ticker_ref, decimals, icon_idx, param_idx in records:
+        out.write(raw_addr)
+        _write_varint(out, name_ref)
+        _write_varint(out, ticker_ref)
+        out.write(bytes((decimals, icon_idx)))
+        if param_idx is not None:
+            _write_varint(out, param_idx)
+    return out.getvalue()
+
+
+def decode_metadata(data: bytes) -> Tuple[int, Dict[str, dict]]:
+    """Returns (chain id, lowercased address -> {name, ticker, icon, decimals})."""
+    buf = io.BytesIO(data)
+    if buf.read(4) != MAGIC:
+        raise ValueError("not a token metadata file (bad magic)")
+    version = buf.read(1)[0]
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported format version {version}")
+
+    chain_id = _read_varint(buf)
+    templates = [_read_str(buf) for _ in range(_read_varint(buf))]
+    strings = [_read_str(buf) for _ in range(_read_varint(buf))]
+
+    metadata: Dict[str, dict] = {}
+    for _ in range(_read_varint(buf)):
+        raw_addr = buf.read(20)
+        if len(raw_addr) != 20:
+            raise ValueError("truncated record")
+        address = "0x" + raw_addr.hex()
+        name_ref = _read_varint(buf)
+        ticker_ref = _read_varint(buf)
+        decimals, icon_idx = buf.read(2)
+
+        icon = None
+        if icon_idx != NULL_BYTE:
+            template = templates[icon_idx]
+            param = strings[_read_varint(buf)] if "{param}" in template else None
+            icon = expand_template(template, chain_id, address, param)
+
+        metadata[address] = {
+            "name": strings[name_ref - 1] if name_ref else None,
+            "ticker": strings[ticker_ref - 1] if ticker_ref else None,
+            "icon": icon,
+            "decimals": None if decimals == NULL_BYTE else decimals,
+        }
+    return chain_id, metadata
+
+
+def _normalized(metadata: Dict[str, dict]) -> Dict[str, dict]:
+    # Missing keys and explicit nulls are equivalent once encoded
+    return {addr: {k: meta.get(k) for k in ("name", "ticker", "icon", "decimals")} for addr, meta in metadata.items()}
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Encode/decode the compact binary token metadata format.")
+    sub = p.add_subparsers(dest="command", required=True)
+    enc = sub.add_parser("encode", help="Write <chain>/address_to_metadata.bin next to the JSON.")
+    enc.add_argument("--chain", type=int, action="append", help="Chain ID (repeatable). Defaults to all chains.")
+    enc.add_argument("--out-root", type=Path, default=TOKEN_DATA_DIR, help="tokenData root containing <chain>/ dirs.")
+    enc.add_argument("--check", action="store_true", help="Decode the result and compare with the JSON.")
+    dec = sub.add_parser("decode", help="Print a .bin file as JSON.")
+    dec.add_argument("path", type=Path)
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.command == "decode":
+        _, metadata = decode_metadata(args.path.read_bytes())
+        json.dump(metadata, sys.stdout, indent=2, sort_keys=True)
+        print()
+        return
+
+    for chain_id in args.chain or CHAIN_IDS:
+        chain_dir = args.out_root / str(chain_id)
+        json_path = chain_dir / "address_to_metadata.json"
+        metadata = load_json(json_path)
+        if not metadata:
+            print(f"Warning: no metadata for chain {chain_id} in {chain_dir}", file=sys.stderr)
+            continue
+        data = encode_metadata(chain_id, metadata, build_template_table(chain_id, metadata))
+        if args.check:
+            decoded_chain, decoded = decode_metadata(data)
+            if decoded_chain != chain_id or decoded != _normalized(metadata):
+                print(f"Error: chain {chain_id} does not round-trip", file=sys.stderr)
+                sys.exit(1)
+        out_path = chain_dir / "address_to_metadata.bin"
+        write_bytes_atomic(out_path, data)
+        json_size = json_path.stat().st_size
+        print(f"Chain {chain_id}: {len(metadata)} tokens, {json_size} -> {len(data)} bytes "
+              f"({json_size / len(data):.1f}x smaller). Output: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
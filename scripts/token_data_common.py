@@ -0,0 +1,34 @@
+"""
+Shared locations and JSON loading for the token data scripts.
+
+Every stage reads and writes the per-chain files under
+src/utils/tokenData/<chain>/ and keeps its local state under scripts/data/,
+so the paths, the supported chains and the lenient loader live here instead
+of in each script. Writes go through atomic_json.
+"""
+
+import json
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TOKEN_DATA_DIR = REPO_ROOT / "src" / "utils" / "tokenData"
+DATA_DIR = Path(__file__).resolve().parent / "data"
+CHAIN_IDS = (1, 8453)
+
+
+def load_json(path: Path, strict: bool = False) -> dict:
+    """
+    The JSON object stored at path, or {} if the file is missing or holds
+    something other than an object. Malformed JSON also yields {} unless
+    strict, in which case the JSONDecodeError propagates.
+    """
+    try:
+        with Path(path).open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except json.JSONDecodeError:
+        if strict:
+            raise
+        return {}
+    return data if isinstance(data, dict) else {}
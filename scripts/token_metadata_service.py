@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+Local token-metadata service: answers /api/token-metadata lookups from the
+exported token data, falling back to GeckoTerminal only for unknown tokens.
+
+src/app/api/token-metadata/route.ts forwards every lookup to the upstream
+`tokens/multi` endpoint, even for tokens already in our curated files. This
+service loads <chain>/address_to_metadata.json (or the registry database
+with --registry) into one dict per chain at startup and serves
+
+  GET /api/token-metadata?network=ethereum&addresses=0xabc,0xdef
+      -> {"data": [{"address", "name", "ticker", "icon", "price", "decimals"}], "count": N}
+
+with the same network names and response shape as route.ts. Known tokens
+are answered from the index (price 0, as route.ts does when upstream has no
+price). The rest go upstream in calls of up to 30 addresses through one
+pooled requests.Session, run in a thread pool so the event loop never
+blocks. Upstream answers, including "not found", are kept in an LRU cache
+with a TTL (--negative-ttl for not-found), so a token missing from our files
+costs one upstream call per TTL rather than one per request. Upstream
+failures are not cached; the response then simply lacks those tokens.
+
+Cache misses are coalesced (Coalescer): concurrent requests for the same
+(network, address) wait on one in-flight lookup, and misses arriving within
+--coalesce-window are sent together in tokens/multi calls of up to 30
+addresses. When a new token trends, a burst of identical lookups costs one
+upstream call instead of one per user. load_test_token_metadata.py measures
+the difference.
+
+  GET /healthz -> {"tokens": {chain: N}, "cache": N, "upstreamCalls": N}
+
+The HTTP side is a minimal HTTP/1.1 implementation over asyncio streams
+(GET/HEAD, keep-alive), enough for the app and curl. Point --upstream-base
+at stand_in_upstream.py to run it without an API key.
+
+Usage:
+  GECKO_KEY=... python scripts/token_metadata_service.py [--port 8080] [--registry scripts/data/token_registry.db]
+  python scripts/token_metadata_service.py --upstream-base http://127.0.0.1:8547
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from get_token_data import chunks
+from token_data_common import CHAIN_IDS, TOKEN_DATA_DIR, load_json
+from token_registry import iter_chain, open_registry
+
+
+API_BASE = "https://pro-api.coingecko.com/api/v3/onchain"
+MAX_ADDRESSES_PER_CALL = 30  # tokens/multi limit
+
+# route.ts network parameter -> (GeckoTerminal network id, chain id)
+NETWORKS: Dict[str, Tuple[str, int]] = {
+    "ethereum": ("eth", 1),
+    "base": ("base", 8453),
+}
+
+_MISS = object()
+_FAILED = object()  # Coalescer result for an address whose upstream call failed
+
+
+def _is_address(value: str) -> bool:
+    if len(value) != 42 or not value.startswith("0x"):
+        return False
+    try:
+        int(value[2:], 16)
+    except ValueError:
+        return False
+    return True
+
+
+def _record(address: str, name, ticker, icon, decimals, price: float = 0.0) -> dict:
+    return {"address": address, "name": name, "ticker": ticker, "icon": icon, "price": price, "decimals": decimals}
+
+
+def load_index(out_root: Path, registry: Optional[Path], chain_ids) -> Dict[int, Dict[str, dict]]:
+    """chain -> address -> response record, built once so lookups are a dict get."""
+    index: Dict[int, Dict[str, dict]] = {}
+    if registry is not None:
+        conn = open_registry(registry)
+        try:
+            for chain_id in chain_ids:
+                index[chain_id] = {
+                    addr: _record(addr, meta["name"], meta["ticker"], meta["icon"], meta["decimals"])
+                    for addr, meta, _ in iter_chain(conn, chain_id)
+                }
+        finally:
+            conn.close()
+        return index
+
+    for chain_id in chain_ids:
+        metadata = load_json(out_root / str(chain_id) / "address_to_metadata.json")
+        index[chain_id] = {
+            addr.lower(): _record(addr.lower(), meta.get("name"), meta.get("ticker"), meta.get("icon"), meta.get("decimals"))
+            for addr, meta in metadata.items()
+            if isinstance(meta, dict)
+        }
+    return index
+
+
+class TTLCache:
+    """LRU cache whose entries also expire ttl seconds after being set."""
+
+    def __init__(self, maxsize: int, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[float, object]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires, value = entry
+        if expires <= self.clock():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value, ttl: float) -> None:
+        self._data[key] = (self.clock() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+class Upstream:
+    """GeckoTerminal tokens/multi over a pooled session, callable from asyncio."""
+
+    def __init__(self, base_url: str, api_key: Optional[str], pool_size: int = 8, timeout: float = 10.0):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.calls = 0
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["Accept"] = "application/json"
+        if api_key:
+            self.session.headers["x-cg-pro-api-key"] = api_key
+        self.executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="upstream")
+
+    def _fetch_sync(self, network_id: str, addresses: List[str]) -> Dict[str, dict]:
+        url = f"{self.base_url}/networks/{network_id}/tokens/multi/{','.join(addresses)}"
+        resp = self.session.get(url, timeout=self.timeout)
+        resp.raise_for_status()
+        found: Dict[str, dict] = {}
+        for token in resp.json().get("data") or []:
+            attrs = token.get("attributes") or {}
+            addr = (attrs.get("address") or "").lower()
+            try:
+                price = float(attrs.get("price_usd") or 0)
+            except (TypeError, ValueError):
+                price = 0.0
+            found[addr] = _record(addr, attrs.get("name"), attrs.get("symbol"), attrs.get("image_url"),
+                                  attrs.get("decimals"), price)
+        return found
+
+    async def fetch(self, network_id: str, addresses: List[str]) -> Dict[str, Optional[dict]]:
+        """
+        address -> record, or None when upstream does not know it. Addresses
+        whose call failed are logged and left out, so other batches' answers
+        are still returned.
+        """
+        loop = asyncio.get_running_loop()
+        batches = list(chunks(addresses, MAX_ADDRESSES_PER_CALL))
+        self.calls += len(batches)
+        results = await asyncio.gather(
+            *(loop.run_in_executor(self.executor, self._fetch_sync, network_id, batch) for batch in batches),
+            return_exceptions=True,
+        )
+        found: Dict[str, Optional[dict]] = {}
+        for batch, result in zip(batches, results):
+            if isinstance(result, (requests.RequestException, ValueError)):
+                print(f"[warn] upstream lookup of {len(batch)} addresses failed: {result}", file=sys.stderr)
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            for addr in batch:
+                found[addr] = result.get(addr)
+        return found
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=False)
+        self.session.close()
+
+
+class Coalescer:
+    """
+    Single-flight front for Upstream. Concurrent lookups of the same (network,
+    address) share one future, and addresses requested within `window`
+    seconds of each other go out together in calls of up to 30.
+    """
+
+    def __init__(self, upstream: Upstream, window: float = 0.01):
+        self.upstream = upstream
+        self.window = window
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._pending: Dict[str, List[str]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+
+    @property
+    def calls(self) -> int:
+        return self.upstream.calls
+
+    async def fetch(self, network_id: str, addresses: List[str]) -> Dict[str, Optional[dict]]:
+        """Same contract as Upstream.fetch."""
+        loop = asyncio.get_running_loop()
+        futures: Dict[str, asyncio.Future] = {}
+        for addr in addresses:
+            future = self._inflight.get((network_id, addr))
+            if future is None:
+                future = self._inflight[(network_id, addr)] = loop.create_future()
+                self._enqueue(loop, network_id, addr)
+            futures[addr] = future
+
+        # shield: a cancelled caller must not cancel lookups other callers share
+        results = await asyncio.gather(*(asyncio.shield(f) for f in futures.values()), return_exceptions=True)
+        # Failed or cancelled lookups were logged by _run/Upstream; drop just those addresses
+        return {
+            addr: result
+            for addr, result in zip(futures, results)
+            if result is not _FAILED and not isinstance(result, BaseException)
+        }
+
+    def _enqueue(self, loop: asyncio.AbstractEventLoop, network_id: str, addr: str) -> None:
+        pending = self._pending.setdefault(network_id, [])
+        pending.append(addr)
+        if len(pending) >= MAX_ADDRESSES_PER_CALL:
+            self._flush(network_id)
+        elif network_id not in self._timers:
+            self._timers[network_id] = loop.call_later(self.window, self._flush, network_id)
+
+    def _flush(self, network_id: str) -> None:
+        timer = self._timers.pop(network_id, None)
+        if timer is not None:
+            timer.cancel()
+        for batch in chunks(self._pending.pop(network_id, []), MAX_ADDRESSES_PER_CALL):
+            asyncio.ensure_future(self._run(network_id, batch))
+
+    async def _run(self, network_id: str, batch: List[str]) -> None:
+        found: Optional[Dict[str, Optional[dict]]] = None
+        try:
+            found = await self.upstream.fetch(network_id, batch)
+        except Exception as e:  # noqa: BLE001 - waiters just miss these addresses
+            print(f"[warn] upstream lookup of {len(batch)} addresses failed: {e!r}", file=sys.stderr)
+            found = {}
+        finally:
+            # Also runs on cancellation, so no waiter is left on an unresolved future
+            for addr in batch:
+                future = self._inflight.pop((network_id, addr), None)
+                if future is None or future.done():
+                    continue
+                if found is None:
+                    future.cancel()
+                else:
+                    future.set_result(found.get(addr, _FAILED))
+
+    def close(self) -> None:
+        self.upstream.close()
+
+
+class MetadataService:
+    def __init__(
+        self,
+        index: Dict[int, Dict[str, dict]],
+        upstream,
+        cache: TTLCache,
+        ttl: float = 3600.0,
+        negative_ttl: float = 300.0,
+    ):
+        self.index = index
+        self.upstream = upstream
+        self.cache = cache
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+    async def lookup(self, network: str, addresses: List[str]) -> List[dict]:
+        """Records for the addresses that resolve, in request order, without duplicates."""
+        network_id, chain_id = NETWORKS[network]
+        local = self.index.get(chain_id, {})
+        found: Dict[str, Optional[dict]] = {}
+        missing: List[str] = []
+        for addr in dict.fromkeys(addresses):
+            record = local.get(addr)
+            if record is None:
+                record = self.cache.get((chain_id, addr), _MISS)
+            if record is _MISS:
+                missing.append(addr)
+            else:
+                found[addr] = record
+
+        if missing and self.upstream is not None:
+            found.update(await self._fetch_upstream(chain_id, network_id, missing))
+        return [found[addr] for addr in dict.fromkeys(addresses) if found.get(addr)]
+
+    async def _fetch_upstream(self, chain_id: int, network_id: str, addresses: List[str]) -> Dict[str, Optional[dict]]:
+        # Only answered addresses come back; failed ones are retried on the next request
+        fetched = await self.upstream.fetch(network_id, addresses)
+        for addr, record in fetched.items():
+            self.cache.set((chain_id, addr), record, self.ttl if record else self.negative_ttl)
+        return fetched
+
+    def health(self) -> dict:
+        return {
+            "tokens": {str(chain_id): len(tokens) for chain_id, tokens in self.index.items()},
+            "cache": len(self.cache),
+            "upstreamCalls": self.upstream.calls if self.upstream else 0,
+        }
+
+    async def handle_get(self, target: str) -> Tuple[int, dict]:
+        url = urlsplit(target)
+        if url.path == "/healthz":
+            return 200, self.health()
+        if url.path != "/api/token-metadata":
+            return 404, {"error": "not_found"}
+
+        params = parse_qs(url.query)
+        network = (params.get("network", [""])[0]).lower()
+        if network not in NETWORKS:
+            return 400, {"error": "unsupported_network", "details": f"network must be one of {sorted(NETWORKS)}"}
+        addresses = [a.strip().lower() for value in params.get("addresses", []) for a in value.split(",") if a.strip()]
+        invalid = [a for a in addresses if not _is_address(a)]
+        if not addresses or invalid:
+            return 400, {"error": "invalid_addresses", "details": invalid[:5] or "no addresses given"}
+
+        data = await self.lookup(network, addresses)
+        return 200, {"data": data, "count": len(data)}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers: Dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length") or 0)
+                if length:
+                    await reader.readexactly(length)
+
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3:
+                    status, payload = 400, {"error": "bad_request"}
+                elif parts[0] not in ("GET", "HEAD"):
+                    status, payload = 405, {"error": "method_not_allowed"}
+                else:
+                    try:
+                        status, payload = await self.handle_get(parts[1])
+                    except Exception as e:  # noqa: BLE001 - mirror route.ts' catch-all 500
+                        print(f"[error] {parts[1]}: {e!r}", file=sys.stderr)
+                        status, payload = 500, {"error": "internal_server_error", "message": str(e)}
+
+                keep_alive = (len(parts) == 3 and parts[2] == "HTTP/1.1"
+                              and headers.get("connection", "").lower() != "close")
+                body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+                head = (
+                    f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                ).encode("latin-1")
+                writer.write(head if parts[:1] == ["HEAD"] else head + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(service: MetadataService, host: str, port: int) -> None:
+    server = await asyncio.start_server(service.handle_connection, host, port, backlog=1024)
+    async with server:
+        await server.serve_forever()
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Serve token metadata from the local index with a cached upstream fallback.")
+    p.add_argument("--host", default="127.0.0.1", help="Interface to bind.")
+    p.add_argument("--port", type=int, default=8080, help="Port to listen on.")
+    p.add_argument("--chain", type=int, action="append", help="Chain ID (repeatable). Defaults to all chains.")
+    p.add_argument("--out-root", type=Path, default=TOKEN_DATA_DIR, help="tokenData root containing <chain>/ dirs.")
+    p.add_argument("--registry", type=Path, default=None, help="Load from this registry database instead of tokenData.")
+    p.add_argument("--upstream-base", default=API_BASE, help="GeckoTerminal onchain API base URL.")
+    p.add_argument("--no-upstream", action="store_true", help="Answer from the local index only.")
+    p.add_argument("--pool-size", type=int, default=8, help="Upstream connections and worker threads.")
+    p.add_argument("--timeout", type=float, default=10.0, help="Upstream request timeout in seconds.")
+    p.add_argument("--cache-size", type=int, default=50000, help="Upstream results kept in the LRU cache.")
+    p.add_argument("--ttl", type=float, default=3600.0, help="Seconds to cache tokens found upstream.")
+    p.add_argument("--negative-ttl", type=float, default=300.0, help="Seconds to cache tokens upstream did not know.")
+    p.add_argument("--coalesce-window", type=float, default=0.01,
+                   help="Seconds to gather concurrent misses into one upstream call (0 disables coalescing).")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    chain_ids = args.chain or CHAIN_IDS
+    start = time.perf_counter()
+    index = load_index(args.out_root, args.registry, chain_ids)
+    total = sum(len(tokens) for tokens in index.values())
+    print(f"Indexed {total} tokens across {len(index)} chains in {time.perf_counter() - start:.2f}s")
+
+    upstream = None
+    if not args.no_upstream:
+        api_key = os.environ.get("GECKO_KEY")
+        if not api_key and args.upstream_base == API_BASE:
+            print("Warning: GECKO_KEY is not set; upstream lookups will be rejected", file=sys.stderr)
+        upstream = Upstream(args.upstream_base, api_key, args.pool_size, args.timeout)
+        if args.coalesce_window > 0:
+            upstream = Coalescer(upstream, args.coalesce_window)
+
+    service = MetadataService(index, upstream, TTLCache(args.cache_size), args.ttl, args.negative_ttl)
+    print(f"Listening on http://{args.host}:{args.port}/api/token-metadata")
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if upstream is not None:
+            upstream.close()
+
+
+if __name__ == "__main__":
+    main()
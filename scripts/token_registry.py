@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+SQLite token registry used as the pipeline's source of truth.
+
+Ingest scripts upsert their records into one indexed `tokens` table keyed by
+(chain_id, address) in a single transaction per batch, instead of loading and
+rewriting address_to_metadata.json. Fields are resolved with the same
+per-field precedence as merge_token_sources.py, and the winning source of
+every field is kept in the `provenance` column. A separate export step renders
+the JSON files the frontend imports.
+
+Usage:
+  python scripts/token_registry.py import              # seed from tokenData/*
+  python scripts/token_registry.py export [--chain 1]  # render tokenData/*
+  python scripts/token_registry.py stats
+"""
+
+import argparse
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from atomic_json import write_json_atomic
+from merge_token_sources import FIELD_PRECEDENCE, FIELDS, _has_value
+from token_data_common import CHAIN_IDS, DATA_DIR, TOKEN_DATA_DIR, load_json
+
+DEFAULT_DB = DATA_DIR / "token_registry.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tokens (
+    chain_id    INTEGER NOT NULL,
+    address     TEXT    NOT NULL,
+    name        TEXT,
+    ticker      TEXT,
+    icon        TEXT,
+    decimals    INTEGER,
+    source      TEXT    NOT NULL,
+    provenance  TEXT    NOT NULL DEFAULT '{}',
+    updated_at  INTEGER NOT NULL,
+    PRIMARY KEY (chain_id, address)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_tokens_ticker ON tokens (chain_id, ticker COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_tokens_name   ON tokens (chain_id, name COLLATE NOCASE);
+"""
+
+UPSERT_SQL = """
+INSERT INTO tokens (chain_id, address, name, ticker, icon, decimals, source, provenance, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (chain_id, address) DO UPDATE SET
+    name = excluded.name,
+    ticker = excluded.ticker,
+    icon = excluded.icon,
+    decimals = excluded.decimals,
+    source = excluded.source,
+    provenance = excluded.provenance,
+    updated_at = excluded.updated_at
+"""
+
+
+def open_registry(path: Path = DEFAULT_DB) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _source_rank(field: str, source: Optional[str]) -> int:
+    order = FIELD_PRECEDENCE[field]
+    return order.index(source) if source in order else len(order)
+
+
+def _existing_rows(conn: sqlite3.Connection, chain_id: int, addresses: List[str]) -> Dict[str, tuple]:
+    rows: Dict[str, tuple] = {}
+    # Stay under SQLite's default bound-parameter limit.
+    for i in range(0, len(addresses), 900):
+        chunk = addresses[i:i + 900]
+        placeholders = ",".join("?" * len(chunk))
+        for row in conn.execute(
+            f"SELECT address, name, ticker, icon, decimals, provenance FROM tokens "
+            f"WHERE chain_id = ? AND address IN ({placeholders})",
+            (chain_id, *chunk),
+        ):
+            rows[row[0]] = row[1:]
+    return rows
+
+
+def upsert_tokens(conn: sqlite3.Connection, chain_id: int, records: Dict[str, dict], source: str) -> Tuple[int, int]:
+    """
+    Bulk upsert address -> {name, ticker, icon, decimals} records from source.
+
+    An incoming field only replaces the stored one when it is non-empty and
+    source ranks at least as high for that field as the stored provenance, so
+    the result does not depend on ingest order. Rows with no effective change
+    are not rewritten. Returns (inserted, updated).
+    """
+    by_addr = {addr.lower(): meta for addr, meta in records.items() if isinstance(meta, dict)}
+    existing = _existing_rows(conn, chain_id, sorted(by_addr))
+    now = int(time.time())
+    rows = []
+    inserted = 0
+
+    for addr in sorted(by_addr):
+        meta = by_addr[addr]
+        is_new = addr not in existing
+        if is_new:
+            values = dict.fromkeys(FIELDS)
+            provenance = {}
+            inserted += 1
+        else:
+            *current, provenance_json = existing[addr]
+            values = dict(zip(FIELDS, current))
+            provenance = json.loads(provenance_json or "{}")
+
+        changed = is_new
+        for field in FIELDS:
+            incoming = meta.get(field)
+            if not _has_value(incoming):
+                continue
+            if not _has_value(values[field]) or _source_rank(field, source) <= _source_rank(field, provenance.get(field)):
+                changed = changed or values[field] != incoming or provenance.get(field) != source
+                values[field] = incoming
+                provenance[field] = source
+        if not changed:
+            continue
+
+        rows.append((
+            chain_id, addr,
+            values["name"], values["ticker"], values["icon"], values["decimals"],
+            source, json.dumps(provenance, sort_keys=True), now,
+        ))
+
+    with conn:
+        conn.executemany(UPSERT_SQL, rows)
+    return inserted, len(rows) - inserted
+
+
+def iter_chain(conn: sqlite3.Connection, chain_id: int) -> Iterator[Tuple[str, dict, dict]]:
+    """Yield (address, metadata, provenance) for chain_id in address order."""
+    for addr, name, ticker, icon, decimals, provenance in conn.execute(
+        "SELECT address, name, ticker, icon, decimals, provenance FROM tokens "
+        "WHERE chain_id = ? ORDER BY address",
+        (chain_id,),
+    ):
+        meta = {"name": name, "ticker": ticker, "icon": icon, "decimals": decimals}
+        yield addr, meta, json.loads(provenance or "{}")
+
+
+def chain_addresses(conn: sqlite3.Connection, chain_id: int) -> Set[str]:
+    """Every address stored for chain_id."""
+    return {addr for (addr,) in conn.execute("SELECT address FROM tokens WHERE chain_id = ?", (chain_id,))}
+
+
+def export_chain(conn: sqlite3.Connection, chain_id: int, out_root: Path = TOKEN_DATA_DIR) -> Tuple[int, bool]:
+    """
+    Render <out_root>/<chain>/address_to_metadata.json and its provenance
+    sidecar from the registry. Fields with no value are omitted, as in the
+    hand-maintained file, so "field not in record" still means unknown.
+    Returns (token count, whether the file changed).
+    """
+    metadata: Dict[str, dict] = {}
+    provenance: Dict[str, dict] = {}
+    for addr, meta, origin in iter_chain(conn, chain_id):
+        metadata[addr] = {field: value for field, value in meta.items() if value is not None}
+        provenance[addr] = origin
+
+    out_dir = out_root / str(chain_id)
+    changed = write_json_atomic(out_dir / "address_to_metadata.json", metadata, indent=2, sort_keys=True)
+    write_json_atomic(out_dir / "address_to_metadata.provenance.json", provenance, indent=2, sort_keys=True)
+    return len(metadata), changed
+
+
+def import_chain(conn: sqlite3.Connection, chain_id: int, out_root: Path = TOKEN_DATA_DIR) -> Tuple[int, int]:
+    """Seed the registry from the checked-in address_to_metadata.json as source 'existing'."""
+    records = load_json(out_root / str(chain_id) / "address_to_metadata.json")
+    return upsert_tokens(conn, chain_id, records, "existing")
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="SQLite token registry: import, export and inspect token metadata.")
+    p.add_argument("command", choices=("import", "export", "stats"))
+    p.add_argument("--db", type=Path, default=DEFAULT_DB, help="Registry database path.")
+    p.add_argument("--chain", type=int, action="append", help="Chain ID (repeatable). Defaults to all chains.")
+    p.add_argument("--out-root", type=Path, default=TOKEN_DATA_DIR, help="tokenData root to read/write.")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    conn = open_registry(args.db)
+    chain_ids = args.chain or list(CHAIN_IDS)
+
+    for chain_id in chain_ids:
+        if args.command == "import":
+            inserted, updated = import_chain(conn, chain_id, args.out_root)
+            print(f"Chain {chain_id}: imported {inserted} new, {updated} existing tokens into {args.db}")
+        elif args.command == "export":
+            started = time.perf_counter()
+            count, changed = export_chain(conn, chain_id, args.out_root)
+            status = "written" if changed else "unchanged"
+            print(f"Chain {chain_id}: exported {count} tokens ({status}) in {time.perf_counter() - started:.3f}s")
+        else:
+            count, = conn.execute("SELECT COUNT(*) FROM tokens WHERE chain_id = ?", (chain_id,)).fetchone()
+            by_source = conn.execute(
+                "SELECT source, COUNT(*) FROM tokens WHERE chain_id = ? GROUP BY source ORDER BY source",
+                (chain_id,),
+            ).fetchall()
+            print(f"Chain {chain_id}: {count} tokens, last written by {dict(by_source)}")
+
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Versioned snapshots of address_to_metadata.json with incremental patches.
+
+Every run of `snapshot` compares the chain's current metadata with the latest
+snapshot; if it changed, the version is bumped and written to
+<out-root>/<chain>/versions/:
+
+  v<N>.json                full snapshot of the latest version only (internal)
+  revert_<N>_<N-1>.json    diff from N back to N-1, for the last `keep` versions
+                           (internal)
+  patch_<M>_<N>.json       diff from each of the previous `keep` versions M to N
+
+Older versions are rebuilt from v<N>.json by applying the revert patches, so
+everything needed to patch from the last `keep` versions is committed with
+the tree, and a fresh clone or CI run writes the same patches as the machine
+that made the previous snapshot, while the repo holds a single full copy.
+
+and <out-root>/<chain>/versions.json indexes them:
+
+  {"chain": 1, "version": N, "sha256": "<canonical hash of v<N>>",
+   "patches": {"<M>": {"file": "versions/patch_<M>_<N>.json", "bytes": ...}, ...}}
+
+A client holding version M fetches patch_<M>_<N>.json if it is listed and the
+full file otherwise. Patches look like:
+
+  {"chain": 1, "from": M, "to": N, "fromSha256": "...", "toSha256": "...",
+   "added":   {address: metadata, ...},
+   "removed": [address, ...],
+   "changed": {address: {field: new value, ...}, ...},
+   "unset":   {address: [field, ...], ...}}
+
+apply_patch() checks the patch's fields and both hashes, so a patch applied to the wrong base or
+producing the wrong result fails loudly instead of corrupting a cache. Every
+patch written here is applied to its base and checked before it is kept.
+
+Usage:
+  python scripts/token_snapshots.py snapshot [--chain 1] [--keep 5]
+  python scripts/token_snapshots.py apply BASE.json PATCH.json [--out OUT.json]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from atomic_json import canonical_hash, write_json_atomic
+from token_data_common import CHAIN_IDS, TOKEN_DATA_DIR, load_json
+
+
+PATCH_KEYS = ("chain", "from", "to", "fromSha256", "toSha256", "added", "removed", "changed", "unset")
+
+
+class PatchError(ValueError):
+    pass
+
+
+def diff_metadata(old: Dict[str, dict], new: Dict[str, dict]) -> dict:
+    """Field-level diff turning old into new (without version headers)."""
+    added = {addr: new[addr] for addr in sorted(new.keys() - old.keys())}
+    removed = sorted(old.keys() - new.keys())
+    changed: Dict[str, dict] = {}
+    unset: Dict[str, List[str]] = {}
+    for addr in sorted(old.keys() & new.keys()):
+        before, after = old[addr], new[addr]
+        if before == after:
+            continue
+        fields = {k: v for k, v in after.items() if k not in before or before[k] != v}
+        dropped = sorted(before.keys() - after.keys())
+        if fields:
+            changed[addr] = fields
+        if dropped:
+            unset[addr] = dropped
+    return {"added": added, "removed": removed, "changed": changed, "unset": unset}
+
+
+def make_patch(chain_id: int, from_version: int, old: Dict[str, dict], to_version: int, new: Dict[str, dict]) -> dict:
+    return {
+        "chain": chain_id,
+        "from": from_version,
+        "to": to_version,
+        "fromSha256": canonical_hash(old),
+        "toSha256": canonical_hash(new),
+        **diff_metadata(old, new),
+    }
+
+
+def apply_patch(metadata: Dict[str, dict], patch: dict) -> Dict[str, dict]:
+    """Return a new dict with patch applied; raises PatchError on a malformed patch or a hash mismatch."""
+    missing = [key for key in PATCH_KEYS if key not in patch]
+    if missing:
+        raise PatchError(f"not a metadata patch (missing {', '.join(missing)})")
+    if canonical_hash(metadata) != patch["fromSha256"]:
+        raise PatchError(f"base does not match version {patch['from']} of chain {patch['chain']}")
+
+    result = {addr: dict(meta) for addr, meta in metadata.items()}
+    for addr in patch["removed"]:
+        del result[addr]
+    for addr, meta in patch["added"].items():
+        result[addr] = dict(meta)
+    for addr, fields in patch["changed"].items():
+        result[addr].update(fields)
+    for addr, fields in patch["unset"].items():
+        for field in fields:
+            result[addr].pop(field, None)
+
+    if canonical_hash(result) != patch["toSha256"]:
+        raise PatchError(f"patched data does not match version {patch['to']} of chain {patch['chain']}")
+    return result
+
+
+def rebuild_versions(versions_dir: Path, latest: int, oldest: int) -> Dict[int, Dict[str, dict]]:
+    """
+    Versions oldest..latest that can be rebuilt from v<latest>.json and the
+    revert patches, newest first; stops at the first missing or broken link.
+    """
+    current = load_json(versions_dir / f"v{latest}.json")
+    if latest < 1 or not current:
+        return {}
+    versions = {latest: current}
+    for version in range(latest, max(oldest, 1), -1):
+        revert = load_json(versions_dir / f"revert_{version}_{version - 1}.json")
+        try:
+            current = apply_patch(current, revert)
+        except PatchError as e:
+            print(f"Warning: cannot rebuild v{version - 1} from {versions_dir}: {e}", file=sys.stderr)
+            break
+        versions[version - 1] = current
+    return versions
+
+
+def snapshot_chain(chain_dir: Path, chain_id: int, metadata: Dict[str, dict], keep: int) -> dict:
+    """Record metadata as a new version if it changed; returns the (possibly unchanged) index."""
+    versions_dir = chain_dir / "versions"
+    index_path = chain_dir / "versions.json"
+    index = load_json(index_path)
+    digest = canonical_hash(metadata)
+    if index.get("sha256") == digest:
+        return index
+
+    previous = index.get("version", 0)
+    version = previous + 1
+    bases = rebuild_versions(versions_dir, previous, version - keep)
+    write_json_atomic(versions_dir / f"v{version}.json", metadata, indent=None, sort_keys=True)
+    if previous in bases:
+        revert = make_patch(chain_id, version, metadata, previous, bases[previous])
+        apply_patch(metadata, revert)
+        write_json_atomic(versions_dir / f"revert_{version}_{previous}.json", revert, indent=None, sort_keys=True)
+
+    patches: Dict[str, dict] = {}
+    for prev in sorted(bases):
+        base = bases[prev]
+        patch = make_patch(chain_id, prev, base, version, metadata)
+        apply_patch(base, patch)  # never publish a patch that does not round-trip
+        name = f"patch_{prev}_{version}.json"
+        write_json_atomic(versions_dir / name, patch, indent=None, sort_keys=True)
+        patches[str(prev)] = {"file": f"versions/{name}", "bytes": (versions_dir / name).stat().st_size}
+
+    index = {"chain": chain_id, "version": version, "sha256": digest, "patches": patches}
+    write_json_atomic(index_path, index, indent=2)
+
+    # The latest snapshot, the reverts that rebuild the next run's bases and patches to the current version
+    live = {f"v{version}.json"}
+    live.update(f"revert_{v}_{v - 1}.json" for v in range(version - keep + 2, version + 1))
+    live.update(Path(p["file"]).name for p in patches.values())
+    for path in versions_dir.glob("*.json"):
+        if path.name not in live:
+            path.unlink()
+    return index
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Version token metadata exports and write incremental patches.")
+    sub = p.add_subparsers(dest="command", required=True)
+    snap = sub.add_parser("snapshot", help="Record the current metadata as a new version if it changed.")
+    snap.add_argument("--chain", type=int, action="append", help="Chain ID (repeatable). Defaults to all chains.")
+    snap.add_argument("--out-root", type=Path, default=TOKEN_DATA_DIR, help="tokenData root containing <chain>/ dirs.")
+    snap.add_argument("--keep", type=int, default=5, help="Write patches from this many previous versions.")
+    app = sub.add_parser("apply", help="Apply a patch file to a metadata JSON file.")
+    app.add_argument("base", type=Path)
+    app.add_argument("patch", type=Path)
+    app.add_argument("--out", type=Path, help="Output path (default: overwrite base).")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.command == "apply":
+        try:
+            patch = load_json(args.patch, strict=True)
+            if not patch:
+                raise PatchError("patch file not found or empty")
+            result = apply_patch(load_json(args.base), patch)
+        except (PatchError, json.JSONDecodeError) as e:
+            print(f"Error: {args.patch}: {e}", file=sys.stderr)
+            sys.exit(1)
+        out_path = args.out or args.base
+        write_json_atomic(out_path, result, indent=2, sort_keys=True)
+        print(f"Applied {args.patch.name} (v{patch['from']} -> v{patch['to']}). Output: {out_path}")
+        return
+
+    for chain_id in args.chain or CHAIN_IDS:
+        chain_dir = args.out_root / str(chain_id)
+        metadata = load_json(chain_dir / "address_to_metadata.json")
+        if not metadata:
+            print(f"Warning: no metadata for chain {chain_id} in {chain_dir}", file=sys.stderr)
+            continue
+        index = snapshot_chain(chain_dir, chain_id, metadata, args.keep)
+        sizes = ", ".join(f"v{v}: {info['bytes']}" for v, info in index["patches"].items())
+        print(f"Chain {chain_id}: version {index['version']}" + (f"; patch bytes {sizes}" if sizes else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,9 @@ from typing import Dict, Tuple, List, Set
 
 import requests
 
+from atomic_json import write_json_atomic
+from token_data_common import DATA_DIR, TOKEN_DATA_DIR, load_json
+from token_registry import open_registry, upsert_tokens
 
 # CoinGecko Onchain API v3 (Pro)
 API_BASE = "https://pro-api.coingecko.com/api/v3/onchain"
@@ -17,32 +20,29 @@ NETWORKS = {
 }
 
 
-def _load_json(path: Path) -> dict:
-    try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data if isinstance(data, dict) else {}
-    except FileNotFoundError:
-        return {}
-    except json.JSONDecodeError:
-        return {}
+def _write_json(path: Path, data: dict) -> bool:
+    return write_json_atomic(path, data, indent=2, sort_keys=True)
 
 
-def _write_json(path: Path, data: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, sort_keys=True)
+def _parse_usd(value) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
 
 
-def fetch_top_pools_tokens(api_key: str, network: str, max_pools: int = 1000, per_page: int = 20, delay_every: int = 5, sleep_seconds: float = 2.0) -> Tuple[Dict[str, dict], List[str]]:
+def fetch_top_pools_tokens(api_key: str, network: str, max_pools: int = 1000, per_page: int = 20, delay_every: int = 5, sleep_seconds: float = 2.0) -> Tuple[Dict[str, dict], List[str], Dict[str, float]]:
     """
     Fetch tokens referenced by top pools for a given network from GeckoTerminal.
 
     Returns a mapping of lowercased token address -> token attributes dict
-    (containing at least name, symbol, decimals, image_url when available).
+    (containing at least name, symbol, decimals, image_url when available),
+    the sorted tickers seen, and lowercased token address -> summed 24h USD
+    volume of every fetched pool the token is a base or quote of.
     """
     tokens: Dict[str, dict] = {}
     tickers_processed: Set[str] = set()
+    volumes: Dict[str, float] = {}
     total_pages = (max_pools + per_page - 1) // per_page
 
     for page in range(1, total_pages + 1):
@@ -94,29 +94,55 @@ def fetch_top_pools_tokens(api_key: str, network: str, max_pools: int = 1000, pe
             if quote_sym:
                 tickers_processed.add(quote_sym)
 
+            # Credit the pool's 24h volume to both sides for popularity ranking
+            pool_volume = _parse_usd(((pool.get("attributes") or {}).get("volume_usd") or {}).get("h24"))
+            for side_attr in (base_attr, quote_attr):
+                side_addr = (side_attr.get("address") or "").lower()
+                if side_addr:
+                    volumes[side_addr] = volumes.get(side_addr, 0.0) + pool_volume
+
         # Respect rate limits with periodic delays
         if page % delay_every == 0:
             time.sleep(sleep_seconds)
 
-    return tokens, sorted(tickers_processed)
+    return tokens, sorted(tickers_processed), volumes
+
+
+def build_popularity(volumes: Dict[str, float]) -> Dict[str, dict]:
+    """
+    Rank token addresses by summed 24h pool volume (ties broken by address).
+
+    Returns lowercased address -> { rank, score, volume_usd_h24 } where rank
+    starts at 1 and score is the volume normalized to the top token (0..1].
+    """
+    ordered = sorted(volumes.items(), key=lambda kv: (-kv[1], kv[0]))
+    top_volume = ordered[0][1] if ordered else 0.0
+    popularity: Dict[str, dict] = {}
+    for rank, (addr, volume) in enumerate(ordered, start=1):
+        popularity[addr] = {
+            "rank": rank,
+            "score": round(volume / top_volume, 6) if top_volume > 0 else 0.0,
+            "volume_usd_h24": round(volume, 2),
+        }
+    return popularity
 
 
 def append_tokens_to_metadata(tokens: Dict[str, dict], out_path: Path) -> Tuple[int, int, int]:
     """
     Append tokens to address_to_metadata.json without overwriting existing values.
-    - If address exists: only add 'decimals' if missing.
+    - If address exists: only add 'decimals' if missing or null.
     - If address does not exist: add with name, ticker, icon, decimals.
 
     Returns (existing_updated, newly_added, total_seen)
     """
-    mapping = _load_json(out_path)
+    mapping = load_json(out_path)
     existing_updated = 0
     newly_added = 0
 
     for addr, meta in tokens.items():
         if addr in mapping:
             # Do not overwrite existing fields; only add decimals if missing
-            if isinstance(mapping[addr], dict) and "decimals" not in mapping[addr]:
+            if isinstance(mapping[addr], dict) and mapping[addr].get("decimals") is None:
                 dec = meta.get("decimals")
                 if dec is not None:
                     mapping[addr]["decimals"] = dec
@@ -135,25 +161,41 @@ def append_tokens_to_metadata(tokens: Dict[str, dict], out_path: Path) -> Tuple[
 
 
 def main() -> None:
-    if len(sys.argv) != 2:
-        print("Usage: python scripts/top_pools_to_metadata.py <COINGECKO_PRO_API_KEY>")
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python scripts/top_pools_to_metadata.py <COINGECKO_PRO_API_KEY> [REGISTRY_DB]")
         sys.exit(1)
 
     api_key = sys.argv[1]
-    repo_root = Path(__file__).resolve().parent.parent
+    # With a registry, tokens are upserted there (source 'coingecko') instead of appended to JSON
+    conn = open_registry(Path(sys.argv[2])) if len(sys.argv) == 3 else None
 
     all_tickers: Set[str] = set()
 
     for network, chain_dir in NETWORKS.items():
         print(f"Fetching top pools tokens for network={network}...")
-        tokens, tickers = fetch_top_pools_tokens(api_key, network)
+        tokens, tickers, volumes = fetch_top_pools_tokens(api_key, network)
         all_tickers.update(tickers)
 
-        out_path = repo_root / "src" / "utils" / "tokenData" / chain_dir / "address_to_metadata.json"
-        updated, added, seen = append_tokens_to_metadata(tokens, out_path)
-        print(
-            f"Network {network}: processed {seen} tokens; added {added}, updated existing decimals {updated}. Output: {out_path}"
-        )
+        chain_root = TOKEN_DATA_DIR / chain_dir
+        records_path = DATA_DIR / f"coingecko_tokens_{chain_dir}.json"
+        _write_json(records_path, tokens)
+        print(f"Network {network}: wrote {len(tokens)} token records for merge_token_sources.py. Output: {records_path}")
+        out_path = chain_root / "address_to_metadata.json"
+        if conn is not None:
+            added, updated = upsert_tokens(conn, int(chain_dir), tokens, "coingecko")
+            print(f"Network {network}: processed {len(tokens)} tokens; registry inserted {added}, updated {updated}")
+        else:
+            updated, added, seen = append_tokens_to_metadata(tokens, out_path)
+            print(
+                f"Network {network}: processed {seen} tokens; added {added}, updated existing decimals {updated}. Output: {out_path}"
+            )
+
+        popularity_path = chain_root / "popularity.json"
+        _write_json(popularity_path, build_popularity(volumes))
+        print(f"Network {network}: ranked {len(volumes)} tokens by 24h volume. Output: {popularity_path}")
+
+    if conn is not None:
+        conn.close()
 
     # Final array of all unique tickers processed across networks
     print(json.dumps(sorted(all_tickers)))
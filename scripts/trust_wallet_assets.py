@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Ingest token metadata from a local clone of github.com/trustwallet/assets.
+
+Walks blockchains/<slug>/assets/<address>/info.json for every supported chain
+and produces the same lowercased address -> {name, ticker, icon, decimals}
+records that trust_tokens._update_address_metadata writes. Chains are listed
+concurrently on a thread pool and the info.json files are parsed in batches
+on a process pool, so a full refresh of tens of thousands of asset dirs takes
+seconds.
+
+Usage:
+  python scripts/trust_wallet_assets.py /path/to/trustwallet/assets
+  python scripts/trust_wallet_assets.py /path/to/assets --records-out /tmp/trust
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from atomic_json import write_json_atomic
+from token_data_common import TOKEN_DATA_DIR
+from token_registry import open_registry, upsert_tokens
+from trust_tokens import TRUST_CHAINS, _merge_metadata_records
+
+TRUST_CDN = "https://assets-cdn.trustwallet.com/blockchains"
+
+
+def _list_asset_dirs(assets_dir: Path) -> List[str]:
+    """Return the names of all address sub-directories of assets_dir."""
+    try:
+        with os.scandir(assets_dir) as it:
+            return [e.name for e in it if e.is_dir(follow_symlinks=False) and e.name.startswith("0x")]
+    except FileNotFoundError:
+        return []
+
+
+def _parse_asset_batch(args: Tuple[str, str, List[str]]) -> List[Tuple[str, dict]]:
+    """
+    Process-pool worker: read info.json for each address dir in the batch.
+
+    Entries that are missing, malformed or not marked active are skipped.
+    """
+    assets_dir, slug, names = args
+    out: List[Tuple[str, dict]] = []
+    for name in names:
+        asset_dir = os.path.join(assets_dir, name)
+        try:
+            with open(os.path.join(asset_dir, "info.json"), "r", encoding="utf-8") as f:
+                info = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if not isinstance(info, dict) or info.get("status", "active") != "active":
+            continue
+
+        address = info.get("id") or name
+        has_logo = os.path.exists(os.path.join(asset_dir, "logo.png"))
+        decimals = info.get("decimals")
+        out.append((address.lower(), {
+            "name": info.get("name"),
+            "ticker": info.get("symbol"),
+            "icon": f"{TRUST_CDN}/{slug}/assets/{address}/logo.png" if has_logo else None,
+            "decimals": decimals if isinstance(decimals, int) else None,
+        }))
+    return out
+
+
+def ingest_assets(
+    checkout: Path,
+    chain_ids: List[int],
+    batch_size: int = 500,
+    workers: Optional[int] = None,
+) -> Dict[int, Dict[str, dict]]:
+    """
+    Returns chain id -> lowercased address -> {name, ticker, icon, decimals},
+    with addresses in sorted order.
+    """
+    assets_dirs = {cid: checkout / "blockchains" / TRUST_CHAINS[cid] / "assets" for cid in chain_ids}
+
+    with ThreadPoolExecutor(max_workers=max(1, len(chain_ids))) as pool:
+        listings = dict(zip(chain_ids, pool.map(_list_asset_dirs, assets_dirs.values())))
+
+    jobs: List[Tuple[int, Tuple[str, str, List[str]]]] = []
+    for cid, names in listings.items():
+        names.sort()
+        for i in range(0, len(names), batch_size):
+            jobs.append((cid, (str(assets_dirs[cid]), TRUST_CHAINS[cid], names[i:i + batch_size])))
+
+    results: Dict[int, Dict[str, dict]] = {cid: {} for cid in chain_ids}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for (cid, _), batch in zip(jobs, pool.map(_parse_asset_batch, [job for _, job in jobs])):
+            results[cid].update(batch)
+    return results
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Ingest token metadata from a local trustwallet/assets checkout.")
+    p.add_argument("checkout", type=Path, help="Path to the trustwallet/assets clone.")
+    p.add_argument("--chain", type=int, action="append", choices=sorted(TRUST_CHAINS),
+                   help="Chain ID to ingest (repeatable). Defaults to all supported chains.")
+    p.add_argument("--records-out", type=Path, default=None,
+                   help="Write <dir>/<chain>.json record maps instead of merging into tokenData.")
+    p.add_argument("--registry", type=Path, default=None,
+                   help="Upsert into this token registry database (source 'trustwallet') instead of rewriting tokenData.")
+    p.add_argument("--batch-size", type=int, default=500, help="info.json files parsed per worker task.")
+    p.add_argument("--workers", type=int, default=None, help="Process pool size (default: CPU count).")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    if not (args.checkout / "blockchains").is_dir():
+        print(f"Error: {args.checkout} does not look like a trustwallet/assets checkout.", file=sys.stderr)
+        sys.exit(1)
+
+    chain_ids = args.chain or sorted(TRUST_CHAINS)
+
+    started = time.perf_counter()
+    results = ingest_assets(args.checkout, chain_ids, batch_size=args.batch_size, workers=args.workers)
+    elapsed = time.perf_counter() - started
+
+    conn = open_registry(args.registry) if args.registry is not None else None
+    for cid, records in results.items():
+        if conn is not None:
+            inserted, updated = upsert_tokens(conn, cid, records, "trustwallet")
+            out_path = args.registry
+            print(f"Chain {cid}: registry inserted {inserted}, updated {updated}")
+        elif args.records_out is not None:
+            out_path = args.records_out / f"{cid}.json"
+            write_json_atomic(out_path, records, indent=2, sort_keys=True)
+        else:
+            out_path = TOKEN_DATA_DIR / str(cid) / "address_to_metadata.json"
+            _merge_metadata_records(records, out_path)
+        print(f"Chain {cid}: ingested {len(records)} active assets. Output: {out_path}")
+
+    if conn is not None:
+        conn.close()
+    print(f"Ingested {sum(len(r) for r in results.values())} assets in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
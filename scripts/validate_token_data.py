@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Validate the token data outputs for all chains before they ship.
+
+Every chain's address_to_metadata.json, names_to_address.json and
+tickers_to_address.json is loaded once into flat column lists (one entry per
+token or lookup key, tagged with its chain). The checks then run over whole
+columns with set operations and a single regex pass, instead of walking
+tokens one at a time. Checks:
+
+  - every file that exists parses as JSON (a broken file is reported here
+    and treated as empty by the other checks)
+  - address keys are "0x" + 40 lowercase hex chars
+  - no address key appears twice, including case-only duplicates that
+    json.load would silently collapse
+  - decimals are null or an integer in 0-36
+  - name and ticker are null or strings
+  - every names_to_address / tickers_to_address value is a known address
+
+Exits non-zero if any check fails, so it can gate every export
+(publish_token_data.py runs it before writing anything).
+
+Usage:
+  python scripts/validate_token_data.py [--chain 1] [--max-report 20]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from token_data_common import CHAIN_IDS, TOKEN_DATA_DIR, load_json
+
+LOOKUP_FILES = ("names_to_address.json", "tickers_to_address.json")
+
+_BAD_KEY_LINE_RE = re.compile(r"^(?!0x[0-9a-f]{40}$).*$", re.MULTILINE)
+_OBJECT_KEY_RE = re.compile(r'"((?:[^"\\]|\\.)*)"\s*:\s*\{')
+MAX_DECIMALS = 36
+_VALID_DECIMALS = frozenset(range(MAX_DECIMALS + 1))
+
+
+def _load_metadata(path: Path) -> Tuple[dict, List[str]]:
+    """
+    Load address_to_metadata.json, also returning its top-level keys as they
+    appear in the file. json.load keeps only the last of duplicated keys;
+    metadata values are the only objects in the file, so counting `": {`
+    tells whether any key was collapsed, and only then does a regex recover
+    the raw key list (both much faster than a per-object decoder hook).
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return {}, []
+    data = json.loads(text)
+    if not isinstance(data, dict):
+        return {}, []
+    if text.count('":{') + text.count('": {') == len(data):
+        return data, list(data)
+    return data, _OBJECT_KEY_RE.findall(text)
+
+
+def load_columns(root: Path, chain_ids) -> Dict[str, list]:
+    """All chains' tokens and lookup entries as parallel column lists."""
+    cols: Dict[str, list] = {k: [] for k in (
+        "chain", "key", "name", "ticker", "decimals",  # one row per metadata entry
+        "rawChain", "rawKey",  # one row per key as written in the file (duplicates included)
+        "lookupChain", "lookupFile", "lookupKey", "lookupAddress",  # one row per lookup entry
+        "parseErrors",  # one row per file that is not valid JSON
+    )}
+    for chain_id in chain_ids:
+        chain_dir = root / str(chain_id)
+        try:
+            metadata, raw_keys = _load_metadata(chain_dir / "address_to_metadata.json")
+        except json.JSONDecodeError as e:
+            cols["parseErrors"].append(f"chain {chain_id}: address_to_metadata.json is not valid JSON ({e})")
+            metadata, raw_keys = {}, []
+        metas = [m if isinstance(m, dict) else {} for m in metadata.values()]
+        cols["chain"].extend([chain_id] * len(metas))
+        cols["key"].extend(metadata.keys())
+        for field in ("name", "ticker", "decimals"):
+            cols[field].extend([m.get(field) for m in metas])
+        cols["rawChain"].extend([chain_id] * len(raw_keys))
+        cols["rawKey"].extend(raw_keys)
+
+        for filename in LOOKUP_FILES:
+            try:
+                lookup = load_json(chain_dir / filename, strict=True)
+            except json.JSONDecodeError as e:
+                cols["parseErrors"].append(f"chain {chain_id}: {filename} is not valid JSON ({e})")
+                lookup = {}
+            cols["lookupChain"].extend([chain_id] * len(lookup))
+            cols["lookupFile"].extend([filename] * len(lookup))
+            cols["lookupKey"].extend(lookup.keys())
+            cols["lookupAddress"].extend(v if isinstance(v, str) else repr(v) for v in lookup.values())
+    return cols
+
+
+def check_json_syntax(cols: Dict[str, list]) -> List[str]:
+    return list(cols["parseErrors"])
+
+
+def check_address_keys(cols: Dict[str, list]) -> List[str]:
+    # One regex pass over the joined column finds every line that is not an address
+    bad = set(_BAD_KEY_LINE_RE.findall("\n".join(cols["key"])))
+    if not bad:
+        return []
+    return [f"chain {c}: invalid address key {k!r}" for c, k in zip(cols["chain"], cols["key"]) if k in bad]
+
+
+def check_duplicate_keys(cols: Dict[str, list]) -> List[str]:
+    lowered = list(map(str.lower, cols["rawKey"]))
+    if len(set(lowered)) == len(lowered):
+        return []
+    counts = Counter(zip(cols["rawChain"], lowered))
+    dupes = sorted((ck, n) for ck, n in counts.items() if n > 1)
+    return [f"chain {c}: address {k} appears {n} times" for (c, k), n in dupes]
+
+
+def check_decimals(cols: Dict[str, list]) -> List[str]:
+    # bool is an int subclass, so compare exact types
+    return [
+        f"chain {c}: {k} has decimals {d!r} (expected null or 0-{MAX_DECIMALS})"
+        for c, k, d in zip(cols["chain"], cols["key"], cols["decimals"])
+        if d is not None and not (type(d) is int and d in _VALID_DECIMALS)
+    ]
+
+
+def check_field_types(cols: Dict[str, list]) -> List[str]:
+    errors = []
+    for field in ("name", "ticker"):
+        bad_types = {t for t in set(map(type, cols[field])) if t not in (str, type(None))}
+        if bad_types:
+            errors.extend(
+                f"chain {c}: {k} has non-string {field} {v!r}"
+                for c, k, v in zip(cols["chain"], cols["key"], cols[field]) if type(v) in bad_types
+            )
+    return errors
+
+
+def check_lookup_targets(cols: Dict[str, list]) -> List[str]:
+    known = set(zip(cols["chain"], cols["key"]))
+    targets = list(zip(cols["lookupChain"], cols["lookupAddress"]))
+    missing = set(targets) - known
+    if not missing:
+        return []
+    return [
+        f"chain {c}: {f} maps {k!r} to unknown address {a!r}"
+        for (c, a), f, k in zip(targets, cols["lookupFile"], cols["lookupKey"]) if (c, a) in missing
+    ]
+
+
+CHECKS = (
+    ("JSON syntax", check_json_syntax),
+    ("address keys", check_address_keys),
+    ("duplicate keys", check_duplicate_keys),
+    ("decimals", check_decimals),
+    ("name/ticker types", check_field_types),
+    ("lookup targets", check_lookup_targets),
+)
+
+
+def validate(root: Path, chain_ids) -> Dict[str, List[str]]:
+    """Run every check; returns check name -> error messages (empty lists when clean)."""
+    cols = load_columns(root, chain_ids)
+    return {name: check(cols) for name, check in CHECKS}
+
+
+def report(results: Dict[str, List[str]], max_report: int = 20) -> int:
+    """Print failures to stderr; returns the total error count."""
+    total = 0
+    for name, errors in results.items():
+        total += len(errors)
+        if errors:
+            print(f"FAIL {name}: {len(errors)} error(s)", file=sys.stderr)
+            for err in errors[:max_report]:
+                print(f"  {err}", file=sys.stderr)
+            if len(errors) > max_report:
+                print(f"  ... and {len(errors) - max_report} more", file=sys.stderr)
+    return total
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Check token data outputs for broken keys, decimals and lookups.")
+    p.add_argument("--chain", type=int, action="append", help="Chain ID (repeatable). Defaults to all chains.")
+    p.add_argument("--root", type=Path, default=TOKEN_DATA_DIR, help="tokenData root containing <chain>/ dirs.")
+    p.add_argument("--max-report", type=int, default=20, help="Errors printed per check.")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    start = time.perf_counter()
+    results = validate(args.root, args.chain or CHAIN_IDS)
+    elapsed = time.perf_counter() - start
+    total = report(results, args.max_report)
+    if total:
+        print(f"{total} error(s) in {elapsed:.3f}s", file=sys.stderr)
+        sys.exit(1)
+    print(f"All {len(CHECKS)} checks passed in {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()